@@ -1,571 +1,920 @@
-import pygame
-import math
-import random
-import time
-from enum import Enum
-from typing import List, Optional
-
-# Initialize Pygame
-pygame.init()
-
-# Constants
-WINDOW_WIDTH = 1000
-WINDOW_HEIGHT = 700
-ARENA_WIDTH = 800
-ARENA_HEIGHT = 600
-FPS = 60
-
-# Colors
-BLACK = (0, 0, 0)
-WHITE = (255, 255, 255)
-RED = (255, 107, 107)
-BLUE = (78, 205, 196)
-GREEN = (69, 183, 209)
-YELLOW = (249, 202, 36)
-PURPLE = (108, 92, 231)
-ORANGE = (238, 90, 36)
-GRAY = (128, 128, 128)
-DARK_BLUE = (26, 26, 46)
-
-class BotType(Enum):
-    AGGRESSIVE = "aggressive"
-    DEFENSIVE = "defensive"
-    SNEAKY = "sneaky"
-    BERSERKER = "berserker"
-
-class Bot:
-    """Main Bot class demonstrating OOP principles"""
-    
-    def __init__(self, x: float, y: float, color: tuple, name: str, bot_type: BotType):
-        # Position and movement
-        self.x = x
-        self.y = y
-        self.vx = 0.0
-        self.vy = 0.0
-        self.direction = random.uniform(0, 2 * math.pi)
-        
-        # Visual properties
-        self.color = color
-        self.name = name
-        self.bot_type = bot_type
-        self.size = 20
-        
-        # Combat stats
-        self.health = 100
-        self.max_health = 100
-        self.damage = 15
-        self.speed = 2.0
-        self.range = 150
-        self.fire_rate = 60  # frames between shots
-        self.last_shot = 0
-        
-        # AI state
-        self.target: Optional['Bot'] = None
-        self.last_target_update = 0
-        self.turn_speed = 0.1
-        
-        # Customize stats based on type
-        self._customize_stats()
-    
-    def _customize_stats(self):
-        """Customize bot stats based on type"""
-        if self.bot_type == BotType.BERSERKER:
-            self.speed = 3.0
-            self.damage = 25
-            self.max_health = 60
-            self.health = 60
-        elif self.bot_type == BotType.DEFENSIVE:
-            self.health = 120
-            self.max_health = 120
-            self.speed = 1.5
-        elif self.bot_type == BotType.SNEAKY:
-            self.speed = 2.5
-            self.fire_rate = 45
-    
-    def update(self, bots: List['Bot']):
-        """Main AI update loop"""
-        if self.health <= 0:
-            return
-        
-        self.last_shot += 1
-        self.last_target_update += 1
-        
-        # Find target every 30 frames
-        if self.last_target_update > 30:
-            self._find_target(bots)
-            self.last_target_update = 0
-        
-        # Execute behavior based on type
-        if self.bot_type == BotType.AGGRESSIVE:
-            self._aggressive_behavior()
-        elif self.bot_type == BotType.DEFENSIVE:
-            self._defensive_behavior()
-        elif self.bot_type == BotType.SNEAKY:
-            self._sneaky_behavior()
-        elif self.bot_type == BotType.BERSERKER:
-            self._berserker_behavior()
-        
-        self._move()
-        self._constrain_to_bounds()
-    
-    def _find_target(self, bots: List['Bot']):
-        """AI target selection logic"""
-        closest = None
-        closest_dist = float('inf')
-        
-        for bot in bots:
-            if bot == self or bot.health <= 0:
-                continue
-            
-            dist = self._distance_to(bot)
-            if dist < closest_dist:
-                closest = bot
-                closest_dist = dist
-        
-        self.target = closest
-    
-    def _aggressive_behavior(self):
-        """Aggressive AI - direct pursuit and attack"""
-        if self.target:
-            angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
-            self.direction = angle
-            
-            if self._distance_to(self.target) < self.range:
-                return self._shoot()
-        return None
-    
-    def _defensive_behavior(self):
-        """Defensive AI - maintain distance, strategic retreat"""
-        if self.target:
-            dist = self._distance_to(self.target)
-            angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
-            
-            if dist < 100:
-                # Retreat
-                self.direction = angle + math.pi
-            elif dist < self.range:
-                # Shoot while maintaining distance
-                projectile = self._shoot()
-                self.direction += random.uniform(-0.2, 0.2)
-                return projectile
-        return None
-    
-    def _sneaky_behavior(self):
-        """Sneaky AI - circle targets, careful approach"""
-        if self.target:
-            dist = self._distance_to(self.target)
-            
-            if self.range > dist > 80:
-                # Circle around target
-                angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
-                self.direction = angle + math.pi/2
-                return self._shoot()
-            else:
-                # Approach carefully
-                angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
-                self.direction = angle
-                self.speed = 1.0  # Move slower when approaching
-        return None
-    
-    def _berserker_behavior(self):
-        """Berserker AI - high damage, fast movement, direct assault"""
-        if self.target:
-            angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
-            self.direction = angle
-            
-            if self._distance_to(self.target) < self.range:
-                return self._shoot()
-        return None
-    
-    def _shoot(self) -> Optional['Projectile']:
-        """Create a projectile if ready to shoot"""
-        if self.last_shot < self.fire_rate or not self.target:
-            return None
-        
-        angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
-        self.last_shot = 0
-        return Projectile(self.x, self.y, angle, self.damage, self)
-    
-    def _move(self):
-        """Update position based on direction and speed"""
-        self.vx = math.cos(self.direction) * self.speed
-        self.vy = math.sin(self.direction) * self.speed
-        
-        self.x += self.vx
-        self.y += self.vy
-    
-    def _constrain_to_bounds(self):
-        """Keep bot within arena bounds"""
-        self.x = max(self.size, min(ARENA_WIDTH - self.size, self.x))
-        self.y = max(self.size, min(ARENA_HEIGHT - self.size, self.y))
-    
-    def take_damage(self, damage: int, attacker: 'Projectile'):
-        """Handle taking damage from projectiles"""
-        self.health -= damage
-        if self.health <= 0:
-            self.health = 0
-            return f"{self.name} destroyed by {attacker.owner.name}!"
-        return f"{self.name} takes {damage} damage!"
-    
-    def _distance_to(self, other: 'Bot') -> float:
-        """Calculate distance to another bot"""
-        return math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
-    
-    def draw(self, screen: pygame.Surface):
-        """Render the bot on screen"""
-        if self.health <= 0:
-            return
-        
-        # Draw bot body
-        bot_rect = pygame.Rect(self.x - self.size//2, self.y - self.size//2, self.size, self.size)
-        pygame.draw.rect(screen, self.color, bot_rect)
-        
-        # Draw direction indicator
-        end_x = self.x + math.cos(self.direction) * (self.size//2 + 5)
-        end_y = self.y + math.sin(self.direction) * (self.size//2 + 5)
-        pygame.draw.line(screen, WHITE, (self.x, self.y), (end_x, end_y), 3)
-        
-        # Draw health bar
-        bar_width = self.size * 1.5
-        bar_height = 4
-        health_percent = self.health / self.max_health
-        
-        # Background bar
-        bar_rect = pygame.Rect(self.x - bar_width//2, self.y - self.size - 10, bar_width, bar_height)
-        pygame.draw.rect(screen, RED, bar_rect)
-        
-        # Health bar
-        health_rect = pygame.Rect(self.x - bar_width//2, self.y - self.size - 10, 
-                                bar_width * health_percent, bar_height)
-        pygame.draw.rect(screen, GREEN, health_rect)
-        
-        # Draw name
-        font = pygame.font.Font(None, 24)
-        text = font.render(self.name, True, WHITE)
-        text_rect = text.get_rect(center=(self.x, self.y + self.size + 15))
-        screen.blit(text, text_rect)
-
-class Projectile:
-    """Projectile class for bot weapons"""
-    
-    def __init__(self, x: float, y: float, angle: float, damage: int, owner: Bot):
-        self.x = x
-        self.y = y
-        self.vx = math.cos(angle) * 5
-        self.vy = math.sin(angle) * 5
-        self.damage = damage
-        self.owner = owner
-        self.life = 120  # frames
-        self.size = 3
-    
-    def update(self, bots: List[Bot]) -> tuple[bool, Optional[str]]:
-        """Update projectile position and check collisions"""
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= 1
-        
-        # Check collision with bots
-        for bot in bots:
-            if bot == self.owner or bot.health <= 0:
-                continue
-            
-            dist = math.sqrt((self.x - bot.x)**2 + (self.y - bot.y)**2)
-            if dist < bot.size:
-                message = bot.take_damage(self.damage, self)
-                return False, message  # Projectile destroyed
-        
-        # Check bounds
-        if (self.x < 0 or self.x > ARENA_WIDTH or 
-            self.y < 0 or self.y > ARENA_HEIGHT or 
-            self.life <= 0):
-            return False, None
-        
-        return True, None
-    
-    def draw(self, screen: pygame.Surface):
-        """Render projectile"""
-        pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), self.size)
-
-class GameArena:
-    """Main game class managing the arena"""
-    
-    def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("AI Bot Arena - Python Version")
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        
-        # Game state
-        self.running = True
-        self.game_active = False
-        self.bots: List[Bot] = []
-        self.projectiles: List[Projectile] = []
-        self.messages: List[tuple[str, float]] = []
-        self.winner: Optional[Bot] = None
-        
-        self._initialize_bots()
-    
-    def _initialize_bots(self):
-        """Create initial bots with different types"""
-        bot_configs = [
-            (100, 100, RED, "Aggressor", BotType.AGGRESSIVE),
-            (700, 100, BLUE, "Guardian", BotType.DEFENSIVE),
-            (100, 500, GREEN, "Shadow", BotType.SNEAKY),
-            (700, 500, YELLOW, "Berserker", BotType.BERSERKER),
-            (400, 300, PURPLE, "Hunter", BotType.AGGRESSIVE)
-        ]
-        
-        self.bots = [Bot(x, y, color, name, bot_type) 
-                    for x, y, color, name, bot_type in bot_configs]
-        
-        self._add_message("Arena initialized with 5 bots!")
-    
-    def _add_message(self, text: str):
-        """Add a message to the game log"""
-        self.messages.append((text, time.time()))
-        # Keep only last 10 messages
-        if len(self.messages) > 10:
-            self.messages.pop(0)
-        print(f"[ARENA] {text}")
-    
-    def update(self):
-        """Main game update loop"""
-        if not self.game_active or self.winner:
-            return
-        
-        # Update bots
-        for bot in self.bots:
-            bot.update(self.bots)
-        
-        # Update projectiles
-        new_projectiles = []
-        for projectile in self.projectiles:
-            alive, message = projectile.update(self.bots)
-            if alive:
-                new_projectiles.append(projectile)
-            elif message:
-                self._add_message(message)
-        
-        # Add new projectiles from bots
-        for bot in self.bots:
-            if bot.health > 0:
-                new_proj = None
-                if bot.bot_type == BotType.AGGRESSIVE:
-                    new_proj = bot._aggressive_behavior()
-                elif bot.bot_type == BotType.DEFENSIVE:
-                    new_proj = bot._defensive_behavior()
-                elif bot.bot_type == BotType.SNEAKY:
-                    new_proj = bot._sneaky_behavior()
-                elif bot.bot_type == BotType.BERSERKER:
-                    new_proj = bot._berserker_behavior()
-                
-                if new_proj:
-                    new_projectiles.append(new_proj)
-                    self._add_message(f"{bot.name} fires at {bot.target.name}!")
-        
-        self.projectiles = new_projectiles
-        
-        # Check for winner
-        alive_bots = [bot for bot in self.bots if bot.health > 0]
-        if len(alive_bots) <= 1:
-            self.game_active = False
-            if len(alive_bots) == 1:
-                self.winner = alive_bots[0]
-                self._add_message(f"🏆 {self.winner.name} wins the battle!")
-            else:
-                self._add_message("💥 Battle ended in a draw!")
-    
-    def draw(self):
-        """Render everything on screen"""
-        self.screen.fill(BLACK)
-        
-        # Draw arena background
-        arena_rect = pygame.Rect(0, 0, ARENA_WIDTH, ARENA_HEIGHT)
-        pygame.draw.rect(self.screen, DARK_BLUE, arena_rect)
-        
-        # Draw grid
-        for i in range(0, ARENA_WIDTH, 50):
-            pygame.draw.line(self.screen, GRAY, (i, 0), (i, ARENA_HEIGHT), 1)
-        for i in range(0, ARENA_HEIGHT, 50):
-            pygame.draw.line(self.screen, GRAY, (0, i), (ARENA_WIDTH, i), 1)
-        
-        # Draw arena border
-        pygame.draw.rect(self.screen, WHITE, arena_rect, 3)
-        
-        # Draw bots
-        for bot in self.bots:
-            bot.draw(self.screen)
-        
-        # Draw projectiles
-        for projectile in self.projectiles:
-            projectile.draw(self.screen)
-        
-        # Draw UI
-        self._draw_ui()
-        
-        pygame.display.flip()
-    
-    def _draw_ui(self):
-        """Draw user interface elements"""
-        ui_x = ARENA_WIDTH + 20
-        
-        # Title
-        title = self.font.render("🤖 AI Bot Arena", True, WHITE)
-        self.screen.blit(title, (ui_x, 20))
-        
-        # Controls
-        y_offset = 70
-        controls = [
-            "SPACE - Start/Pause",
-            "R - Reset Arena",
-            "A - Add Random Bot",
-            "ESC - Quit"
-        ]
-        
-        for control in controls:
-            text = self.small_font.render(control, True, WHITE)
-            self.screen.blit(text, (ui_x, y_offset))
-            y_offset += 25
-        
-        # Bot stats
-        y_offset += 20
-        stats_title = self.font.render("Bot Stats:", True, WHITE)
-        self.screen.blit(stats_title, (ui_x, y_offset))
-        y_offset += 40
-        
-        for bot in self.bots:
-            # Bot name and type
-            bot_text = f"{bot.name} ({bot.bot_type.value})"
-            text = self.small_font.render(bot_text, True, bot.color)
-            self.screen.blit(text, (ui_x, y_offset))
-            y_offset += 20
-            
-            # Health bar
-            health_text = f"Health: {bot.health}/{bot.max_health}"
-            text = self.small_font.render(health_text, True, WHITE)
-            self.screen.blit(text, (ui_x, y_offset))
-            
-            # Visual health bar
-            bar_width = 100
-            bar_height = 10
-            health_percent = bot.health / bot.max_health
-            
-            bar_rect = pygame.Rect(ui_x + 120, y_offset + 5, bar_width, bar_height)
-            pygame.draw.rect(self.screen, RED, bar_rect)
-            
-            health_rect = pygame.Rect(ui_x + 120, y_offset + 5, 
-                                    bar_width * health_percent, bar_height)
-            pygame.draw.rect(self.screen, GREEN, health_rect)
-            
-            y_offset += 35
-        
-        # Messages
-        if self.messages:
-            y_offset += 20
-            msg_title = self.font.render("Battle Log:", True, WHITE)
-            self.screen.blit(msg_title, (ui_x, y_offset))
-            y_offset += 30
-            
-            # Show last 5 messages
-            for message, timestamp in self.messages[-5:]:
-                text = self.small_font.render(message[:30], True, WHITE)
-                self.screen.blit(text, (ui_x, y_offset))
-                y_offset += 20
-        
-        # Winner announcement
-        if self.winner:
-            winner_text = f"🏆 {self.winner.name} WINS! 🏆"
-            text = self.font.render(winner_text, True, YELLOW)
-            text_rect = text.get_rect(center=(ARENA_WIDTH//2, ARENA_HEIGHT//2))
-            
-            # Background
-            bg_rect = text_rect.inflate(40, 20)
-            pygame.draw.rect(self.screen, BLACK, bg_rect)
-            pygame.draw.rect(self.screen, YELLOW, bg_rect, 3)
-            
-            self.screen.blit(text, text_rect)
-        elif not self.game_active and not any(bot.health > 0 for bot in self.bots):
-            draw_text = "💥 DRAW! 💥"
-            text = self.font.render(draw_text, True, RED)
-            text_rect = text.get_rect(center=(ARENA_WIDTH//2, ARENA_HEIGHT//2))
-            
-            # Background
-            bg_rect = text_rect.inflate(40, 20)
-            pygame.draw.rect(self.screen, BLACK, bg_rect)
-            pygame.draw.rect(self.screen, RED, bg_rect, 3)
-            
-            self.screen.blit(text, text_rect)
-    
-    def handle_events(self):
-        """Handle user input"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    self.game_active = not self.game_active
-                    if self.game_active:
-                        self._add_message("Battle started!")
-                    else:
-                        self._add_message("Battle paused!")
-                
-                elif event.key == pygame.K_r:
-                    self._reset_arena()
-                
-                elif event.key == pygame.K_a:
-                    self._add_random_bot()
-                
-                elif event.key == pygame.K_ESCAPE:
-                    self.running = False
-    
-    def _reset_arena(self):
-        """Reset the arena to initial state"""
-        self.game_active = False
-        self.winner = None
-        self.projectiles.clear()
-        self.messages.clear()
-        self._initialize_bots()
-    
-    def _add_random_bot(self):
-        """Add a random bot to the arena"""
-        bot_types = list(BotType)
-        colors = [RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE]
-        
-        x = random.randint(50, ARENA_WIDTH - 50)
-        y = random.randint(50, ARENA_HEIGHT - 50)
-        bot_type = random.choice(bot_types)
-        color = random.choice(colors)
-        name = f"Bot-{random.randint(100, 999)}"
-        
-        new_bot = Bot(x, y, color, name, bot_type)
-        self.bots.append(new_bot)
-        self._add_message(f"New bot {name} ({bot_type.value}) joined!")
-    
-    def run(self):
-        """Main game loop"""
-        print("🤖 AI Bot Arena - Python Version")
-        print("Controls:")
-        print("  SPACE - Start/Pause battle")
-        print("  R - Reset arena")
-        print("  A - Add random bot")
-        print("  ESC - Quit")
-        print("\nPress SPACE to start the battle!")
-        
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
-        
-        pygame.quit()
-
-if __name__ == "__main__":
-    # Check if pygame is available
-    try:
-        game = GameArena()
-        game.run()
-    except Exception as e:
-        print(f"Error running the game: {e}")
-        print("Make sure you have pygame installed: pip install pygame")
\ No newline at end of file
+import math
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field, fields, replace
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from battle_log import EventLog, LogLevel
+from profiler import TickProfiler
+from scheduler import RetargetScheduler
+from spatial import SpatialGrid
+
+# Constants
+WINDOW_WIDTH = 1000
+WINDOW_HEIGHT = 700
+# Default world size, and the size of the on-screen view of larger worlds
+ARENA_WIDTH = 800
+ARENA_HEIGHT = 600
+FPS = 60
+
+# Fixed-timestep simulation: one tick is always 1/60 s of game time,
+# however fast frames are rendered
+SIM_DT = 1.0 / FPS
+SPEEDS = (1, 4, 16, 0)  # sim ticks per rendered tick; 0 = uncapped
+MAX_FRAME_TIME = 0.25   # longest frame fed into the accumulator
+MAX_FRAME_SKIP = 5      # frames that may go undrawn while catching up
+
+PROJECTILE_SPEED = 5    # pixels per tick
+PROJECTILE_LIFE = 120   # ticks
+PROJECTILE_SIZE = 3     # drawn radius; hits are tested against the bot's circle only
+# How far a shot's path strays from the middle of its step (with slack for rounding)
+PROJECTILE_REACH = PROJECTILE_SPEED / 2 + 1
+
+# Colors
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 107, 107)
+BLUE = (78, 205, 196)
+GREEN = (69, 183, 209)
+YELLOW = (249, 202, 36)
+PURPLE = (108, 92, 231)
+ORANGE = (238, 90, 36)
+GRAY = (128, 128, 128)
+DARK_BLUE = (26, 26, 46)
+
+class BotType(Enum):
+    AGGRESSIVE = "aggressive"
+    DEFENSIVE = "defensive"
+    SNEAKY = "sneaky"
+    BERSERKER = "berserker"
+    
+    @property
+    def profile(self) -> 'BotProfile':
+        return BOT_PROFILES[self]
+
+@dataclass(frozen=True)
+class BotProfile:
+    """Stats every bot of a type shares; never changes once built"""
+    max_health: int = 100
+    damage: int = 15
+    speed: float = 2.0  # starting speed; behaviors change the bot's own speed
+    range: float = 150
+    fire_rate: int = 60  # frames between shots
+    size: int = 20
+    turn_speed: float = 0.1
+    lead: bool = True  # aim where the target will be, not where it is
+    retreat_distance: float = 100  # defensive bots back away from targets closer than this
+    circle_radius: float = 80  # sneaky bots circle targets in range and farther than this
+    
+    def derive(self, stat: str, value) -> 'BotProfile':
+        """This profile with one stat changed; equal changes share one profile"""
+        # 15 == 15.0 and True == 1, so the key carries the types too, or a cached
+        # profile could come back holding the other one
+        types = tuple(type(getattr(self, item.name)) for item in fields(self))
+        return _derive_profile(self, types, stat, value)
+
+@lru_cache(maxsize=1024, typed=True)
+def _derive_profile(profile: BotProfile, types: tuple, stat: str, value) -> BotProfile:
+    return replace(profile, **{stat: value})
+
+BOT_PROFILES: Dict[BotType, BotProfile] = {
+    BotType.AGGRESSIVE: BotProfile(),
+    BotType.DEFENSIVE: BotProfile(max_health=120, speed=1.5),
+    BotType.SNEAKY: BotProfile(speed=2.5, fire_rate=45),
+    BotType.BERSERKER: BotProfile(max_health=60, damage=25, speed=3.0),
+}
+
+def _profile_stat(stat: str) -> property:
+    """A Bot attribute read from its profile; assigning one gives the bot a derived profile"""
+    def assign(bot: 'Bot', value):
+        bot.profile = bot.profile.derive(stat, value)
+    return property(attrgetter(f"profile.{stat}"), assign, doc=f"``{stat}`` from the bot's profile")
+
+class InputEvent(Enum):
+    """Player inputs that change the simulation (recorded in replays)"""
+    TOGGLE_PAUSE = 1
+    RESET = 2
+    ADD_BOT = 3
+
+# Default line-up: (x, y, color, name, bot_type); scenario configs append (team, stats)
+DEFAULT_BOT_CONFIGS = [
+    (100, 100, RED, "Aggressor", BotType.AGGRESSIVE),
+    (700, 100, BLUE, "Guardian", BotType.DEFENSIVE),
+    (100, 500, GREEN, "Shadow", BotType.SNEAKY),
+    (700, 500, YELLOW, "Berserker", BotType.BERSERKER),
+    (400, 300, PURPLE, "Hunter", BotType.AGGRESSIVE)
+]
+
+def random_bot_config(rng=random, width: int = ARENA_WIDTH, height: int = ARENA_HEIGHT) -> tuple:
+    """Random (x, y, color, name, bot_type) config, as used by the A key"""
+    bot_types = list(BotType)
+    colors = [RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE]
+    
+    x = rng.randint(50, width - 50)
+    y = rng.randint(50, height - 50)
+    bot_type = rng.choice(bot_types)
+    color = rng.choice(colors)
+    name = f"Bot-{rng.randint(100, 999)}"
+    return (x, y, color, name, bot_type)
+
+class Bot:
+    """Main Bot class demonstrating OOP principles.
+    
+    Per-type constants live in a shared BotProfile; instances hold only the
+    state that changes, in slots. Assigning a profile stat (scenario stats,
+    benchmarks) moves that one bot onto a derived profile.
+    """
+    
+    __slots__ = ("x", "y", "prev_x", "prev_y", "vx", "vy", "rng", "pool", "direction",
+                 "color", "name", "bot_type", "team", "bounds", "profile", "health", "speed",
+                 "last_shot", "target", "damage_dealt")
+    
+    # Hot paths read ``bot.profile.<stat>``: as cheap as a slot, where these cost a call
+    max_health = _profile_stat("max_health")
+    damage = _profile_stat("damage")
+    range = _profile_stat("range")
+    fire_rate = _profile_stat("fire_rate")
+    size = _profile_stat("size")
+    turn_speed = _profile_stat("turn_speed")
+    lead = _profile_stat("lead")
+    retreat_distance = _profile_stat("retreat_distance")
+    circle_radius = _profile_stat("circle_radius")
+    
+    def __init__(self, x: float, y: float, color: tuple, name: str, bot_type: BotType,
+                 rng: random.Random = random, pool: Optional['ProjectilePool'] = None,
+                 team: Optional[str] = None, stats: Optional[dict] = None,
+                 bounds: Tuple[int, int] = (ARENA_WIDTH, ARENA_HEIGHT)):
+        # Position and movement
+        self.x = x
+        self.y = y
+        self.prev_x = x  # position at the start of the tick, for interpolation
+        self.prev_y = y
+        self.vx = 0.0
+        self.vy = 0.0
+        self.rng = rng
+        self.pool = pool  # where shots come from; plain allocation when None
+        self.direction = rng.uniform(0, 2 * math.pi)
+        
+        # Visual properties
+        self.color = color
+        self.name = name
+        self.bot_type = bot_type
+        self.team = team  # teammates never target or hit each other; None fights everyone
+        self.bounds = bounds
+        
+        # Combat stats: constants come from the type's profile
+        self.profile = bot_type.profile
+        self.health = self.profile.max_health
+        self.speed = self.profile.speed
+        self.last_shot = 0
+        
+        # AI state
+        self.target: Optional['Bot'] = None
+        
+        # Match statistics
+        self.damage_dealt = 0
+        
+        # Scenario overrides
+        if stats:
+            for stat, value in stats.items():
+                setattr(self, stat, value)
+            if "max_health" in stats and "health" not in stats:
+                self.health = self.max_health
+    
+    def decide(self) -> Optional['Intent']:
+        """Pick this tick's heading, speed and shot; None keeps the current course.
+
+        A target that has died is ignored: under an AI budget its chasers may
+        wait a tick or more for their re-target, and shouldn't chase a corpse.
+        """
+        target = self.target
+        if self.health <= 0 or target is None or target.health <= 0:
+            return None
+        return BEHAVIORS[self.bot_type](self)
+    
+    def apply(self, intent: Optional['Intent']) -> Optional['Projectile']:
+        """Carry out an intent: fire if ready, then move. Returns the shot, if any"""
+        if self.health <= 0:
+            return None
+        
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.last_shot += 1
+        
+        shot = None
+        if intent is not None:
+            self.direction = intent.direction
+            self.speed = intent.speed
+            if intent.aim is not None:
+                shot = self._shoot(intent.aim)
+        
+        self._move()
+        self._constrain_to_bounds()
+        return shot
+    
+    def _find_target(self, bots: List['Bot'], grid: Optional[SpatialGrid] = None):
+        """AI target selection logic"""
+        if grid is not None:
+            self.target = grid.nearest(self)
+            return
+        
+        closest = None
+        closest_dist = float('inf')
+        
+        team = self.team
+        for bot in bots:
+            if bot == self or bot.health <= 0 or (team is not None and bot.team == team):
+                continue
+            
+            dist = self._distance_to(bot)
+            if dist < closest_dist:
+                closest = bot
+                closest_dist = dist
+        
+        self.target = closest
+    
+    def _aim(self, angle: float) -> float:
+        """Angle to fire at the target, which is at ``angle`` from here.
+        
+        With a leading profile, that is where a shot meets the target if it
+        keeps its current velocity. Shots leave from here and move from the
+        next tick on, by which time the target has taken one more step.
+        """
+        profile = self.profile
+        if not profile.lead or self.last_shot + 1 < profile.fire_rate:
+            return angle  # no shot this tick (apply counts the tick before firing)
+        target = self.target
+        vx, vy = target.vx, target.vy
+        a = vx * vx + vy * vy - PROJECTILE_SPEED * PROJECTILE_SPEED
+        if a >= 0:
+            return angle  # can't lead a target as fast as the shots
+        dx = target.x + vx - self.x
+        dy = target.y + vy - self.y
+        b = dx * vx + dy * vy
+        ticks = (-b - math.sqrt(b * b - a * (dx * dx + dy * dy))) / a
+        return math.atan2(dy + vy * ticks, dx + vx * ticks)
+    
+    def _aggressive_behavior(self) -> 'Intent':
+        """Aggressive AI - direct pursuit and attack"""
+        angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
+        aim = self._aim(angle) if self._distance_to(self.target) < self.profile.range else None
+        return Intent(angle, self.speed, aim)
+    
+    def _defensive_behavior(self) -> 'Intent':
+        """Defensive AI - maintain distance, strategic retreat"""
+        dist = self._distance_to(self.target)
+        angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
+        
+        if dist < self.profile.retreat_distance:
+            # Retreat
+            return Intent(angle + math.pi, self.speed, None)
+        if dist < self.profile.range:
+            # Shoot while maintaining distance
+            return Intent(self.direction + self.rng.uniform(-0.2, 0.2), self.speed, self._aim(angle))
+        return Intent(self.direction, self.speed, None)
+    
+    def _sneaky_behavior(self) -> 'Intent':
+        """Sneaky AI - circle targets, careful approach"""
+        dist = self._distance_to(self.target)
+        angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
+        
+        profile = self.profile
+        if profile.range > dist > profile.circle_radius:
+            # Circle around target
+            return Intent(angle + math.pi/2, self.speed, self._aim(angle))
+        # Approach carefully, moving slower from now on
+        return Intent(angle, 1.0, None)
+    
+    def _berserker_behavior(self) -> 'Intent':
+        """Berserker AI - high damage, fast movement, direct assault"""
+        angle = math.atan2(self.target.y - self.y, self.target.x - self.x)
+        aim = self._aim(angle) if self._distance_to(self.target) < self.profile.range else None
+        return Intent(angle, self.speed, aim)
+    
+    def _shoot(self, angle: float) -> Optional['Projectile']:
+        """Create a projectile if ready to shoot"""
+        if self.last_shot < self.profile.fire_rate:
+            return None
+        
+        self.last_shot = 0
+        if self.pool is not None:
+            return self.pool.acquire(self.x, self.y, angle, self)
+        return Projectile(self.x, self.y, angle, self)
+    
+    def _move(self):
+        """Update position based on direction and speed"""
+        self.vx = math.cos(self.direction) * self.speed
+        self.vy = math.sin(self.direction) * self.speed
+        
+        self.x += self.vx
+        self.y += self.vy
+    
+    def _constrain_to_bounds(self):
+        """Keep bot within arena bounds"""
+        width, height = self.bounds
+        size = self.profile.size
+        self.x = max(size, min(width - size, self.x))
+        self.y = max(size, min(height - size, self.y))
+    
+    def take_damage(self, damage: int, attacker: 'Projectile'):
+        """Handle taking damage from projectiles"""
+        attacker.owner.damage_dealt += min(damage, self.health)
+        self.health -= damage
+        if self.health <= 0:
+            self.health = 0
+            return f"{self.name} destroyed by {attacker.owner.name}!"
+        return f"{self.name} takes {damage} damage!"
+    
+    def _distance_to(self, other: 'Bot') -> float:
+        """Calculate distance to another bot"""
+        return math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
+    
+class Intent(NamedTuple):
+    """What a bot wants to do this tick"""
+    direction: float
+    speed: float
+    aim: Optional[float]  # angle to fire at, None to hold fire
+
+# Strategy table: one behavior per bot type
+BEHAVIORS: Dict[BotType, Callable[[Bot], Intent]] = {
+    BotType.AGGRESSIVE: Bot._aggressive_behavior,
+    BotType.DEFENSIVE: Bot._defensive_behavior,
+    BotType.SNEAKY: Bot._sneaky_behavior,
+    BotType.BERSERKER: Bot._berserker_behavior,
+}
+
+class Projectile:
+    """Projectile class for bot weapons"""
+    
+    __slots__ = ("x", "y", "prev_x", "prev_y", "vx", "vy", "owner", "life")
+    
+    size = PROJECTILE_SIZE  # every shot is the same size
+    
+    def __init__(self, x: float, y: float, angle: float, owner: Bot):
+        self.reset(x, y, angle, owner)
+    
+    def reset(self, x: float, y: float, angle: float, owner: Bot):
+        """(Re)initialize in place, so pooled instances can be reused"""
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.vx = math.cos(angle) * PROJECTILE_SPEED
+        self.vy = math.sin(angle) * PROJECTILE_SPEED
+        self.owner = owner
+        self.life = PROJECTILE_LIFE
+    
+    @property
+    def damage(self) -> int:
+        """Shots hit as hard as their owner's profile says"""
+        return self.owner.profile.damage
+    
+    def update(self, bots: List[Bot], grid: Optional[SpatialGrid] = None,
+               bounds: Tuple[int, int] = (ARENA_WIDTH, ARENA_HEIGHT),
+               swept: bool = True) -> Tuple[bool, Optional[str]]:
+        """Move, then hit the first enemy bot the step passed through.
+        
+        The swept test checks the whole step from the last position against
+        each bot's circle, so a shot can't skip over a bot between two ticks;
+        the bot hit is the one the shot enters first (lowest index on ties).
+        With ``swept`` off only the end point is tested.
+        """
+        x0 = self.prev_x = self.x
+        y0 = self.prev_y = self.y
+        dx, dy = self.vx, self.vy
+        self.x += dx
+        self.y += dy
+        self.life -= 1
+        
+        # Only bots in nearby cells can be hit
+        if grid is not None:
+            if swept:
+                bots = grid.query(x0 + dx * 0.5, y0 + dy * 0.5, grid.max_size + PROJECTILE_REACH)
+            else:
+                bots = grid.query(self.x, self.y, grid.max_size)
+        
+        # Check collision with bots (no friendly fire)
+        owner = self.owner
+        team = owner.team
+        step = dx * dx + dy * dy
+        hit = None
+        first = 1.0  # fraction of the step at which the earliest hit so far happens
+        for bot in bots:
+            if bot == owner or bot.health <= 0 or (team is not None and bot.team == team):
+                continue
+            radius = bot.profile.size
+            
+            if not swept:
+                if math.sqrt((self.x - bot.x)**2 + (self.y - bot.y)**2) < radius:
+                    hit = bot
+                    break
+                continue
+            
+            # Solve |start + t * step - center| = radius for the entry t
+            fx = x0 - bot.x
+            fy = y0 - bot.y
+            c = fx * fx + fy * fy - radius * radius
+            if c < 0:
+                entry = 0.0  # already inside at the start of the step
+            else:
+                b = fx * dx + fy * dy
+                if b >= 0 or radius <= 0:
+                    continue  # moving away, or nothing to hit
+                disc = b * b - step * c
+                if disc <= 0:
+                    continue  # passes by
+                entry = (-b - math.sqrt(disc)) / step
+            if entry < first:
+                hit = bot
+                first = entry
+        
+        if hit is not None:
+            return False, hit.take_damage(self.damage, self)  # Projectile destroyed
+        
+        # Check bounds
+        if (self.x < 0 or self.x > bounds[0] or 
+            self.y < 0 or self.y > bounds[1] or 
+            self.life <= 0):
+            return False, None
+        
+        return True, None
+    
+class ProjectilePool:
+    """Free list of spent projectiles, so sustained fire does not allocate.
+    
+    Starts empty and grows to the most shots ever in flight at once: arena
+    hosts and rollouts build hundreds of arenas, most of which never need
+    many. ``preallocate`` fills it up front when the peak is known.
+    """
+    
+    def __init__(self, preallocate: int = 0, enabled: bool = True):
+        self.enabled = enabled
+        self.free: List[Projectile] = []
+        self.allocated = 0  # Projectile objects created by this pool
+        if enabled:
+            for _ in range(preallocate):
+                self.free.append(Projectile.__new__(Projectile))
+            self.allocated = preallocate
+    
+    def acquire(self, x: float, y: float, angle: float, owner: Bot) -> Projectile:
+        if self.free:
+            projectile = self.free.pop()
+            projectile.reset(x, y, angle, owner)
+            return projectile
+        self.allocated += 1
+        return Projectile(x, y, angle, owner)
+    
+    def blank(self) -> Projectile:
+        """An uninitialized projectile for the caller to fill in (snapshot restore)"""
+        if self.free:
+            return self.free.pop()
+        self.allocated += 1
+        return Projectile.__new__(Projectile)
+    
+    def release(self, projectile: Projectile):
+        if self.enabled:
+            projectile.owner = None  # don't keep dead bots alive
+            self.free.append(projectile)
+
+def _one_team(bots: List[Bot]) -> bool:
+    """True when all of ``bots`` are on the same team"""
+    team = bots[0].team
+    return team is not None and all(bot.team == team for bot in bots)
+
+class GameArena:
+    """Main game class managing the arena"""
+    
+    def __init__(self, headless: bool = False, bot_configs: Optional[Sequence[tuple]] = None,
+                 spatial_index: bool = True, seed: Optional[int] = None,
+                 event_log: Optional[EventLog] = None, projectile_pool: bool = True,
+                 ai_budget: Optional[int] = None, width: int = ARENA_WIDTH, height: int = ARENA_HEIGHT,
+                 swept_collisions: bool = True):
+        # Headless arenas run the simulation only: no window, and pygame is
+        # never imported
+        self.headless = headless
+        self.window = None  # window.ArenaWindow, opened at the end for windowed arenas
+        
+        # Every random draw goes through the arena's own RNG, so a seed
+        # plus the recorded inputs reproduces the whole battle
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**63)
+        self.rng = random.Random(self.seed)
+        self.recorder = None  # anything with record(sim_tick, InputEvent)
+        self.profiler: Optional[TickProfiler] = None
+        
+        # Game state
+        self.running = True
+        self.game_active = False
+        self.speed_index = 0  # into SPEEDS
+        self.bot_configs = list(bot_configs) if bot_configs is not None else DEFAULT_BOT_CONFIGS
+        self.bots: List[Bot] = []
+        self.projectiles: List[Projectile] = []
+        # Last 10 messages for the UI; the full stream goes to the event log
+        self.messages: Deque[Tuple[str, int]] = deque(maxlen=10)
+        if event_log is None and not headless:
+            # Echo to the console off-thread, one shot in ten
+            event_log = EventLog(echo=True, level=LogLevel.HIT, sample_every=10)
+        self.event_log = event_log
+        self.winner: Optional[Bot] = None
+        self.tick = 0
+        self.sim_ticks = 0  # like tick, but survives resets (replay timeline)
+        self.width = width
+        self.height = height
+        self.grid = SpatialGrid(width, height) if spatial_index else None
+        self.pool = ProjectilePool(enabled=projectile_pool)
+        # Max re-targets per tick (None = unlimited); the rest wait a tick
+        self.ai_budget = ai_budget
+        self.scheduler = RetargetScheduler(budget=ai_budget)
+        # Test each shot's whole step for hits, not just where it ends up
+        self.swept_collisions = swept_collisions
+        
+        self._initialize_bots()
+        if not headless:
+            from window import ArenaWindow
+            self.window = ArenaWindow(self)
+    
+    def _initialize_bots(self):
+        """Create initial bots with different types"""
+        self.bots = [self._make_bot(config) for config in self.bot_configs]
+        self.scheduler = RetargetScheduler(budget=self.ai_budget)
+        for bot in self.bots:
+            self.scheduler.add(bot)
+        
+        self._add_message(f"Arena initialized with {len(self.bots)} bots!")
+    
+    def _make_bot(self, config: tuple) -> Bot:
+        x, y, color, name, bot_type, *extra = config
+        return Bot(x, y, color, name, bot_type, self.rng, self.pool, *extra,
+                   bounds=(self.width, self.height))
+    
+    def _add_message(self, text: str, level: LogLevel = LogLevel.INFO):
+        """Add a message to the game log"""
+        profiler = self.profiler
+        if profiler is not None:
+            start = time.perf_counter()
+        
+        self.messages.append((text, self.sim_ticks))
+        if self.event_log is not None:
+            self.event_log.log(level, text, self.sim_ticks)
+        
+        if profiler is not None:
+            profiler.add("log", time.perf_counter() - start)
+    
+    def update(self):
+        """Main game update loop"""
+        if not self.game_active or self.winner:
+            return
+        
+        self.tick += 1
+        self.sim_ticks += 1
+        
+        profiler = self.profiler
+        if profiler is not None:
+            clock = time.perf_counter
+            mark = clock()
+        
+        grid = self.grid
+        if grid is not None:
+            grid.rebuild(self.bots)
+        
+        if profiler is not None:
+            now = clock()
+            profiler.add("grid", now - mark)
+            mark = now
+        
+        # Re-target this tick's share of bots, from start-of-tick positions
+        for bot in self.scheduler.begin_tick(self.tick):
+            self._retarget(bot)
+        
+        if profiler is not None:
+            now = clock()
+            profiler.add("targeting", now - mark)
+            mark = now
+        
+        # Every bot decides from the same start-of-tick snapshot...
+        bots = self.bots
+        intents = self._decide()
+        
+        if profiler is not None:
+            now = clock()
+            profiler.add("bot_ai", now - mark)
+            mark = now
+        
+        # ...then all intents are applied in one pass
+        shots = []
+        for bot, intent in zip(bots, intents):
+            if bot.health > 0:
+                shot = bot.apply(intent)
+                if shot is not None:
+                    shots.append(shot)
+                if grid is not None:
+                    grid.move(bot)
+        
+        if profiler is not None:
+            now = clock()
+            profiler.add("movement", now - mark)
+            mark = now
+        
+        # Update projectiles, compacting survivors to the front in place
+        projectiles = self.projectiles
+        pool = self.pool
+        kept = 0
+        hits = False
+        bounds = (self.width, self.height)
+        swept = self.swept_collisions
+        for projectile in projectiles:
+            alive, message = projectile.update(bots, grid, bounds, swept)
+            if alive:
+                projectiles[kept] = projectile
+                kept += 1
+            else:
+                pool.release(projectile)
+                if message:
+                    hits = True
+                    self._add_message(message, LogLevel.HIT)
+        del projectiles[kept:]
+        
+        # Chasers of bots that just died re-target on the next tick
+        if hits:
+            scheduler = self.scheduler
+            for bot in bots:
+                if bot.health <= 0 and bot in scheduler.bucket_of:
+                    scheduler.remove(bot)
+        
+        if profiler is not None:
+            now = clock()
+            profiler.add("projectiles", now - mark)
+            mark = now
+        
+        # This tick's shots start moving next tick
+        for shot in shots:
+            projectiles.append(shot)
+            owner = shot.owner
+            self._add_message(f"{owner.name} fires at {owner.target.name}!", LogLevel.FIRE)
+        
+        if profiler is not None:
+            now = clock()
+            profiler.add("firing", now - mark)
+            mark = now
+        
+        # Check for winner
+        alive_bots = [bot for bot in self.bots if bot.health > 0]
+        if len(alive_bots) <= 1 or _one_team(alive_bots):
+            self.game_active = False
+            if alive_bots:
+                self.winner = alive_bots[0]
+                self._add_message(f"🏆 {self.winner_label} wins the battle!", LogLevel.RESULT)
+            else:
+                self._add_message("💥 Battle ended in a draw!", LogLevel.RESULT)
+        
+        if profiler is not None:
+            profiler.add("winner", clock() - mark)
+            profiler.end_tick(len(self.bots), len(self.projectiles))
+    
+    def result(self) -> 'MatchResult':
+        """Outcome so far; ``finished`` is False while the battle is still on"""
+        winner = self.winner
+        return MatchResult(
+            winner=winner.name if winner else None,
+            ticks=self.tick,
+            survivors=[bot.name for bot in self.bots if bot.health > 0],
+            finished=not self.game_active,
+            bots=[BotResult(bot.name, bot.bot_type.value, bot.health, bot.damage_dealt)
+                  for bot in self.bots],
+            winner_type=winner.bot_type.value if winner else None,
+            seed=self.seed,
+        )
+    
+    @property
+    def winner_label(self) -> str:
+        """The winning bot's name, or its team's"""
+        if self.winner is None:
+            return ""
+        return f"Team {self.winner.team}" if self.winner.team is not None else self.winner.name
+    
+    @property
+    def battle_over(self) -> bool:
+        """True once one bot, one team or nobody is left standing"""
+        alive_bots = [bot for bot in self.bots if bot.health > 0]
+        return len(alive_bots) <= 1 or _one_team(alive_bots)
+    
+    def _decide(self) -> List[Optional[Intent]]:
+        """One AI evaluation per bot, in list order"""
+        return [bot.decide() for bot in self.bots]
+    
+    def _retarget(self, bot: Bot):
+        bot._find_target(self.bots, self.grid)
+        self.scheduler.set_target(bot, bot.target)
+    
+    def draw(self, alpha: float = 1.0):
+        """Render a frame on the window, interpolated ``alpha`` into the current tick"""
+        self.window.draw(alpha)
+    
+    def _draw_world(self, window, alpha: float):
+        """Queue bots and projectiles on the window; with a camera, only those in view"""
+        camera = window.camera
+        if camera is None:
+            for bot in self.bots:
+                window.queue_bot(bot, alpha)
+            for projectile in self.projectiles:
+                window.queue_projectile(projectile, alpha)
+            return
+        
+        offset = camera.offset
+        visible = camera.visible
+        for bot in self.bots:
+            if bot.health > 0 and visible(bot.x, bot.y, bot.profile.size + 40):  # room for the labels
+                window.queue_bot(bot, alpha, offset)
+        for projectile in self.projectiles:
+            if visible(projectile.x, projectile.y, projectile.size):
+                window.queue_projectile(projectile, alpha, offset)
+    
+    def _team_summary(self) -> List[tuple]:
+        """(label, color, alive, total) per team, in order of first appearance"""
+        teams = {}
+        for bot in self.bots:
+            if bot.team is None:
+                continue
+            entry = teams.get(bot.team)
+            if entry is None:
+                entry = teams[bot.team] = [f"Team {bot.team}", bot.color, 0, 0]
+            entry[2] += bot.health > 0
+            entry[3] += 1
+        return [tuple(entry) for entry in teams.values()]
+    
+    def apply_input(self, event: InputEvent):
+        """Apply a player input, recording it first if a replay is being made"""
+        if self.recorder is not None:
+            self.recorder.record(self.sim_ticks, event)
+        
+        if event == InputEvent.TOGGLE_PAUSE:
+            self.game_active = not self.game_active
+            if self.game_active:
+                self._add_message("Battle started!")
+            else:
+                self._add_message("Battle paused!")
+        elif event == InputEvent.RESET:
+            self._reset_arena()
+        elif event == InputEvent.ADD_BOT:
+            self._add_random_bot()
+    
+    def _reset_arena(self):
+        """Reset the arena to initial state"""
+        self.game_active = False
+        self.winner = None
+        self.tick = 0
+        for projectile in self.projectiles:
+            self.pool.release(projectile)
+        self.projectiles.clear()
+        self.messages.clear()
+        self._initialize_bots()
+    
+    def new_match(self, bot_configs: Optional[Sequence[tuple]] = None, seed: Optional[int] = None):
+        """Start a fresh match in place, as if newly built with this line-up and seed.
+        
+        The projectile pool, grid and profiler are kept, so arena hosts can
+        recycle one arena for match after match.
+        """
+        if bot_configs is not None:
+            self.bot_configs = list(bot_configs)
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**63)
+        self.rng.seed(self.seed)
+        self.sim_ticks = 0
+        self._reset_arena()
+    
+    def _add_random_bot(self):
+        """Add a random bot to the arena"""
+        x, y, color, name, bot_type = random_bot_config(self.rng, self.width, self.height)
+        
+        new_bot = self._make_bot((x, y, color, name, bot_type))
+        self.bots.append(new_bot)
+        self.scheduler.add(new_bot)
+        self._add_message(f"New bot {name} ({bot_type.value}) joined!")
+    
+    def run(self):
+        """Main game loop"""
+        print("🤖 AI Bot Arena - Python Version")
+        print("Controls:")
+        print("  SPACE - Start/Pause battle")
+        print("  R - Reset arena")
+        print("  A - Add random bot")
+        print("  1-4 - Simulation speed 1x/4x/16x/uncapped")
+        print("  P - Performance overlay")
+        print("  ESC - Quit")
+        print("\nPress SPACE to start the battle!")
+        
+        accumulator = 0.0
+        previous = time.perf_counter()
+        skipped = 0
+        
+        window = self.window
+        while self.running:
+            window.handle_events()
+            
+            now = time.perf_counter()
+            frame_time = min(now - previous, MAX_FRAME_TIME)
+            previous = now
+            
+            if not self.game_active or self.winner:
+                accumulator = 0.0
+            elif self.speed:
+                # Spend at most one frame's worth of wall time simulating
+                accumulator += frame_time * self.speed
+                deadline = now + SIM_DT
+                while accumulator >= SIM_DT and time.perf_counter() < deadline:
+                    self.update()
+                    accumulator -= SIM_DT
+            else:
+                # Uncapped: simulate until it is time to show a frame
+                deadline = now + SIM_DT
+                while self.game_active and not self.winner and time.perf_counter() < deadline:
+                    self.update()
+                accumulator = 0.0
+            
+            # Behind schedule: skip a few draws to catch up, then drop the backlog
+            if accumulator >= SIM_DT:
+                if skipped < MAX_FRAME_SKIP:
+                    skipped += 1
+                    continue
+                accumulator %= SIM_DT
+            skipped = 0
+            
+            alpha = accumulator / SIM_DT if self.game_active and not self.winner else 1.0
+            window.draw(alpha)
+            window.tick(FPS if self.speed else 0)
+        
+        if self.event_log is not None:
+            self.event_log.close()
+        window.close()
+    
+    @property
+    def speed(self) -> int:
+        """Sim ticks per real-time tick, 0 when uncapped"""
+        return SPEEDS[self.speed_index]
+    
+    @property
+    def speed_label(self) -> str:
+        return f"{self.speed}x" if self.speed else "max"
+
+@dataclass
+class BotResult:
+    """Per-bot line of a match result"""
+    name: str
+    bot_type: str
+    health: int
+    damage_dealt: int
+
+@dataclass
+class MatchResult:
+    """Outcome of a headless match"""
+    winner: Optional[str]
+    ticks: int
+    survivors: List[str] = field(default_factory=list)
+    finished: bool = True  # False when max_ticks ran out first
+    bots: List[BotResult] = field(default_factory=list)
+    winner_type: Optional[str] = None
+    seed: Optional[int] = None
+    
+    @property
+    def draw(self) -> bool:
+        return self.finished and self.winner is None
+
+def run_match(config: Optional[Sequence[tuple]] = None, max_ticks: int = 10000,
+              seed: Optional[int] = None, recorder=None) -> MatchResult:
+    """Run one match headless, as fast as the CPU allows.
+    
+    ``config`` is a list of ``(x, y, color, name, bot_type)`` tuples, the same
+    shape as ``DEFAULT_BOT_CONFIGS`` (used when omitted).
+    """
+    arena = GameArena(headless=True, bot_configs=config, seed=seed)
+    arena.recorder = recorder
+    arena.apply_input(InputEvent.TOGGLE_PAUSE)
+    
+    while arena.game_active and arena.tick < max_ticks:
+        arena.update()
+    
+    return arena.result()
+
+if __name__ == "__main__":
+    import importlib
+    import sys
+    
+    # Headless subcommands: python arena.py <command> [options]
+    subcommands = {"tournament": "tournament", "replay": "replay", "profile": "profiler",
+                   "scenario": "scenario", "spectate": "spectator", "host": "host",
+                   "tune": "tuning"}
+    if len(sys.argv) > 1 and sys.argv[1] in subcommands:
+        importlib.import_module(subcommands[sys.argv[1]]).main(sys.argv[2:])
+        sys.exit(0)
+    
+    # Anything else opens the game window, which needs pygame
+    try:
+        window = importlib.import_module("window")
+    except ImportError as e:
+        print(f"Error running the game: {e}")
+        print("Make sure you have pygame installed: pip install pygame")
+        sys.exit(1)
+    window.main(sys.argv[1:])
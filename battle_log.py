@@ -0,0 +1,104 @@
+"""Buffered, asynchronous battle log.
+
+Events go into a bounded ring buffer on the simulation thread and a background
+writer flushes them in batches, as JSON lines to a file and/or to stdout. The
+simulation never blocks on I/O: when the writer falls behind, the oldest
+buffered events are dropped and counted.
+
+Verbosity is per level. Events below the log level are either dropped or, with
+``sample_every=N``, kept one in N, so shot-by-shot chatter can be thinned out
+without losing kills and results.
+"""
+import json
+import sys
+import threading
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Optional, TextIO, Tuple
+
+class LogLevel(IntEnum):
+    FIRE = 10    # every shot
+    HIT = 20     # damage and kills
+    INFO = 30    # player actions, bots joining
+    RESULT = 40  # wins and draws
+
+class EventLog:
+    """Ring buffer of (tick, level, text) drained by a writer thread"""
+
+    def __init__(self, path: Optional[str] = None, echo: bool = False,
+                 level: LogLevel = LogLevel.HIT, sample_every: int = 0,
+                 capacity: int = 8192, flush_interval: float = 0.25):
+        self.level = level
+        self.sample_every = sample_every
+        self.echo = echo
+        self.flush_interval = flush_interval
+        self.buffer: Deque[Tuple[int, int, str]] = deque(maxlen=capacity)
+        self.dropped = 0   # overwritten before the writer got to them
+        self.filtered = 0  # below the level and not sampled
+        self.written = 0
+        self._sampled = 0
+
+        self._file: Optional[TextIO] = open(path, "a", encoding="utf-8") if path else None
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name="battle-log", daemon=True)
+        self._writer.start()
+
+    def log(self, level: LogLevel, text: str, tick: int = 0):
+        """Queue an event; never blocks"""
+        if level < self.level:
+            if not self.sample_every:
+                self.filtered += 1
+                return
+            self._sampled += 1
+            if self._sampled % self.sample_every:
+                self.filtered += 1
+                return
+
+        buffer = self.buffer
+        if len(buffer) == buffer.maxlen:
+            self.dropped += 1
+        buffer.append((tick, int(level), text))
+
+    def _drain(self):
+        buffer = self.buffer
+        batch = []
+        try:
+            while True:
+                batch.append(buffer.popleft())
+        except IndexError:
+            pass
+        if not batch:
+            return
+
+        if self._file is not None:
+            self._file.write("".join(
+                json.dumps({"tick": tick, "level": LogLevel(level).name, "text": text}) + "\n"
+                for tick, level, text in batch))
+            self._file.flush()
+        if self.echo:
+            sys.stdout.write("".join(f"[ARENA] {text}\n" for _, _, text in batch))
+            sys.stdout.flush()
+        self.written += len(batch)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+
+    def flush(self):
+        """Ask the writer to drain now (does not wait for it)"""
+        self._wake.set()
+
+    def close(self):
+        """Stop the writer after a final flush"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+        self._drain()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,146 @@
+"""Hit rate with and without leading aim and swept collisions, and what the swept test costs.
+
+Hit rate plays the same tournament line-ups and seeds four ways (direct or
+leading aim, end-point or swept hit test) and counts shots fired and shots
+that connected. Throughput times the projectile phase alone under sustained
+fire: 500 bots in the object arena and 10k on VectorWorld, each with its
+shots kept topped up, and reports shots tested per second.
+
+    python benchmarks/bench_collisions.py [--matches 40] [--ticks 200]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import ARENA_HEIGHT, ARENA_WIDTH, GameArena, LogLevel, random_bot_config  # noqa: E402
+from bench_scale import swarm, top_up  # noqa: E402
+from profiler import TickProfiler  # noqa: E402
+from tournament import match_config  # noqa: E402
+
+HEALTH = 10**9  # nobody dies while throughput is timed
+
+
+class ShotCounter:
+    """Event log that only counts events per level"""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def log(self, level: LogLevel, text: str, tick: int = 0):
+        self.counts[level] += 1
+
+    def close(self):
+        pass
+
+
+def hit_rate(matches: int, max_ticks: int, lead: bool, swept: bool) -> dict:
+    counts = Counter()
+    ticks = 0
+    for seed in range(matches):
+        configs = [config + (None, {"lead": lead}) for config in match_config(seed)]
+        log = ShotCounter()
+        arena = GameArena(headless=True, bot_configs=configs, seed=seed, event_log=log,
+                          swept_collisions=swept)
+        arena.game_active = True
+        while arena.game_active and arena.tick < max_ticks:
+            arena.update()
+        counts += log.counts
+        ticks += arena.tick
+    shots, hits = counts[LogLevel.FIRE], counts[LogLevel.HIT]
+    return {"shots": shots, "hits": hits, "rate": hits / shots if shots else 0.0, "ticks": ticks / matches}
+
+
+def arena_throughput(bots: int, ticks: int, seed: int, swept: bool) -> dict:
+    """Shots per second through GameArena's projectile phase"""
+    rng = random.Random(seed)
+    scale = max(1.0, math.sqrt(bots / 50))
+    width, height = int(ARENA_WIDTH * scale), int(ARENA_HEIGHT * scale)
+    configs = [random_bot_config(rng, width, height) for _ in range(bots)]
+    arena = GameArena(headless=True, bot_configs=configs, seed=seed, width=width, height=height,
+                      swept_collisions=swept)
+    for bot in arena.bots:
+        bot.health = bot.max_health = HEALTH
+        bot.fire_rate = 10
+        bot.range = 10 * max(width, height)
+    arena.game_active = True
+    for _ in range(120):
+        arena.update()
+
+    arena.profiler = TickProfiler(window=ticks)
+    shots = 0
+    for _ in range(ticks):
+        shots += len(arena.projectiles)
+        arena.update()
+    seconds = arena.profiler.percentiles("projectiles")["mean"] * ticks
+    tick_ms = arena.profiler.percentiles("total")["mean"] * 1000
+    return {"shots": shots / ticks, "shots_per_second": shots / seconds, "tick_ms": tick_ms}
+
+
+def world_throughput(bots: int, projectiles: int, ticks: int, seed: int, swept: bool) -> dict:
+    """Shots per second through VectorWorld's projectile phase, topped up like bench_scale"""
+    arena = swarm(bots).build(headless=True, seed=seed, swept_collisions=swept)
+    arena.game_active = True
+    world = arena.world
+    rng = np.random.default_rng(seed)
+
+    update_projectiles = world._update_projectiles
+    spent = [0.0]
+
+    def timed():
+        start = time.perf_counter()
+        survivors = update_projectiles()
+        spent[0] += time.perf_counter() - start
+        return survivors
+
+    world._update_projectiles = timed
+    shots = 0
+    tick_seconds = 0.0
+    for _ in range(ticks):
+        top_up(world, projectiles, rng)
+        shots += world.projectile_count
+        start = time.perf_counter()
+        arena.update()
+        tick_seconds += time.perf_counter() - start
+    return {"shots": shots / ticks, "shots_per_second": shots / spent[0], "tick_ms": tick_seconds / ticks * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=40)
+    parser.add_argument("--max-ticks", type=int, default=3000)
+    parser.add_argument("--ticks", type=int, default=200, help="timed ticks per throughput row")
+    parser.add_argument("--bots", type=int, default=500, help="bots in the object arena")
+    parser.add_argument("--world-bots", type=int, default=10_000)
+    parser.add_argument("--projectiles", type=int, default=50_000, help="shots kept in flight on VectorWorld")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.matches} tournament matches per row\n")
+    print(f"{'aim':>7} {'hit test':>9} {'shots':>8} {'hits':>7} {'hit rate':>9} {'ticks/match':>12}")
+    for lead in (False, True):
+        for swept in (False, True):
+            row = hit_rate(args.matches, args.max_ticks, lead, swept)
+            print(f"{'lead' if lead else 'direct':>7} {'swept' if swept else 'end':>9} {row['shots']:>8} "
+                  f"{row['hits']:>7} {row['rate']:>9.3f} {row['ticks']:>12.0f}")
+
+    print(f"\n{'':>22} {'hit test':>9} {'shots/tick':>11} {'shots/s':>12} {'tick ms':>8}")
+    for swept in (False, True):
+        row = arena_throughput(args.bots, args.ticks, args.seed, swept)
+        print(f"{f'GameArena {args.bots}':>22} {'swept' if swept else 'end':>9} {row['shots']:>11.0f} "
+              f"{row['shots_per_second']:>12,.0f} {row['tick_ms']:>8.2f}")
+    for swept in (False, True):
+        row = world_throughput(args.world_bots, args.projectiles, args.ticks, args.seed, swept)
+        print(f"{f'VectorWorld {args.world_bots}':>22} {'swept' if swept else 'end':>9} {row['shots']:>11.0f} "
+              f"{row['shots_per_second']:>12,.0f} {row['tick_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Matches per second for many small matches: one at a time vs multiplexed on an ArenaHost.
+
+"sequential" builds a fresh arena per match and plays it out, the way a
+tournament worker does; the host rows keep ``--arenas`` matches in flight and
+recycle their arenas. Every row plays the same seeds with the same results.
+
+    python benchmarks/bench_host.py [--matches 400] [--arenas 200] [--budget 4]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import ArenaHost  # noqa: E402
+from tournament import play_match  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=400)
+    parser.add_argument("--arenas", type=int, default=200)
+    parser.add_argument("--budget", type=int, default=4)
+    parser.add_argument("--max-ticks", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    expected = dict(play_match((args.seed + i, 5, args.max_ticks)) for i in range(args.matches))
+    sequential = args.matches / (time.perf_counter() - start)
+
+    print(f"{'':>20} {'matches/s':>10} {'ticks/s':>9} {'tick p99 ms':>12} {'gap p99 ms':>11} {'same results':>13}")
+    print(f"{'sequential':>20} {sequential:>10.1f} {'-':>9} {'-':>12} {'-':>11} {'-':>13}")
+    for mode, budget in (("round-robin", 1), ("batched", args.budget)):
+        host = ArenaHost(args.arenas, args.seed, max_ticks=args.max_ticks, budget=budget, mode=mode)
+        start = time.perf_counter()
+        results = dict(host.run(args.matches))
+        elapsed = time.perf_counter() - start
+        summary = host.metrics.summary()
+        print(f"{f'{mode} x{budget}':>20} {args.matches / elapsed:>10.1f} {summary['arena_ticks'] / elapsed:>9.0f} "
+              f"{summary['tick_ms']['p99']:>12.3f} {summary['gap_ms']['p99']:>11.3f} "
+              f"{str(results == expected):>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Tick time with one AI evaluation per bot vs the old two (movement pass + firing pass).
+
+The "double" arena evaluates every behavior twice per tick and keeps the
+second intent, which is the work the old update loop did.
+
+    python benchmarks/bench_intent_pass.py [--counts 50 500 2000] [--ticks 300]
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import GameArena, random_bot_config  # noqa: E402
+from profiler import TickProfiler  # noqa: E402
+
+
+class DoubleEvaluationArena(GameArena):
+    def _decide(self):
+        super()._decide()
+        return super()._decide()
+
+
+def run(arena_class, count: int, ticks: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    configs = [random_bot_config(rng) for _ in range(count)]
+    arena = arena_class(headless=True, bot_configs=configs, seed=seed)
+    arena.profiler = TickProfiler(window=ticks)
+    arena.game_active = True
+    for _ in range(ticks):
+        arena.update()
+
+    def mean_ms(phase):
+        return arena.profiler.percentiles(phase)["mean"] * 1000
+
+    return {"bot_ai": mean_ms("bot_ai"), "total": mean_ms("total")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    print(f"{'bots':>6} {'double ai ms':>13} {'single ai ms':>13} {'double tick':>12} {'single tick':>12} {'saved':>7}")
+    for count in args.counts:
+        double = run(DoubleEvaluationArena, count, args.ticks, args.seed)
+        single = run(GameArena, count, args.ticks, args.seed)
+        saved = 1 - single["total"] / double["total"]
+        print(f"{count:>6} {double['bot_ai']:>13.3f} {single['bot_ai']:>13.3f} "
+              f"{double['total']:>12.3f} {single['total']:>12.3f} {saved:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
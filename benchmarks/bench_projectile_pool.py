@@ -0,0 +1,68 @@
+"""Allocations and tick time under sustained fire, with and without the projectile pool.
+
+Every bot fires every tick (fire_rate 0, arena-wide range) and shots never
+connect (bot size 0), which keeps thousands of projectiles in flight.
+
+    python benchmarks/bench_projectile_pool.py [--bots 100] [--ticks 600]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import GameArena, random_bot_config  # noqa: E402
+
+
+def gc_collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+def run(bots: int, ticks: int, seed: int, pooled: bool) -> dict:
+    rng = random.Random(seed)
+    configs = [random_bot_config(rng) for _ in range(bots)]
+    arena = GameArena(headless=True, bot_configs=configs, seed=seed, projectile_pool=pooled)
+    for bot in arena.bots:
+        bot.fire_rate = 0
+        bot.range = 10_000
+        bot.size = 0
+    arena.game_active = True
+
+    # Warm up to a steady state of projectiles in flight
+    for _ in range(150):
+        arena.update()
+
+    allocated_before = arena.pool.allocated
+    collections_before = gc_collections()
+    start = time.perf_counter()
+    for _ in range(ticks):
+        arena.update()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ms_per_tick": elapsed / ticks * 1000,
+        "in_flight": len(arena.projectiles),
+        "allocs_per_tick": (arena.pool.allocated - allocated_before) / ticks,
+        "gc_collections": gc_collections() - collections_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'':>10} {'ms/tick':>8} {'in flight':>10} {'allocs/tick':>12} {'gc runs':>8}")
+    for label, pooled in (("new", False), ("pooled", True)):
+        row = run(args.bots, args.ticks, args.seed, pooled)
+        print(f"{label:>10} {row['ms_per_tick']:>8.3f} {row['in_flight']:>10} "
+              f"{row['allocs_per_tick']:>12.1f} {row['gc_collections']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Tick time of a scaled scenario: 10k bots on VectorWorld with 50k projectiles in flight.
+
+Two armies face each other across a large world. The projectile list is
+topped up with stray shots before every tick so the hit test always sees
+``--projectiles`` of them; top-up time is not counted.
+
+    python benchmarks/bench_scale.py [--bots 10000] [--projectiles 50000] [--ticks 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scenario import Scenario  # noqa: E402
+
+
+def swarm(bots: int) -> Scenario:
+    half = bots // 2
+    return Scenario.from_dict({
+        "name": "bench", "width": 12000, "height": 8000, "scale": True, "ai_budget": 100,
+        "teams": [
+            {"name": "A", "count": half, "area": [0, 0, 6400, 8000], "stats": {"fire_rate": 10}},
+            {"name": "B", "count": bots - half, "area": [5600, 0, 6400, 8000], "stats": {"fire_rate": 10}},
+        ],
+    })
+
+
+def top_up(world, target: int, rng: np.random.Generator):
+    missing = target - world.projectile_count
+    if missing <= 0:
+        return
+    angle = rng.uniform(0, 2 * np.pi, missing)
+    world._append_projectiles(
+        rng.uniform(0, world.width, missing), rng.uniform(0, world.height, missing),
+        np.cos(angle) * 5, np.sin(angle) * 5,
+        np.full(missing, 15, dtype=np.int64), rng.integers(0, world.count, missing),
+        np.full(missing, 120, dtype=np.int64))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, default=10_000)
+    parser.add_argument("--projectiles", type=int, default=50_000)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    arena = swarm(args.bots).build(headless=True, seed=args.seed)
+    print(f"setup: {time.perf_counter() - start:.2f} s")
+    arena.game_active = True
+    world = arena.world
+    rng = np.random.default_rng(args.seed)
+
+    times = []
+    for _ in range(args.ticks):
+        top_up(world, args.projectiles, rng)
+        start = time.perf_counter()
+        arena.update()
+        times.append(time.perf_counter() - start)
+        if not arena.game_active:
+            break
+
+    times.sort()
+    alive = int(np.count_nonzero(world.health > 0))
+    print(f"{len(times)} ticks, {alive} bots alive, {world.projectile_count} projectiles")
+    print(f"ms/tick  p50 {times[len(times) // 2] * 1000:.1f}  p95 {times[int(len(times) * 0.95)] * 1000:.1f}  "
+          f"max {times[-1] * 1000:.1f}")
+    print(f"{len(times) / sum(times):.0f} ticks/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Memory per entity and attribute-access time at 100k bots and projectiles.
+
+Compares the slotted layout (per-type stats in a shared BotProfile) against
+the same attributes kept in a per-instance ``__dict__``, which is how Bot and
+Projectile were laid out before. Memory is what tracemalloc sees while the
+entities are built. Access time is one pass over the fields the hot paths
+read, the way they read them (``bot.profile.size``), plus a pass through the
+properties that scenarios and benchmarks use (``bot.size``, and a shot's
+``damage``, which comes from its owner and is only read on a hit).
+
+    python benchmarks/bench_slots.py [--entities 100000] [--passes 5]
+"""
+import argparse
+import copy
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import Bot, BotType, Projectile, random_bot_config  # noqa: E402
+
+BOT_STATS = ("max_health", "damage", "range", "fire_rate", "size", "turn_speed")
+
+
+class DictBot:
+    """A Bot's state copied into a plain ``__dict__``, stats included"""
+
+    def __init__(self, bot: Bot):
+        for name in Bot.__slots__:
+            setattr(self, name, getattr(bot, name))
+        for name in BOT_STATS:
+            setattr(self, name, getattr(bot, name))
+
+
+class DictProjectile:
+    def __init__(self, projectile: Projectile):
+        for name in Projectile.__slots__:
+            setattr(self, name, getattr(projectile, name))
+        self.damage = projectile.damage
+        self.size = projectile.size
+
+
+def build_bots(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [Bot(*random_bot_config(rng), rng=rng) for _ in range(count)]
+
+
+def build_projectiles(bots: list, seed: int) -> list:
+    rng = random.Random(seed)
+    return [Projectile(bot.x, bot.y, rng.uniform(0, 6.28), bot) for bot in bots]
+
+
+def traced_bytes(build) -> tuple:
+    """(result, bytes allocated while building it)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def read_bots(bots: list) -> float:
+    total = 0.0
+    for bot in bots:
+        total += bot.x + bot.y + bot.health + bot.size + bot.range + bot.fire_rate
+    return total
+
+
+def read_profiled_bots(bots: list) -> float:
+    total = 0.0
+    for bot in bots:
+        profile = bot.profile
+        total += bot.x + bot.y + bot.health + profile.size + profile.range + profile.fire_rate
+    return total
+
+
+def read_projectiles(projectiles: list) -> float:
+    total = 0.0
+    for projectile in projectiles:
+        total += projectile.x + projectile.y + projectile.vx + projectile.vy + projectile.life + projectile.size
+    return total
+
+
+def read_projectile_damage(projectiles: list) -> float:
+    total = 0.0
+    for projectile in projectiles:
+        total += projectile.x + projectile.y + projectile.damage + projectile.size
+    return total
+
+
+def best_ms(function, items: list, passes: int) -> float:
+    best = float("inf")
+    for _ in range(passes):
+        start = time.perf_counter()
+        function(items)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--passes", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Both layouts are copied from the same entities, so the values they point
+    # at (names, colors, floats) are shared and only the layout is counted
+    bots = build_bots(args.entities, args.seed)
+    projectiles = build_projectiles(bots, args.seed)
+
+    slotted_bots, slotted_bot_bytes = traced_bytes(lambda: list(map(copy.copy, bots)))
+    dict_bots, dict_bot_bytes = traced_bytes(lambda: list(map(DictBot, bots)))
+    slotted_shots, slotted_shot_bytes = traced_bytes(lambda: list(map(copy.copy, projectiles)))
+    dict_shots, dict_shot_bytes = traced_bytes(lambda: list(map(DictProjectile, projectiles)))
+
+    def timed(function, items):
+        return best_ms(function, items, args.passes)
+
+    rows = (
+        ("Bot", "slots", slotted_bot_bytes, timed(read_profiled_bots, slotted_bots), timed(read_bots, slotted_bots)),
+        ("Bot", "dict", dict_bot_bytes, timed(read_bots, dict_bots), timed(read_bots, dict_bots)),
+        ("Projectile", "slots", slotted_shot_bytes, timed(read_projectiles, slotted_shots),
+         timed(read_projectile_damage, slotted_shots)),
+        ("Projectile", "dict", dict_shot_bytes, timed(read_projectiles, dict_shots),
+         timed(read_projectile_damage, dict_shots)),
+    )
+    print(f"{args.entities} entities; {len(BotType)} shared profiles\n")
+    print(f"{'':>10} {'layout':>6} {'bytes/entity':>13} {'total MiB':>10} {'read pass ms':>13} "
+          f"{'via properties ms':>18}")
+    for name, layout, size, ms, via_properties in rows:
+        print(f"{name:>10} {layout:>6} {size / args.entities:>13.0f} {size / 2**20:>10.1f} {ms:>13.2f} "
+              f"{via_properties:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Snapshot capture/restore cost and forked rollouts per second, against deepcopy.
+
+A battle is played to ``--at`` ticks and snapshotted; every fork restores
+that position, re-seeds and plays ``--horizon`` ticks ahead.
+
+    python benchmarks/bench_snapshot.py [--bots 5 50] [--at 300] [--horizon 30] [--forks 2000]
+"""
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import GameArena, random_bot_config  # noqa: E402
+from snapshot import ArenaSnapshot, rollouts  # noqa: E402
+
+
+def per_call_us(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--at", type=int, default=300)
+    parser.add_argument("--horizon", type=int, default=30)
+    parser.add_argument("--forks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'bots':>5} {'shots':>6} {'bytes':>7} {'capture us':>11} {'restore us':>11} "
+          f"{'to/from bytes us':>17} {'deepcopy us':>12} {'forks/s':>8} {'deepcopy forks/s':>17}")
+    for count in args.bots:
+        rng = random.Random(args.seed)
+        arena = GameArena(headless=True, bot_configs=[random_bot_config(rng) for _ in range(count)],
+                          seed=args.seed)
+        arena.game_active = True
+        for _ in range(args.at):
+            arena.update()
+
+        snap = ArenaSnapshot.capture(arena)
+        data = snap.to_bytes()
+        capture = per_call_us(lambda: ArenaSnapshot.capture(arena), 1000)
+        restore = per_call_us(lambda: snap.restore(arena), 1000)
+        serialize = per_call_us(lambda: ArenaSnapshot.from_bytes(snap.to_bytes()), 1000)
+        deepcopy = per_call_us(lambda: copy.deepcopy(arena), 100)
+
+        start = time.perf_counter()
+        for _ in rollouts(snap, range(args.forks), max_ticks=args.horizon):
+            pass
+        forks = args.forks / (time.perf_counter() - start)
+
+        # The same forks, each from a deepcopy of the arena
+        copies = max(1, args.forks // 10)
+        start = time.perf_counter()
+        for seed in range(copies):
+            fork = copy.deepcopy(arena)
+            fork.rng.seed(seed)
+            for _ in range(args.horizon):
+                fork.update()
+        deepcopy_forks = copies / (time.perf_counter() - start)
+
+        print(f"{count:>5} {len(arena.projectiles):>6} {len(data):>7} {capture:>11.1f} {restore:>11.1f} "
+              f"{serialize:>17.1f} {deepcopy:>12.1f} {forks:>8.0f} {deepcopy_forks:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
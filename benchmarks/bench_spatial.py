@@ -0,0 +1,47 @@
+"""Tick time against bot count, with and without the spatial grid.
+
+    python benchmarks/bench_spatial.py [--ticks 200] [--counts 5 50 200 500 1000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import GameArena, random_bot_config  # noqa: E402
+
+
+def time_ticks(count: int, ticks: int, seed: int, spatial_index: bool):
+    rng = random.Random(seed)
+    configs = [random_bot_config(rng) for _ in range(count)]
+    arena = GameArena(headless=True, bot_configs=configs, spatial_index=spatial_index, seed=seed)
+    arena.game_active = True
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        arena.update()
+    elapsed = time.perf_counter() - start
+
+    state = [(bot.x, bot.y, bot.health) for bot in arena.bots]
+    return elapsed / max(1, arena.tick), state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--counts", type=int, nargs="+", default=[5, 50, 200, 500, 1000])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'bots':>6} {'linear ms/tick':>15} {'grid ms/tick':>13} {'speedup':>8}  same result")
+    for count in args.counts:
+        linear, linear_state = time_ticks(count, args.ticks, args.seed, spatial_index=False)
+        grid, grid_state = time_ticks(count, args.ticks, args.seed, spatial_index=True)
+        print(f"{count:>6} {linear * 1000:>15.3f} {grid * 1000:>13.3f} "
+              f"{linear / grid:>7.1f}x  {linear_state == grid_state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Cold start of a fresh process: importing the arena, building one, and its first tick.
+
+Every run is a new interpreter, so nothing is cached in memory between runs.
+Headless builds the arena without a window, the way tournament workers and CLI
+commands do. Windowed opens the game window (through SDL's dummy video driver
+unless ``SDL_VIDEODRIVER`` is set) and its first tick includes the first
+frame. "process" is the whole child process as the parent sees it,
+interpreter start-up included. Times are medians over ``--runs``.
+
+    python benchmarks/bench_startup.py [--runs 15]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import arena
+imported = time.perf_counter()
+pygame_on_import = "pygame" in sys.modules
+game = arena.GameArena(headless={headless}, seed=1)
+built = time.perf_counter()
+game.game_active = True
+game.update()
+if not {headless}:
+    game.draw()
+ticked = time.perf_counter()
+print("startup", json.dumps({{"import": imported - start, "build": built - imported, "first_tick": ticked - built,
+                             "pygame_on_import": pygame_on_import, "pygame_loaded": "pygame" in sys.modules}}))
+"""
+
+
+def run_child(headless: bool) -> dict:
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", CHILD.format(headless=headless)], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    process = time.perf_counter() - start
+    # The windowed arena echoes its battle log too; the numbers are on their own line
+    line = next(line for line in output.splitlines() if line.startswith("startup "))
+    result = json.loads(line[len("startup "):])
+    result["process"] = process
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="print the medians as JSON")
+    args = parser.parse_args()
+
+    report = {}
+    for mode, headless in (("headless", True), ("windowed", False)):
+        runs = [run_child(headless) for _ in range(args.runs)]
+        row = {key: statistics.median(run[key] for run in runs) * 1000
+               for key in ("import", "build", "first_tick", "process")}
+        row["pygame_on_import"] = runs[0]["pygame_on_import"]
+        row["pygame_loaded"] = runs[0]["pygame_loaded"]
+        report[mode] = row
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"median of {args.runs} fresh processes, ms\n")
+    print(f"{'':>9} {'import':>8} {'build':>8} {'1st tick':>9} {'process':>8}  pygame on import / after")
+    for mode, row in report.items():
+        print(f"{mode:>9} {row['import']:>8.1f} {row['build']:>8.1f} {row['first_tick']:>9.1f} "
+              f"{row['process']:>8.1f}  {'yes' if row['pygame_on_import'] else 'no'} / "
+              f"{'yes' if row['pygame_loaded'] else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
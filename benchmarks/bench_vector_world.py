@@ -0,0 +1,70 @@
+"""Object arena vs NumPy VectorWorld: tick time and state parity on the same seed.
+
+    python benchmarks/bench_vector_world.py [--ticks 300] [--counts 5 50 500 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import GameArena, random_bot_config  # noqa: E402
+from vector_world import VectorWorld  # noqa: E402
+
+
+def configs_for(count: int, seed: int):
+    rng = random.Random(seed)
+    return [random_bot_config(rng) for _ in range(count)]
+
+
+def run_objects(configs, ticks: int, seed: int):
+    arena = GameArena(headless=True, bot_configs=configs, seed=seed)
+    arena.game_active = True
+    start = time.perf_counter()
+    for _ in range(ticks):
+        arena.update()
+    elapsed = time.perf_counter() - start
+    return arena, elapsed / max(1, arena.tick)
+
+
+def run_vector(configs, ticks: int, seed: int):
+    world = VectorWorld(configs, rng=random.Random(seed))
+    start = time.perf_counter()
+    for _ in range(ticks):
+        world.step()
+    elapsed = time.perf_counter() - start
+    return world, elapsed / max(1, world.tick)
+
+
+def max_drift(arena: GameArena, world: VectorWorld) -> float:
+    """Largest position difference between the two backends, inf on any discrete mismatch"""
+    if ([bot.health for bot in arena.bots] != world.health.tolist()
+            or len(arena.projectiles) != world.projectile_count):
+        return float('inf')
+    x = np.array([bot.x for bot in arena.bots])
+    y = np.array([bot.y for bot in arena.bots])
+    return float(max(np.abs(x - world.x).max(initial=0), np.abs(y - world.y).max(initial=0)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--counts", type=int, nargs="+", default=[5, 50, 500, 2000])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'bots':>6} {'objects ms/tick':>16} {'vector ms/tick':>15} {'speedup':>8} {'max drift':>10}")
+    for count in args.counts:
+        configs = configs_for(count, args.seed)
+        arena, object_time = run_objects(configs, args.ticks, args.seed)
+        world, vector_time = run_vector(configs, args.ticks, args.seed)
+        print(f"{count:>6} {object_time * 1000:>16.3f} {vector_time * 1000:>15.3f} "
+              f"{object_time / vector_time:>7.1f}x {max_drift(arena, world):>10.2g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Fixed-seed benchmark suite for the simulation and rendering hot paths, with baseline checks.
+
+Tick cases run headless at 5, 50, 500 and 5000 bots, AI-heavy (stock stats,
+worlds sized to keep density constant) and projectile-heavy (every bot
+fires every tick at any range, which keeps 3-6 shots per bot in flight,
+each swept against the stock-sized bots along its step). Render cases draw
+the stock arena offscreen through SDL's dummy video driver, so no display
+is needed. Bots get a huge health pool so nobody dies and every timed tick
+does the same amount of work.
+
+Every case reports ticks (or frames) per second, mean time per profiler
+phase and peak traced memory. The timed ticks run ``--repeats`` times back to
+back and the rate is the fastest round's, so a stall from the rest of the
+machine costs one round, not the result. Results are written as JSON; with a
+baseline, any case whose rate fell by more than ``--threshold`` fails the run.
+Quick runs are only good for spotting large regressions, so their default
+threshold is wider.
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json        # exit 1 on regression
+    python benchmarks/suite.py --update-baseline benchmarks/baseline.json
+    python benchmarks/suite.py --cases "ai-*" --quick
+"""
+import argparse
+import fnmatch
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, List
+
+# Render offscreen; must be set before pygame initializes its display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arena import ARENA_HEIGHT, ARENA_WIDTH, GameArena, random_bot_config  # noqa: E402
+from battle_log import EventLog, LogLevel  # noqa: E402
+from profiler import DRAW_PHASES, UPDATE_PHASES, TickProfiler  # noqa: E402
+
+SEED = 2024
+DEFAULT_THRESHOLD = 0.15
+# Quick rounds are a few milliseconds long, and on a busy machine whole runs drift by about a third
+QUICK_THRESHOLD = 0.40
+DEFAULT_REPEATS = 3
+RENDER_ALPHA = 0.5
+HEALTH = 10**9  # nobody dies during a case
+
+
+@dataclass
+class Case:
+    name: str
+    kind: str  # "ai", "projectile" or "render"
+    bots: int
+    ticks: int  # timed ticks (frames, for render cases)
+    warmup: int = 20
+
+
+def cases() -> List[Case]:
+    ticks = {5: 2000, 50: 600, 500: 120, 5000: 15}
+    suite = []
+    for bots, count in ticks.items():
+        suite.append(Case(f"ai-{bots}", "ai", bots, count))
+        suite.append(Case(f"projectile-{bots}", "projectile", bots, count, warmup=120))
+    for bots, count in {5: 600, 50: 300, 500: 60, 5000: 10}.items():
+        suite.append(Case(f"render-{bots}", "render", bots, count))
+    return suite
+
+
+def build(case: Case) -> GameArena:
+    """The case's arena, ready to run; same seed, same battle every time"""
+    rng = random.Random(SEED + case.bots)
+    if case.kind == "render":
+        width, height = ARENA_WIDTH, ARENA_HEIGHT  # everything on screen
+    else:
+        # Keep the 50-bot density of the stock arena
+        scale = max(1.0, math.sqrt(case.bots / 50))
+        width, height = int(ARENA_WIDTH * scale), int(ARENA_HEIGHT * scale)
+    configs = [random_bot_config(rng, width, height) for _ in range(case.bots)]
+
+    if case.kind == "render":
+        arena = GameArena(bot_configs=configs, seed=SEED, event_log=EventLog(level=LogLevel.RESULT))
+    else:
+        arena = GameArena(headless=True, bot_configs=configs, seed=SEED, width=width, height=height)
+    for bot in arena.bots:
+        bot.health = bot.max_health = HEALTH
+        if case.kind == "projectile":
+            bot.fire_rate = 1
+            bot.range = 10 * max(width, height)
+    arena.game_active = True
+    return arena
+
+
+def _step(arena: GameArena, case: Case):
+    arena.update()
+    if case.kind == "render":
+        arena.draw(RENDER_ALPHA)
+
+
+def run_case(case: Case, scale: float = 1.0, memory: bool = True, repeats: int = DEFAULT_REPEATS) -> dict:
+    ticks = max(1, int(case.ticks * scale))
+    arena = build(case)
+    for _ in range(case.warmup):
+        _step(arena, case)
+
+    arena.profiler = TickProfiler(window=ticks * repeats)
+    rounds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(ticks):
+            _step(arena, case)
+        rounds.append(time.perf_counter() - start)
+    if not arena.game_active:
+        raise RuntimeError(f"{case.name}: the battle ended, so the timed ticks did no work")
+
+    profiler = arena.profiler
+    phases = DRAW_PHASES + ("draw_total",) if case.kind == "render" else UPDATE_PHASES + ("total",)
+    result = {
+        "kind": case.kind,
+        "bots": case.bots,
+        "ticks": ticks,
+        "rate": ticks / min(rounds),  # ticks/s, or frames/s for render cases
+        "round_rates": [ticks / elapsed for elapsed in rounds],
+        "phases_ms": {phase: profiler.percentiles(phase)["mean"] * 1000
+                      for phase in phases if phase in profiler.phases()},
+        "alive": sum(bot.health > 0 for bot in arena.bots),
+        "projectiles": len(arena.projectiles),
+    }
+    if arena.event_log is not None:
+        arena.event_log.close()
+
+    if memory:
+        # Separate pass: tracing slows everything down, so it can't share the timed run
+        tracemalloc.start()
+        arena = build(case)
+        for _ in range(case.warmup + ticks):
+            _step(arena, case)
+        result["peak_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        if arena.event_log is not None:
+            arena.event_log.close()
+    return result
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Cases whose rate fell more than ``threshold`` below the baseline"""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        change = result["rate"] / before["rate"] - 1
+        result["change"] = change
+        if change < -threshold:
+            regressions.append(f"{name}: {before['rate']:.1f} -> {result['rate']:.1f}/s ({change:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", default=["*"], help="glob patterns of case names")
+    parser.add_argument("--quick", action="store_true", help="a quarter of the ticks per round, no memory pass")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help="timed rounds per case; the fastest one counts")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak-memory pass")
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against these results")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help=f"allowed slowdown before a case fails (fraction; default {DEFAULT_THRESHOLD}, "
+                             f"{QUICK_THRESHOLD} with --quick)")
+    parser.add_argument("--update-baseline", metavar="PATH", help="write results as the new baseline")
+    args = parser.parse_args()
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    if args.threshold is None:
+        args.threshold = QUICK_THRESHOLD if args.quick else DEFAULT_THRESHOLD
+
+    selected = [case for case in cases()
+                if any(fnmatch.fnmatch(case.name, pattern) for pattern in args.cases)]
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["cases"]
+
+    print(f"{'case':<16} {'rate/s':>10} {'vs base':>8} {'peak MiB':>9}  slowest phases (ms)")
+    results: Dict[str, dict] = {}
+    for case in selected:
+        result = run_case(case, scale=0.25 if args.quick else 1.0, memory=not (args.quick or args.no_memory),
+                          repeats=args.repeats)
+        results[case.name] = result
+        compare({case.name: result}, baseline, args.threshold)
+        change = f"{result['change']:+.0%}" if "change" in result else "-"
+        peak = f"{result['peak_mib']:.1f}" if "peak_mib" in result else "-"
+        slowest = sorted(((ms, phase) for phase, ms in result["phases_ms"].items()
+                          if phase not in ("total", "draw_total")), reverse=True)[:3]
+        phases = "  ".join(f"{phase} {ms:.3f}" for ms, phase in slowest)
+        print(f"{case.name:<16} {result['rate']:>10.1f} {change:>8} {peak:>9}  {phases}")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": SEED,
+            "quick": args.quick,
+            "repeats": args.repeats,
+        },
+        "cases": results,
+    }
+    for path in (args.output, args.update_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""Many headless arenas multiplexed on one process and one loop.
+
+An ArenaHost owns N GameArenas and advances them together in rounds on one
+shared clock. Every round gives each arena the same number of ticks, capped
+by the per-arena ``budget``. Round-robin mode interleaves the arenas one tick
+at a time; batched mode runs each arena's ticks back to back, which is kinder
+to the caches. A finished match hands back its result and its arena is
+recycled in place for the next seed, so nothing is torn down between matches.
+
+With ``rate`` set the clock is real time: every arena advances ``rate`` ticks
+per second (60 plays matches at normal speed), and a host that falls more
+than ``budget`` ticks behind drops the backlog. Without it, rounds run back
+to back as fast as the CPU allows.
+
+The host is for keeping many matches in flight on one clock: spectating or
+serving them live, or a fair share of ticks between them. It does not make
+matches faster. Batch jobs that only want results should use ``run_match``
+or the tournament's worker processes: one arena at a time stays warm in the
+caches, and hundreds interleaved do not, so a host plays fewer matches per
+second than the same process running them one by one.
+
+    python arena.py host --arenas 200 --matches 2000 --mode batched --budget 4
+"""
+import argparse
+import json
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from arena import GameArena, MatchResult
+from profiler import percentile
+from tournament import DEFAULT_BOTS_PER_MATCH, DEFAULT_MAX_TICKS, aggregate, match_config
+
+MODES = ("round-robin", "batched")
+DEFAULT_ARENAS = 100
+METRICS_WINDOW = 10000  # latency samples kept for percentiles
+RATE_WINDOW = 100  # rounds the stepping rate is averaged over
+
+def _percentiles_ms(samples: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50": percentile(ordered, 0.50) * 1000,
+        "p95": percentile(ordered, 0.95) * 1000,
+        "p99": percentile(ordered, 0.99) * 1000,
+        "max": ordered[-1] * 1000 if ordered else 0.0,
+    }
+
+class HostMetrics:
+    """Throughput and per-arena latency over a rolling window.
+
+    Samples are taken once per pass over the arenas (one pass per tick in
+    round-robin mode, one per round in batched mode): ``tick_times`` are what
+    one arena tick cost on average over the pass, and ``gaps`` are the pass's
+    wall time, i.e. how long each arena waits between its updates.
+    """
+
+    def __init__(self, window: int = METRICS_WINDOW):
+        self.started = time.perf_counter()
+        self.rounds = 0
+        self.ticks = 0  # arena ticks stepped, over all arenas
+        self.matches = 0
+        self.dropped = 0  # ticks the real-time clock gave up on to catch up
+        self.tick_times: Deque[float] = deque(maxlen=window)
+        self.gaps: Deque[float] = deque(maxlen=window)
+        self._marks: Deque[Tuple[float, int]] = deque(maxlen=RATE_WINDOW)  # (time, ticks) per round
+
+    def end_round(self, now: float):
+        self.rounds += 1
+        self._marks.append((now, self.ticks))
+
+    @property
+    def steps_per_second(self) -> float:
+        """Arena ticks per second over the last RATE_WINDOW rounds"""
+        if len(self._marks) < 2:
+            return 0.0
+        (start, ticks_then), (end, ticks_now) = self._marks[0], self._marks[-1]
+        return (ticks_now - ticks_then) / (end - start) if end > start else 0.0
+
+    def summary(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "rounds": self.rounds,
+            "arena_ticks": self.ticks,
+            "matches": self.matches,
+            "dropped_ticks": self.dropped,
+            "seconds": elapsed,
+            "steps_per_second": self.steps_per_second,
+            "matches_per_second": self.matches / elapsed if elapsed > 0 else 0.0,
+            "tick_ms": _percentiles_ms(self.tick_times),
+            "gap_ms": _percentiles_ms(self.gaps),
+        }
+
+    def report(self) -> str:
+        summary = self.summary()
+        tick, gap = summary["tick_ms"], summary["gap_ms"]
+        return "\n".join([
+            f"{summary['rounds']} rounds, {summary['arena_ticks']} arena ticks, "
+            f"{summary['dropped_ticks']} dropped",
+            f"{summary['steps_per_second']:.0f} arena ticks/s, {summary['matches_per_second']:.1f} matches/s",
+            f"tick ms    p50 {tick['p50']:.3f}  p95 {tick['p95']:.3f}  p99 {tick['p99']:.3f}  max {tick['max']:.3f}",
+            f"gap ms     p50 {gap['p50']:.3f}  p95 {gap['p95']:.3f}  p99 {gap['p99']:.3f}  max {gap['max']:.3f}",
+        ])
+
+class _Slot:
+    """A hosted arena and the match it is playing"""
+
+    __slots__ = ("arena", "seed")
+
+    def __init__(self, arena: GameArena, seed: int):
+        self.arena = arena
+        self.seed = seed
+
+class ArenaHost:
+    """Runs up to ``arenas`` headless matches at once, seed after seed.
+
+    Match ``n`` uses seed ``seed + n`` and the line-up ``configs(seed)``
+    (tournament line-ups by default), so its result is the same as
+    ``run_match`` with that line-up and seed, however the host interleaves it.
+    """
+
+    def __init__(self, arenas: int = DEFAULT_ARENAS, seed: int = 0,
+                 bots_per_match: int = DEFAULT_BOTS_PER_MATCH, max_ticks: int = DEFAULT_MAX_TICKS,
+                 budget: int = 1, mode: str = "round-robin", rate: float = 0.0,
+                 configs: Optional[Callable[[int], Sequence[tuple]]] = None):
+        if mode not in MODES:
+            raise ValueError(f"unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+        if arenas < 1 or budget < 1:
+            raise ValueError("a host needs at least one arena and a budget of at least one tick")
+        self.arenas = arenas
+        self.next_seed = seed
+        self.max_ticks = max_ticks
+        self.budget = budget  # most ticks any arena gets per round
+        self.mode = mode
+        self.rate = rate  # ticks per second of the shared clock; 0 = uncapped
+        self.configs = configs or (lambda match_seed: match_config(match_seed, bots_per_match))
+        self.remaining: Optional[int] = None  # matches still to start; None = no limit
+        self.slots: List[_Slot] = []
+        self.idle: List[GameArena] = []  # arenas between matches, reused before building new ones
+        self.metrics = HostMetrics()
+        self._owed = 0.0
+        self._previous: Optional[float] = None
+
+    def _fill(self):
+        """Start matches in the free slots"""
+        while len(self.slots) < self.arenas and self.remaining != 0:
+            seed = self.next_seed
+            self.next_seed += 1
+            if self.remaining is not None:
+                self.remaining -= 1
+            config = self.configs(seed)
+            if self.idle:
+                arena = self.idle.pop()
+                arena.new_match(config, seed)
+            else:
+                arena = GameArena(headless=True, bot_configs=config, seed=seed)
+            arena.game_active = True
+            self.slots.append(_Slot(arena, seed))
+
+    def _due(self) -> int:
+        """Ticks every arena runs this round, from the shared clock"""
+        if not self.rate:
+            return self.budget
+        now = time.perf_counter()
+        if self._previous is not None:
+            self._owed += (now - self._previous) * self.rate
+        self._previous = now
+        if self._owed > self.budget:
+            # Too far behind: drop the backlog rather than let rounds snowball
+            self.metrics.dropped += int(self._owed) - self.budget
+            self._owed = float(self.budget)
+        due = int(self._owed)
+        self._owed -= due
+        return due
+
+    @property
+    def wait(self) -> float:
+        """Seconds until the shared clock owes the next tick (0 when uncapped)"""
+        if not self.rate or self._previous is None:
+            return 0.0
+        owed = self._owed + (time.perf_counter() - self._previous) * self.rate
+        return max(0.0, (1.0 - owed) / self.rate)
+
+    def _record_pass(self, start: float, end: float, ran: int):
+        """One pass over the arenas: every arena that ran waited the whole pass"""
+        if ran:
+            metrics = self.metrics
+            metrics.tick_times.append((end - start) / ran)
+            metrics.gaps.append(end - start)
+            metrics.ticks += ran
+
+    def _live(self, arena: GameArena) -> bool:
+        return arena.game_active and arena.tick < self.max_ticks
+
+    def step_round(self) -> List[Tuple[int, MatchResult]]:
+        """Advance every arena by this round's ticks; (seed, result) of the matches that ended"""
+        self._fill()
+        due = self._due()
+        metrics = self.metrics
+        clock = time.perf_counter
+        live = self._live
+        arenas = [slot.arena for slot in self.slots]
+
+        # Timed per pass over the arenas rather than per arena tick: clock reads
+        # and samples on every tick cost a few percent of a small match's tick
+        if due and self.mode == "batched":
+            start = clock()
+            ran = 0
+            for arena in arenas:
+                for _ in range(due):
+                    if not live(arena):
+                        break
+                    arena.update()
+                    ran += 1
+            self._record_pass(start, clock(), ran)
+        elif due:
+            for _ in range(due):
+                start = clock()
+                ran = 0
+                for arena in arenas:
+                    if live(arena):
+                        arena.update()
+                        ran += 1
+                self._record_pass(start, clock(), ran)
+
+        finished = []
+        playing = []
+        for slot in self.slots:
+            if live(slot.arena):
+                playing.append(slot)
+            else:
+                finished.append((slot.seed, slot.arena.result()))
+                self.idle.append(slot.arena)
+        self.slots = playing
+        metrics.matches += len(finished)
+        metrics.end_round(clock())
+        return finished
+
+    def run(self, matches: Optional[int] = None) -> Iterator[Tuple[int, MatchResult]]:
+        """Play ``matches`` more matches (forever when None), yielding (seed, result) as they end"""
+        self.remaining = matches
+        self._fill()
+        while self.slots:
+            yield from self.step_round()
+            self._fill()  # every match may have ended this round
+            if self.rate:
+                time.sleep(self.wait)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="arena.py host",
+                                     description="Play many headless matches at once on one process")
+    parser.add_argument("--arenas", type=int, default=DEFAULT_ARENAS, help="matches in flight at once")
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first match")
+    parser.add_argument("--bots", type=int, default=DEFAULT_BOTS_PER_MATCH, help="bots per match")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--budget", type=int, default=1, help="most ticks per arena per round")
+    parser.add_argument("--mode", choices=MODES, default="round-robin")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="ticks per second per arena (60 = real time); 0 runs uncapped")
+    parser.add_argument("--output", help="write one JSON line per match to this file")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    host = ArenaHost(args.arenas, args.seed, args.bots, args.max_ticks, args.budget, args.mode, args.rate)
+    results = host.run(args.matches)
+    progress_every = 0 if args.json else max(1, args.matches // 10)
+    if args.output:
+        with open(args.output, "w") as output:
+            stats = aggregate(results, output, progress_every)
+    else:
+        stats = aggregate(results, progress_every=progress_every)
+
+    if args.json:
+        print(json.dumps({**stats.summary(), "host": host.metrics.summary()}, indent=2))
+    else:
+        print(stats.report())
+        print(host.metrics.report())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Per-phase tick timing with rolling percentiles.
+
+GameArena times each phase of ``update`` and ``draw`` into a TickProfiler when
+one is attached. Windowed games toggle the on-screen overlay with P; headless
+runs can export the per-tick rows:
+
+    python arena.py profile --bots 200 --ticks 2000 --csv ticks.csv --json summary.json
+"""
+import argparse
+import csv
+import gc
+import json
+import math
+import sys
+from collections import deque
+from typing import Deque, Dict, List
+
+# "vector" is the whole VectorWorld step of a scaled scenario
+UPDATE_PHASES = ("grid", "targeting", "bot_ai", "movement", "projectiles", "firing", "winner", "vector")
+DRAW_PHASES = ("draw_world", "draw_ui", "flip")
+# Time spent in _add_message; it also counts towards the phase that logged it
+LOG_PHASE = "log"
+
+_COUNTERS = ("bot_count", "projectile_count", "alloc_blocks", "gc_collections")
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+def _gc_collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+class TickProfiler:
+    """Collects phase durations per tick and per frame over a rolling window.
+
+    Simulation ticks and rendered frames are separate series, since the
+    fixed-timestep loop runs a varying number of ticks per frame.
+    """
+
+    def __init__(self, window: int = 600, keep_history: bool = False):
+        self.window = window
+        self.keep_history = keep_history
+        self.ticks: Deque[dict] = deque(maxlen=window)
+        self.frames: Deque[dict] = deque(maxlen=window)
+        self.history: List[dict] = []
+        self.tick_count = 0
+        self._tick: Dict[str, float] = {}
+        self._frame: Dict[str, float] = {}
+        self._blocks = sys.getallocatedblocks()
+        self._collections = _gc_collections()
+
+    def add(self, phase: str, seconds: float):
+        """Add time to a phase of the open tick (or frame, for draw phases)"""
+        current = self._frame if phase in DRAW_PHASES else self._tick
+        current[phase] = current.get(phase, 0.0) + seconds
+
+    def end_tick(self, bots: int, projectiles: int):
+        """Close the current tick's row"""
+        blocks = sys.getallocatedblocks()
+        collections = _gc_collections()
+        row = self._tick
+        row["total"] = sum(value for phase, value in row.items() if phase != LOG_PHASE)
+        row["tick"] = self.tick_count
+        row["bot_count"] = bots
+        row["projectile_count"] = projectiles
+        row["alloc_blocks"] = blocks - self._blocks  # net allocated blocks this tick
+        row["gc_collections"] = collections - self._collections
+
+        self.ticks.append(row)
+        if self.keep_history:
+            self.history.append(row)
+        self.tick_count += 1
+        self._tick = {}
+        self._blocks = blocks
+        self._collections = collections
+
+    def end_frame(self):
+        """Close the current frame's row"""
+        row = self._frame
+        row["draw_total"] = sum(row.values())
+        self.frames.append(row)
+        self._frame = {}
+
+    def percentiles(self, phase: str) -> Dict[str, float]:
+        """p50/p95/p99 and mean of a phase or counter over the rolling window"""
+        rows = self.frames if phase in DRAW_PHASES or phase == "draw_total" else self.ticks
+        values = sorted(row.get(phase, 0.0) for row in rows)
+        return {
+            "p50": percentile(values, 0.50),
+            "p95": percentile(values, 0.95),
+            "p99": percentile(values, 0.99),
+            "mean": sum(values) / len(values) if values else 0.0,
+        }
+
+    def phases(self) -> List[str]:
+        """Timed phases seen so far: update phases, log, total, then draw phases"""
+        seen = set()
+        for rows in (self.ticks, self.frames):
+            for row in rows:
+                seen.update(row)
+        ordered = UPDATE_PHASES + (LOG_PHASE, "total") + DRAW_PHASES + ("draw_total",)
+        return [phase for phase in ordered if phase in seen]
+
+    def summary(self) -> dict:
+        last = self.ticks[-1] if self.ticks else {}
+        return {
+            "ticks": self.tick_count,
+            "window": len(self.ticks),
+            "phases_seconds": {phase: self.percentiles(phase) for phase in self.phases()},
+            "bot_count": last.get("bot_count", 0),
+            "projectile_count": last.get("projectile_count", 0),
+            "alloc_blocks_per_tick": self.percentiles("alloc_blocks"),
+            "gc_collections": sum(row["gc_collections"] for row in self.ticks),
+        }
+
+    def overlay_lines(self) -> List[str]:
+        """Short text lines for the on-screen overlay"""
+        lines = ["Perf ms p50/p95/p99"]
+        for phase in self.phases():
+            p = self.percentiles(phase)
+            lines.append(f"{phase[:10]:<10} {p['p50'] * 1000:.2f}/{p['p95'] * 1000:.2f}/{p['p99'] * 1000:.2f}")
+        if self.ticks:
+            last = self.ticks[-1]
+            lines.append(f"bots {last['bot_count']}  shots {last['projectile_count']}")
+            lines.append(f"alloc/tick {self.percentiles('alloc_blocks')['p50']:+.0f}")
+        return lines
+
+    def export_csv(self, path: str):
+        """Per-tick rows (full history when kept, else the rolling window)"""
+        rows = self.history if self.keep_history else list(self.ticks)
+        timed = [phase for phase in self.phases() if phase not in DRAW_PHASES and phase != "draw_total"]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["tick"] + timed + list(_COUNTERS), restval=0.0)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def export_json(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+def main(argv=None):
+    import random
+    from arena import GameArena, random_bot_config
+
+    parser = argparse.ArgumentParser(prog="arena.py profile", description="Profile a headless battle")
+    parser.add_argument("--bots", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", help="write per-tick rows here")
+    parser.add_argument("--json", help="write the percentile summary here")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    configs = [random_bot_config(rng) for _ in range(args.bots)]
+    arena = GameArena(headless=True, bot_configs=configs, seed=args.seed)
+    arena.profiler = TickProfiler(window=args.ticks, keep_history=True)
+    arena.game_active = True
+    while arena.game_active and arena.tick < args.ticks:
+        arena.update()
+
+    for line in arena.profiler.overlay_lines():
+        print(line)
+    if args.csv:
+        arena.profiler.export_csv(args.csv)
+    if args.json:
+        arena.profiler.export_json(args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import math
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+HEADINGS = 64  # pre-built direction indicators per full turn
+
+class RenderCache:
+    """Keeps pre-rendered surfaces between frames.
+
+    Text is rendered once per (font, text, color) and reused until it goes
+    unused for ``max_idle_frames`` frames, so labels of removed bots and stale
+    health readouts drop out on their own. Static layers (the arena floor and
+    grid) and sprites are built once through ``surface``.
+    """
+
+    def __init__(self, label_font: Optional[pygame.font.Font] = None, max_idle_frames: int = 120):
+        self.label_font = label_font  # font for bot name tags
+        self.max_idle_frames = max_idle_frames
+        self.frame = 0
+        self._text: Dict[Tuple, List] = {}
+        self._surfaces: Dict[Hashable, pygame.Surface] = {}
+
+    def text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Rendered (antialiased) text, from cache when possible"""
+        key = (font, text, color)
+        entry = self._text.get(key)
+        if entry is None:
+            entry = [font.render(text, True, color), self.frame]
+            self._text[key] = entry
+        else:
+            entry[1] = self.frame
+        return entry[0]
+
+    def surface(self, key: Hashable, build: Callable[..., pygame.Surface], *args) -> pygame.Surface:
+        """Static surface built on first use, as ``build(*args)``"""
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._surfaces[key] = build(*args)
+        return surface
+
+    def end_frame(self):
+        """Advance the frame counter and periodically evict idle text"""
+        self.frame += 1
+        if self.frame % self.max_idle_frames == 0:
+            oldest = self.frame - self.max_idle_frames
+            stale = [key for key, entry in self._text.items() if entry[1] < oldest]
+            for key in stale:
+                del self._text[key]
+
+    def clear(self):
+        self._text.clear()
+        self._surfaces.clear()
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+def heading_step(angle: float) -> int:
+    """Index of the pre-built heading closest to ``angle``"""
+    return round(angle * HEADINGS / (2 * math.pi)) % HEADINGS
+
+class SpriteBatch:
+    """One frame's sprites, sent to the screen in a single ``Surface.blits`` call.
+
+    Bodies, bars and labels come pre-built from the RenderCache, so queuing
+    a bot costs a few dict lookups instead of a handful of draw calls.
+    """
+
+    def __init__(self, cache: RenderCache):
+        self.cache = cache
+        self.items: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+    def add(self, surface: pygame.Surface, x: float, y: float):
+        """Queue ``surface`` with its top-left corner at (x, y)"""
+        self.items.append((surface, (int(x), int(y))))
+
+    def add_centered(self, surface: pygame.Surface, x: float, y: float):
+        """Queue ``surface`` centered on (x, y)"""
+        width, height = surface.get_size()
+        self.items.append((surface, (int(x) - width // 2, int(y) - height // 2)))
+
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Blit everything queued and return the screen areas touched"""
+        rects = screen.blits(self.items) if self.items else []
+        self.items.clear()
+        return rects
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+class Camera:
+    """Scrollable view onto a world larger than its on-screen area.
+
+    ``x``/``y`` is the world position of the view's top-left corner. The view
+    occupies ``view_rect`` on screen, starting at the screen origin.
+    """
+
+    def __init__(self, world_width: float, world_height: float, view_width: int, view_height: int):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.view_rect = pygame.Rect(0, 0, view_width, view_height)
+        self.x = 0.0
+        self.y = 0.0
+
+    @property
+    def offset(self) -> Tuple[float, float]:
+        return self.x, self.y
+
+    def pan(self, dx: float, dy: float):
+        """Scroll by (dx, dy), staying inside the world"""
+        self.x = min(max(0.0, self.x + dx), max(0.0, self.world_width - self.view_rect.width))
+        self.y = min(max(0.0, self.y + dy), max(0.0, self.world_height - self.view_rect.height))
+
+    def center_on(self, x: float, y: float):
+        self.x = self.y = 0.0
+        self.pan(x - self.view_rect.width / 2, y - self.view_rect.height / 2)
+
+    def visible(self, x: float, y: float, margin: float = 0) -> bool:
+        """Whether a world point, padded by ``margin``, overlaps the view"""
+        return (self.x - margin <= x <= self.x + self.view_rect.width + margin and
+                self.y - margin <= y <= self.y + self.view_rect.height + margin)
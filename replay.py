@@ -0,0 +1,216 @@
+"""Compact binary replays: initial line-up, seed and the player inputs.
+
+The simulation is deterministic given the arena seed, so a replay only needs
+what the player did and when. Re-simulating runs headless at full CPU speed.
+
+Layout (little endian)::
+
+    magic "BARP" | version u8 | seed u64 | bot count u16
+    per bot: x f64 | y f64 | r u8 | g u8 | b u8 | type u8 | name len u8 | name utf-8
+    length varint (sim ticks recorded) | event count varint
+    per event: tick delta varint | input code u8
+
+    python arena.py replay match.replay --tick 1200
+"""
+import argparse
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+from arena import ARENA_HEIGHT, ARENA_WIDTH, BotType, GameArena, InputEvent, MatchResult, run_match
+
+MAGIC = b"BARP"
+VERSION = 2  # 2: swept collisions and leading aim; older replays play out differently
+
+_HEADER = struct.Struct("<4sBQH")
+SEED_LIMIT = 2**64  # seeds are stored as u64
+_BOT = struct.Struct("<ddBBBBB")
+_BOT_TYPES = list(BotType)
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _need(data: bytes, pos: int, size: int):
+    if pos + size > len(data):
+        raise ValueError("replay is truncated")
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        _need(data, pos, 1)
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+class Replay:
+    """Seed, starting line-up and timestamped inputs of one arena session"""
+
+    def __init__(self, seed: int, bot_configs: Sequence[tuple],
+                 events: Optional[List[Tuple[int, InputEvent]]] = None, length: int = 0):
+        self.seed = seed
+        self.bot_configs = list(bot_configs)
+        self.events = events if events is not None else []
+        self.length = length
+
+    @classmethod
+    def attach(cls, arena: GameArena) -> 'Replay':
+        """Start recording a freshly created arena"""
+        if arena.sim_ticks:
+            raise ValueError("recording must start before the arena has been simulated")
+        if (arena.width, arena.height) != (ARENA_WIDTH, ARENA_HEIGHT) or any(
+                len(config) > 5 for config in arena.bot_configs):
+            raise ValueError("scenario battles (world size, teams, stat overrides) can't be recorded")
+        if not 0 <= arena.seed < SEED_LIMIT:
+            raise ValueError(f"seed {arena.seed} can't be recorded; replays take seeds from 0 to 2**64 - 1")
+        replay = cls(arena.seed, arena.bot_configs)
+        arena.recorder = replay
+        return replay
+
+    def record(self, sim_tick: int, event: InputEvent):
+        self.events.append((sim_tick, event))
+        self.length = max(self.length, sim_tick)
+
+    def finish(self, arena: GameArena):
+        """Mark the end of the recording at the arena's current tick"""
+        self.length = arena.sim_ticks
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.seed, len(self.bot_configs)))
+        for x, y, color, name, bot_type in self.bot_configs:
+            # Cut on a character boundary so the name still decodes
+            encoded = name.encode("utf-8")[:255].decode("utf-8", "ignore").encode("utf-8")
+            out += _BOT.pack(x, y, *color, _BOT_TYPES.index(bot_type), len(encoded))
+            out += encoded
+
+        _write_varint(out, self.length)
+        _write_varint(out, len(self.events))
+        previous = 0
+        for tick, event in self.events:
+            _write_varint(out, tick - previous)
+            out.append(event.value)
+            previous = tick
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        if len(data) < _HEADER.size:
+            raise ValueError("not an arena replay")
+        magic, version, seed, bot_count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not an arena replay")
+        if version != VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        pos = _HEADER.size
+
+        bot_configs = []
+        for _ in range(bot_count):
+            _need(data, pos, _BOT.size)
+            x, y, r, g, b, type_index, name_length = _BOT.unpack_from(data, pos)
+            pos += _BOT.size
+            _need(data, pos, name_length)
+            if type_index >= len(_BOT_TYPES):
+                raise ValueError(f"unknown bot type {type_index} in replay")
+            name = data[pos:pos + name_length].decode("utf-8")
+            pos += name_length
+            bot_configs.append((x, y, (r, g, b), name, _BOT_TYPES[type_index]))
+
+        length, pos = _read_varint(data, pos)
+        event_count, pos = _read_varint(data, pos)
+        events = []
+        tick = 0
+        for _ in range(event_count):
+            delta, pos = _read_varint(data, pos)
+            tick += delta
+            _need(data, pos, 1)
+            try:
+                event = InputEvent(data[pos])
+            except ValueError:
+                raise ValueError(f"unknown input code {data[pos]} in replay") from None
+            events.append((tick, event))
+            pos += 1
+        return cls(seed, bot_configs, events, length)
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+def record_match(config: Sequence[tuple], max_ticks: int = 10000,
+                 seed: Optional[int] = None) -> Tuple[MatchResult, Replay]:
+    """run_match that also returns the replay of the match"""
+    if seed is not None and not 0 <= seed < SEED_LIMIT:
+        raise ValueError(f"seed {seed} can't be recorded; replays take seeds from 0 to 2**64 - 1")
+    replay = Replay(0, config)
+    result = run_match(config, max_ticks, seed=seed, recorder=replay)
+    replay.seed = result.seed
+    replay.length = result.ticks
+    return result, replay
+
+class ReplayPlayer:
+    """Re-simulates a replay headless, to any tick"""
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.rewind()
+
+    def rewind(self):
+        self.arena = GameArena(headless=True, bot_configs=self.replay.bot_configs,
+                               seed=self.replay.seed)
+        self._next_event = 0
+
+    def seek(self, tick: int) -> GameArena:
+        """Advance (or rewind and advance) to ``tick`` and return the arena"""
+        if tick < self.arena.sim_ticks:
+            self.rewind()
+
+        arena = self.arena
+        events = self.replay.events
+        while True:
+            # Inputs recorded at this tick happened before the next update
+            while self._next_event < len(events) and events[self._next_event][0] == arena.sim_ticks:
+                arena.apply_input(events[self._next_event][1])
+                self._next_event += 1
+
+            if arena.sim_ticks >= tick:
+                break
+            before = arena.sim_ticks
+            arena.update()
+            if arena.sim_ticks == before:
+                # Paused or finished with no more inputs to wake it up
+                break
+        return arena
+
+    def play_to_end(self) -> GameArena:
+        return self.seek(self.replay.length)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="arena.py replay", description="Re-simulate a recorded battle")
+    parser.add_argument("path")
+    parser.add_argument("--tick", type=int, default=None, help="stop at this tick (default: end)")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    player = ReplayPlayer(replay)
+    arena = player.seek(args.tick if args.tick is not None else replay.length)
+
+    print(f"Replay: seed {replay.seed}, {len(replay.bot_configs)} bots, "
+          f"{len(replay.events)} inputs, {replay.length} ticks")
+    print(f"At tick {arena.sim_ticks}:")
+    for bot in arena.bots:
+        print(f"  {bot.name:<12} {bot.bot_type.value:<11} health {bot.health:>3}  "
+              f"at ({bot.x:.1f}, {bot.y:.1f})")
+    if arena.winner:
+        print(f"Winner: {arena.winner.name}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Scenario files: world size, teams, stat overrides and spawn layouts.
+
+Scenarios are TOML or JSON, picked by file extension::
+
+    name = "Two armies"
+    width = 2400
+    height = 1600
+    scale = false          # true runs the battle on VectorWorld (thousands of bots)
+    ai_budget = 100        # optional cap on re-targets per tick
+
+    [[teams]]
+    name = "Red"
+    color = "red"                      # or [r, g, b]
+    count = 60
+    types = { aggressive = 2, defensive = 1 }   # weights, or a list of type names
+    layout = "grid"                    # random | grid | circle | cluster
+    area = [0, 0, 800, 1600]           # x, y, w, h; defaults to the whole world
+    stats = { range = 200 }            # overrides applied after the type's stats
+    allied = true                      # false: members fight each other too
+
+    python arena.py scenario scenarios/two_armies.toml [--headless] [--ticks 5000] [--seed 1]
+"""
+import argparse
+import json
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from arena import ARENA_HEIGHT, ARENA_WIDTH, BLUE, GREEN, ORANGE, PURPLE, RED, WHITE, YELLOW, BotType, GameArena
+
+# Accepted range of each stat override; health and size also have to fit the spectator's wire format
+STAT_LIMITS = {
+    "health": (1, 0xFFFF),
+    "max_health": (1, 0xFFFF),
+    "damage": (0, 0xFFFF),
+    "speed": (0, 20),
+    "range": (0, 10_000),
+    "fire_rate": (1, 10_000),
+    "size": (1, 255),
+    "retreat_distance": (0, 10_000),
+    "circle_radius": (0, 10_000),
+}
+STAT_FIELDS = tuple(STAT_LIMITS)
+LAYOUTS = ("random", "grid", "circle", "cluster")
+COLORS = {"red": RED, "blue": BLUE, "green": GREEN, "yellow": YELLOW,
+          "purple": PURPLE, "orange": ORANGE, "white": WHITE}
+# Team colors when a scenario does not pick one
+PALETTE = (RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE)
+# Keep spawns this far from the edge of their area
+SPAWN_MARGIN = 25
+
+@dataclass
+class TeamSpec:
+    name: str
+    count: int
+    color: tuple
+    types: Dict[BotType, float]
+    layout: str = "random"
+    area: Optional[Tuple[float, float, float, float]] = None
+    stats: Dict[str, float] = field(default_factory=dict)
+    allied: bool = True
+
+@dataclass
+class Scenario:
+    name: str
+    width: int
+    height: int
+    teams: List[TeamSpec]
+    seed: Optional[int] = None
+    scale: bool = False
+    ai_budget: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Scenario':
+        """Validate a parsed scenario file; raises ValueError on bad input"""
+        width = int(data.get("width", ARENA_WIDTH))
+        height = int(data.get("height", ARENA_HEIGHT))
+        if width < 2 * SPAWN_MARGIN or height < 2 * SPAWN_MARGIN:
+            raise ValueError(f"world size {width}x{height} is too small")
+        teams_data = data.get("teams")
+        if not teams_data:
+            raise ValueError("a scenario needs at least one team")
+        teams = [_team_from_dict(team, index, width, height) for index, team in enumerate(teams_data)]
+        ai_budget = data.get("ai_budget")
+        return cls(
+            name=str(data.get("name", "Scenario")),
+            width=width,
+            height=height,
+            teams=teams,
+            seed=data.get("seed"),
+            scale=bool(data.get("scale", False)),
+            ai_budget=int(ai_budget) if ai_budget is not None else None,
+        )
+
+    @property
+    def bot_count(self) -> int:
+        return sum(team.count for team in self.teams)
+
+    def bot_configs(self, rng: random.Random) -> List[tuple]:
+        """(x, y, color, name, bot_type, team, stats) for every bot, team by team"""
+        configs = []
+        for team in self.teams:
+            area = team.area or (0, 0, self.width, self.height)
+            types = list(team.types)
+            weights = list(team.types.values())
+            points = spawn_points(team.layout, team.count, area, rng)
+            for i, (x, y) in enumerate(points):
+                bot_type = rng.choices(types, weights)[0] if len(types) > 1 else types[0]
+                configs.append((x, y, team.color, f"{team.name}-{i + 1}", bot_type,
+                                team.name if team.allied else None, dict(team.stats)))
+        return configs
+
+    def build(self, headless: bool = False, seed: Optional[int] = None, **kwargs) -> GameArena:
+        """Arena for this scenario; ScaledArena when ``scale`` is set"""
+        if seed is None:
+            seed = self.seed if self.seed is not None else random.SystemRandom().randrange(2**63)
+        configs = self.bot_configs(random.Random(seed))
+        arena_class = GameArena
+        if self.scale:
+            from vector_world import ScaledArena  # NumPy is only needed for scaled battles
+            arena_class = ScaledArena
+        return arena_class(headless=headless, bot_configs=configs, seed=seed,
+                           width=self.width, height=self.height, ai_budget=self.ai_budget, **kwargs)
+
+def _team_from_dict(data: dict, index: int, width: int, height: int) -> TeamSpec:
+    name = str(data.get("name", f"Team {index + 1}"))
+    count = int(data.get("count", 1))
+    if count < 1:
+        raise ValueError(f"team {name}: count must be at least 1")
+
+    color = data.get("color", PALETTE[index % len(PALETTE)])
+    if isinstance(color, str):
+        if color.lower() not in COLORS:
+            raise ValueError(f"team {name}: unknown color {color!r}")
+        color = COLORS[color.lower()]
+    elif len(color) != 3 or not all(0 <= channel <= 255 for channel in color):
+        raise ValueError(f"team {name}: color must be a name or [r, g, b]")
+
+    types = data.get("types", [bot_type.value for bot_type in BotType])
+    if isinstance(types, str):
+        types = [types]
+    if not isinstance(types, dict):
+        types = {type_name: 1 for type_name in types}
+    try:
+        weights = {BotType(type_name): float(weight) for type_name, weight in types.items()}
+    except ValueError as e:
+        raise ValueError(f"team {name}: {e}") from None
+    if not weights or sum(weights.values()) <= 0:
+        raise ValueError(f"team {name}: types need a positive weight")
+
+    layout = data.get("layout", "random")
+    if layout not in LAYOUTS:
+        raise ValueError(f"team {name}: layout must be one of {', '.join(LAYOUTS)}")
+
+    area = data.get("area")
+    if area is not None:
+        x, y, w, h = (float(value) for value in area)
+        if x < 0 or y < 0 or x + w > width or y + h > height or min(w, h) < 2 * SPAWN_MARGIN:
+            raise ValueError(f"team {name}: area {area} must fit in the {width}x{height} world")
+        area = (x, y, w, h)
+
+    stats = data.get("stats", {})
+    unknown = set(stats) - set(STAT_FIELDS)
+    if unknown:
+        raise ValueError(f"team {name}: unknown stats {', '.join(sorted(unknown))}")
+    for stat, value in stats.items():
+        low, high = STAT_LIMITS[stat]
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"team {name}: stat {stat} must be a number, not {value!r}")
+        if not low <= value <= high:
+            raise ValueError(f"team {name}: stat {stat} = {value} is outside {low}..{high}")
+
+    return TeamSpec(name, count, tuple(color), weights, layout, area, dict(stats),
+                    bool(data.get("allied", True)))
+
+def spawn_points(layout: str, count: int, area: Tuple[float, float, float, float],
+                 rng: random.Random) -> List[Tuple[float, float]]:
+    """``count`` spawn positions inside ``area`` (x, y, w, h)"""
+    x0, y0, w, h = area
+    x0 += SPAWN_MARGIN
+    y0 += SPAWN_MARGIN
+    w -= 2 * SPAWN_MARGIN
+    h -= 2 * SPAWN_MARGIN
+
+    if layout == "grid":
+        cols = max(1, math.ceil(math.sqrt(count * w / h))) if h else count
+        rows = math.ceil(count / cols)
+        return [(x0 + (i % cols + 0.5) * w / cols, y0 + (i // cols + 0.5) * h / rows)
+                for i in range(count)]
+    if layout == "circle":
+        cx, cy = x0 + w / 2, y0 + h / 2
+        radius = min(w, h) / 2
+        return [(cx + radius * math.cos(2 * math.pi * i / count),
+                 cy + radius * math.sin(2 * math.pi * i / count)) for i in range(count)]
+    if layout == "cluster":
+        cx, cy = x0 + w / 2, y0 + h / 2
+        spread = min(w, h) / 6
+        return [(min(x0 + w, max(x0, rng.gauss(cx, spread))),
+                 min(y0 + h, max(y0, rng.gauss(cy, spread)))) for _ in range(count)]
+    return [(rng.uniform(x0, x0 + w), rng.uniform(y0, y0 + h)) for _ in range(count)]
+
+def load_scenario(path: str) -> Scenario:
+    """Read a .toml or .json scenario file"""
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError(f"{path}: TOML scenarios need Python 3.11 or newer; use a .json scenario") from None
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    elif path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    else:
+        raise ValueError(f"{path}: scenarios must be .toml or .json")
+    return Scenario.from_dict(data)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="arena.py scenario", description="Play a scenario file")
+    parser.add_argument("path", help=".toml or .json scenario")
+    parser.add_argument("--seed", type=int, default=None, help="overrides the scenario's seed")
+    parser.add_argument("--headless", action="store_true", help="simulate without a window and report")
+    parser.add_argument("--ticks", type=int, default=10000, help="tick limit for --headless")
+    args = parser.parse_args(argv)
+
+    try:
+        scenario = load_scenario(args.path)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    arena = scenario.build(headless=args.headless, seed=args.seed)
+    if not args.headless:
+        arena.run()
+        return
+
+    arena.game_active = True
+    start = time.perf_counter()
+    while arena.game_active and arena.tick < args.ticks:
+        arena.update()
+    elapsed = time.perf_counter() - start
+    result = arena.winner_label or ("draw" if not arena.game_active else "timeout")
+    print(f"{scenario.name}: {scenario.bot_count} bots, {arena.tick} ticks, result: {result}")
+    print(f"{arena.tick / elapsed:.1f} ticks/sec")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+from typing import Dict, Hashable, List, Optional, Sequence
+
+# Ticks between periodic re-targets of the same bot
+RETARGET_INTERVAL = 30
+
+class RetargetScheduler:
+    """Spreads target acquisition evenly over ticks.
+
+    Every bot is assigned one of ``interval`` buckets (the emptiest one when it
+    joins) and re-targets on the ticks where its bucket comes up, so a full
+    arena scan is spread over the interval instead of landing on one tick.
+    Bots that just joined, or whose target has just died, are queued as
+    urgent and re-target before anything else.
+
+    ``budget`` caps re-targets per tick; whatever does not fit is carried over
+    to the next tick, urgent work first.
+
+    Keys are opaque (Bot objects in GameArena, row indices in VectorWorld).
+    Dicts stand in for ordered sets so the order work is done in, and which
+    work gets deferred, is deterministic.
+    """
+
+    def __init__(self, interval: int = RETARGET_INTERVAL, budget: Optional[int] = None):
+        self.interval = interval
+        self.budget = budget
+        self.buckets: List[Dict[Hashable, None]] = [{} for _ in range(interval)]
+        self.bucket_of: Dict[Hashable, int] = {}
+        self.urgent: Dict[Hashable, None] = {}
+        self.deferred: Dict[Hashable, None] = {}
+        self.target_of: Dict[Hashable, Hashable] = {}
+        self.chasers: Dict[Hashable, Dict[Hashable, None]] = {}
+        self.spent = 0  # re-targets done this tick
+
+    def add(self, key: Hashable):
+        """Register a new bot; it re-targets on the next tick"""
+        bucket = min(range(self.interval), key=lambda i: len(self.buckets[i]))
+        self.buckets[bucket][key] = None
+        self.bucket_of[key] = bucket
+        self.urgent[key] = None
+
+    def remove(self, key: Hashable):
+        """Forget a destroyed bot and queue everyone chasing it"""
+        bucket = self.bucket_of.pop(key, None)
+        if bucket is None:
+            return
+        del self.buckets[bucket][key]
+        self.urgent.pop(key, None)
+        self.deferred.pop(key, None)
+        self._unlink(key)
+        for chaser in self.chasers.pop(key, {}):
+            del self.target_of[chaser]
+            self.urgent[chaser] = None
+
+    def _unlink(self, key: Hashable):
+        old = self.target_of.pop(key, None)
+        if old is not None:
+            del self.chasers[old][key]
+
+    def set_target(self, key: Hashable, target: Optional[Hashable]):
+        """Record the result of a re-target"""
+        self._unlink(key)
+        if target is not None:
+            self.target_of[key] = target
+            self.chasers.setdefault(target, {})[key] = None
+
+    def _take(self, queue: Dict[Hashable, None], limit: Optional[int]) -> List[Hashable]:
+        if limit is None or len(queue) <= limit:
+            keys = list(queue)
+            queue.clear()
+            return keys
+        keys = []
+        for key in queue:
+            if len(keys) == limit:
+                break
+            keys.append(key)
+        for key in keys:
+            del queue[key]
+        return keys
+
+    def begin_tick(self, tick: int) -> List[Hashable]:
+        """Bots to re-target at the start of ``tick``: urgent, carried over, then the due bucket"""
+        budget = self.budget
+        due = self._take(self.urgent, budget)
+        due += self._take(self.deferred, None if budget is None else budget - len(due))
+        self.spent = len(due)
+        taken = set(due)
+
+        for key in self.buckets[tick % self.interval]:
+            if key in self.urgent or key in self.deferred or key in taken:
+                continue
+            if self.budget is not None and self.spent >= self.budget:
+                self.deferred[key] = None
+            else:
+                due.append(key)
+                self.spent += 1
+        return due
+
+    def state(self, index: Dict[Hashable, int]) -> tuple:
+        """Queues and targets as plain tuples, with keys mapped through ``index``.
+
+        Buckets are saved as each key's bucket number in joining order, which
+        is also the order within every bucket.
+        """
+        position = index.__getitem__
+        return (self.interval, self.budget, self.spent,
+                tuple(map(position, self.bucket_of)), tuple(self.bucket_of.values()),
+                tuple(map(position, self.urgent)), tuple(map(position, self.deferred)),
+                tuple(map(position, self.target_of)), tuple(map(position, self.target_of.values())))
+
+    @classmethod
+    def from_state(cls, state: tuple, keys: Sequence[Hashable]) -> 'RetargetScheduler':
+        """Rebuild a scheduler saved by ``state``, mapping indices back through ``keys``"""
+        interval, budget, spent, members, numbers, urgent, deferred, chasers, targets = state
+        scheduler = cls(interval, budget)
+        scheduler.spent = spent
+        buckets, bucket_of = scheduler.buckets, scheduler.bucket_of
+        for i, number in zip(members, numbers):
+            key = keys[i]
+            buckets[number][key] = None
+            bucket_of[key] = number
+        scheduler.urgent = dict.fromkeys(keys[i] for i in urgent)
+        scheduler.deferred = dict.fromkeys(keys[i] for i in deferred)
+        # Replaying the links in order rebuilds the chasers index in the same order too
+        for key, target in zip(chasers, targets):
+            scheduler.set_target(keys[key], keys[target])
+        return scheduler
@@ -0,0 +1,174 @@
+"""Snapshots of a running arena, for forking "what if" rollouts from any tick.
+
+A snapshot is flat and immutable: one tuple of plain values per bot and per
+projectile, with every reference (targets, projectile owners, the winner,
+the re-target scheduler's queues) stored as an index into the bot list, plus
+the arena RNG's state. Taking one reads attributes in bulk; restoring writes
+them back onto the arena's existing objects (or rebuilt ones if the roster
+changed), so nothing is deep-copied and one snapshot can seed any number of
+forks.
+
+Bytes layout: magic "BASN" | version u8 | marshal dump of the state tuple.
+marshal is fast and keeps ints and floats exact, but its format belongs to
+the Python version that wrote it, so snapshots are for short-lived forking,
+not archiving (use replays for that). Stat profiles are shared by reference
+in memory and written as plain tuples.
+
+    snap = ArenaSnapshot.capture(arena)
+    for result in rollouts(snap, seeds=range(1000), max_ticks=600):
+        ...
+"""
+import marshal
+from dataclasses import fields
+from operator import attrgetter
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from arena import BOT_PROFILES, BotProfile, BotType, GameArena, MatchResult
+from scheduler import RetargetScheduler
+
+MAGIC = b"BASN"
+VERSION = 5  # 3: profiles carry "lead"; 4: and the behavior thresholds; 5: no last_target_update
+
+# Everything that changes how a bot behaves from here on (target and rng aside)
+BOT_FIELDS = ("x", "y", "prev_x", "prev_y", "vx", "vy", "direction", "color", "name", "bot_type",
+              "team", "bounds", "profile", "health", "speed", "last_shot", "damage_dealt")
+PROJECTILE_FIELDS = ("x", "y", "prev_x", "prev_y", "vx", "vy", "life")
+
+_bot_row = attrgetter(*BOT_FIELDS)
+_projectile_row = attrgetter(*PROJECTILE_FIELDS)
+_TYPE = BOT_FIELDS.index("bot_type")
+_PROFILE = BOT_FIELDS.index("profile")
+_profile_values = attrgetter(*(stat.name for stat in fields(BotProfile)))
+
+class ArenaSnapshot:
+    """Simulation state of a GameArena at one tick"""
+
+    __slots__ = ("seed", "tick", "sim_ticks", "game_active", "winner", "size", "rng_state",
+                 "bots", "targets", "projectiles", "owners", "scheduler", "messages")
+
+    def __init__(self, seed: int, tick: int, sim_ticks: int, game_active: bool, winner: int,
+                 size: Tuple[int, int], rng_state: tuple, bots: tuple, targets: tuple,
+                 projectiles: tuple, owners: tuple, scheduler: tuple, messages: tuple):
+        self.seed = seed
+        self.tick = tick
+        self.sim_ticks = sim_ticks
+        self.game_active = game_active
+        self.winner = winner  # bot index, -1 for none
+        self.size = size  # world (width, height)
+        self.rng_state = rng_state
+        self.bots = bots  # one BOT_FIELDS row per bot
+        self.targets = targets  # bot index per bot, -1 for none
+        self.projectiles = projectiles  # one PROJECTILE_FIELDS row per projectile
+        self.owners = owners  # bot index per projectile
+        self.scheduler = scheduler
+        self.messages = messages
+
+    @classmethod
+    def capture(cls, arena: GameArena) -> 'ArenaSnapshot':
+        if hasattr(arena, "world"):
+            raise ValueError("scaled battles keep their state in a VectorWorld and can't be snapshotted")
+        bots = arena.bots
+        index = {bot: i for i, bot in enumerate(bots)}
+        index[None] = -1
+        return cls(
+            arena.seed, arena.tick, arena.sim_ticks, arena.game_active, index[arena.winner],
+            (arena.width, arena.height), arena.rng.getstate(),
+            tuple(map(_bot_row, bots)), tuple(index[bot.target] for bot in bots),
+            tuple(map(_projectile_row, arena.projectiles)),
+            tuple(index[projectile.owner] for projectile in arena.projectiles),
+            arena.scheduler.state(index), tuple(arena.messages))
+
+    def restore(self, arena: GameArena):
+        """Put ``arena`` back in this state; its bot and projectile objects are reused"""
+        if (arena.width, arena.height) != self.size:
+            raise ValueError(f"snapshot is of a {self.size[0]}x{self.size[1]} world, "
+                             f"not {arena.width}x{arena.height}")
+        bots = arena.bots
+        if len(bots) != len(self.bots):
+            # Different roster (bots added or reset since): rebuild, then overwrite below
+            bots = arena.bots = [arena._make_bot(config) for config in _configs(self.bots)]
+
+        for bot, row, target in zip(bots, self.bots, self.targets):
+            for name, value in zip(BOT_FIELDS, row):
+                setattr(bot, name, value)
+            bot.target = bots[target] if target >= 0 else None
+
+        pool = arena.pool
+        projectiles = arena.projectiles
+        for projectile in projectiles:
+            pool.release(projectile)
+        projectiles.clear()
+        for row, owner in zip(self.projectiles, self.owners):
+            projectile = pool.blank()
+            for name, value in zip(PROJECTILE_FIELDS, row):
+                setattr(projectile, name, value)
+            projectile.owner = bots[owner]
+            projectiles.append(projectile)
+
+        arena.seed = self.seed
+        arena.tick = self.tick
+        arena.sim_ticks = self.sim_ticks
+        arena.game_active = self.game_active
+        arena.winner = bots[self.winner] if self.winner >= 0 else None
+        arena.rng.setstate(self.rng_state)
+        arena.scheduler = RetargetScheduler.from_state(self.scheduler, bots)
+        arena.ai_budget = arena.scheduler.budget
+        arena.messages.clear()
+        arena.messages.extend(self.messages)
+
+    def to_bytes(self) -> bytes:
+        bots = tuple(row[:_TYPE] + (row[_TYPE].value,) + row[_TYPE + 1:_PROFILE] + (_profile_values(row[_PROFILE]),)
+                     + row[_PROFILE + 1:] for row in self.bots)
+        state = (self.seed, self.tick, self.sim_ticks, self.game_active, self.winner, self.size,
+                 self.rng_state, bots, self.targets, self.projectiles, self.owners,
+                 self.scheduler, self.messages)
+        return MAGIC + bytes((VERSION,)) + marshal.dumps(state)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ArenaSnapshot':
+        if data[:4] != MAGIC:
+            raise ValueError("not an arena snapshot")
+        if data[4] != VERSION:
+            raise ValueError(f"unsupported snapshot version {data[4]}")
+        state = list(marshal.loads(data[5:]))
+        # Equal profiles load as one shared object, the stock ones as BOT_PROFILES' own
+        profiles = {profile: profile for profile in BOT_PROFILES.values()}
+
+        def shared(values: tuple) -> BotProfile:
+            profile = BotProfile(*values)
+            return profiles.setdefault(profile, profile)
+
+        state[7] = tuple(row[:_TYPE] + (BotType(row[_TYPE]),) + row[_TYPE + 1:_PROFILE]
+                         + (shared(row[_PROFILE]),) + row[_PROFILE + 1:] for row in state[7])
+        return cls(*state)
+
+def _configs(rows: tuple) -> Iterator[tuple]:
+    """Bot configs that recreate a snapshot's roster (stats are overwritten on restore)"""
+    for row in rows:
+        x, y, _, _, _, _, _, color, name, bot_type, team = row[:11]
+        yield x, y, color, name, bot_type, team
+
+def rollouts(snapshot: ArenaSnapshot, seeds: Iterable[Optional[int]], max_ticks: int = 1000,
+             setup: Optional[Callable[[GameArena], None]] = None) -> Iterator[MatchResult]:
+    """Play the position out once per seed, each from a fresh restore of ``snapshot``.
+
+    A seed re-seeds the arena RNG so the forks diverge; None continues with
+    the snapshot's own RNG state, i.e. exactly what the original arena would
+    do next. ``setup`` may change the restored arena before it runs (the
+    "what if"). All forks share one scratch headless arena.
+    """
+    width, height = snapshot.size
+    arena = GameArena(headless=True, bot_configs=[], width=width, height=height)
+    for seed in seeds:
+        snapshot.restore(arena)
+        if seed is not None:
+            arena.seed = seed
+            arena.rng.seed(seed)
+        if setup is not None:
+            setup(arena)
+        # A finished battle (won or drawn) has nothing left to play; a paused one resumes
+        arena.game_active = not arena.battle_over
+        end = arena.tick + max_ticks
+        while arena.game_active and arena.tick < end:
+            arena.update()
+        yield arena.result()
@@ -0,0 +1,133 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+# Matches the 50px grid drawn on the arena floor
+CELL_SIZE = 50
+
+class SpatialGrid:
+    """Uniform grid over the arena for neighbourhood queries.
+
+    Bots are bucketed by cell so collision checks and nearest-enemy searches
+    only look at nearby cells instead of every bot. Query results come back in
+    insertion order, so they give the same answers as a linear scan of the
+    bot list (first hit wins, ties go to the earlier bot).
+    """
+
+    def __init__(self, width: float, height: float, cell_size: float = CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = max(1, int(math.ceil(width / cell_size)))
+        self.rows = max(1, int(math.ceil(height / cell_size)))
+        self.cells: Dict[Tuple[int, int], list] = {}
+        self.order: Dict[object, int] = {}
+        self.where: Dict[object, Tuple[int, int]] = {}
+        self.max_size = 0
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        cx = min(self.cols - 1, max(0, int(x // self.cell_size)))
+        cy = min(self.rows - 1, max(0, int(y // self.cell_size)))
+        return cx, cy
+
+    def rebuild(self, bots: list):
+        """Re-bucket every living bot"""
+        self.cells.clear()
+        self.order.clear()
+        self.where.clear()
+        cells, order, where = self.cells, self.order, self.where
+        cell_size, last_col, last_row = self.cell_size, self.cols - 1, self.rows - 1
+        max_size = 0
+        for index, bot in enumerate(bots):
+            if bot.health <= 0:
+                continue
+            order[bot] = index
+            cell = (min(last_col, max(0, int(bot.x // cell_size))),
+                    min(last_row, max(0, int(bot.y // cell_size))))
+            where[bot] = cell
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [bot]
+            else:
+                bucket.append(bot)
+            size = bot.profile.size
+            if size > max_size:
+                max_size = size
+        self.max_size = max_size
+
+    def move(self, bot):
+        """Re-bucket a bot after it moved, if it changed cell"""
+        old = self.where.get(bot)
+        if old is None:
+            return
+        cell = self._cell(bot.x, bot.y)
+        if cell != old:
+            self.cells[old].remove(bot)
+            self.where[bot] = cell
+            self.cells.setdefault(cell, []).append(bot)
+
+    def remove(self, bot):
+        """Drop a bot from the grid (e.g. when destroyed)"""
+        cell = self.where.pop(bot, None)
+        if cell is not None:
+            self.cells[cell].remove(bot)
+            del self.order[bot]
+
+    def query(self, x: float, y: float, radius: float) -> list:
+        """Bots whose cell overlaps the square around (x, y), in list order"""
+        x0, y0 = self._cell(x - radius, y - radius)
+        x1, y1 = self._cell(x + radius, y + radius)
+        found = []
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        if len(found) > 1:
+            found.sort(key=self.order.__getitem__)
+        return found
+
+    def nearest(self, bot) -> Optional[object]:
+        """Closest living enemy of ``bot``, searching outward ring by ring"""
+        cx, cy = self._cell(bot.x, bot.y)
+        team = bot.team
+        cells = self.cells
+        order = self.order
+        closest = None
+        closest_dist = float('inf')
+        closest_order = 0
+        max_ring = max(self.cols, self.rows)
+
+        for ring in range(max_ring + 1):
+            # Anything in this ring or beyond is at least (ring - 1) cells away
+            if closest is not None and closest_dist < (ring - 1) * self.cell_size:
+                break
+            for cell in self._ring(cx, cy, ring):
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                for other in bucket:
+                    if other is bot or other.health <= 0 or (team is not None and other.team == team):
+                        continue
+                    dist = bot._distance_to(other)
+                    if dist < closest_dist or (dist == closest_dist and order[other] < closest_order):
+                        closest = other
+                        closest_dist = dist
+                        closest_order = order[other]
+        return closest
+
+    def _ring(self, cx: int, cy: int, ring: int) -> List[Tuple[int, int]]:
+        if ring == 0:
+            return [(cx, cy)]
+        cells = []
+        for x in range(cx - ring, cx + ring + 1):
+            if 0 <= x < self.cols:
+                if cy - ring >= 0:
+                    cells.append((x, cy - ring))
+                if cy + ring < self.rows:
+                    cells.append((x, cy + ring))
+        for y in range(cy - ring + 1, cy + ring):
+            if 0 <= y < self.rows:
+                if cx - ring >= 0:
+                    cells.append((cx - ring, y))
+                if cx + ring < self.cols:
+                    cells.append((cx + ring, y))
+        return cells
@@ -0,0 +1,564 @@
+"""Spectator server: runs a headless arena and streams it to any number of viewers.
+
+Every tick goes out as one frame shared by all viewers: a keyframe with the
+full state, or a delta with only the bots whose quantized state changed and
+the projectiles that were fired or removed since the last frame (viewers
+move projectiles along their velocity themselves). Each viewer has a short
+queue of outgoing frames; when a slow viewer's queue is full its frames
+are dropped and it gets a keyframe as soon as there is room again, so the
+simulation never waits on a socket.
+
+Transport is plain TCP. Frames are length-prefixed, little endian::
+
+    frame:      length u32 (of what follows) | kind u8 | body
+    keyframe:   tick u32 | status u8 | winner u16 | width u16 | height u16 | bots u16 | projectiles u16
+                per bot: x u16 | y u16 | direction u8 | health u16 | max health u16 | size u8
+                         r g b u8 | type u8 | team len u8 | team utf-8 | name len u8 | name utf-8
+                per projectile: id u16 | x u16 | y u16 | vx i16 | vy i16
+    delta:      tick u32 | status u8 | winner u16 | elapsed ticks u16 | changed u16 | fired u16 | removed u16
+                per changed bot: index u16 | fields u8 | [x u16 y u16] [direction u8] [health u16]
+                per fired projectile: as in the keyframe
+                per removed projectile: id u16
+
+Positions are in quarter pixels, velocities in 1/256 px per tick and
+directions in 1/256 turns. Winner 0xFFFF means none.
+
+    python arena.py spectate --port 8765                 # serve
+    python arena.py spectate --watch 127.0.0.1:8765      # print what a viewer sees
+    python arena.py spectate --loopback 4 --seconds 5    # server + local viewers, then check them
+"""
+import argparse
+import asyncio
+import math
+import socket
+import struct
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from arena import FPS, SIM_DT, SPEEDS, BotType, GameArena, InputEvent, Projectile
+from scenario import load_scenario
+
+KEYFRAME = 1
+DELTA = 2
+
+STATUS_PAUSED = 0
+STATUS_RUNNING = 1
+STATUS_OVER = 2
+NO_WINNER = 0xFFFF
+
+POSITION_SCALE = 4      # quarter pixels
+VELOCITY_SCALE = 256    # 1/256 px per tick
+HEADING_STEPS = 256
+
+KEYFRAME_INTERVAL = 5 * FPS  # ticks between unconditional keyframes
+MAX_QUEUED_FRAMES = 8        # per viewer, before frames are dropped
+# Small socket and transport buffers keep a lagging viewer's backlog (and latency) short
+SEND_BUFFER = 32 * 1024
+WRITE_BUFFER_LIMIT = 16 * 1024
+RESTART_DELAY = 3.0          # seconds to show a finished battle before the next one
+
+_FRAME = struct.Struct("<IB")
+_KEY_HEAD = struct.Struct("<IBHHHHH")
+_KEY_BOT = struct.Struct("<HHBHHBBBBB")
+_PROJECTILE = struct.Struct("<HHHhh")
+_DELTA_HEAD = struct.Struct("<IBHHHHH")
+_BOT_INDEX = struct.Struct("<HB")
+_POSITION = struct.Struct("<HH")
+_HEALTH = struct.Struct("<H")
+_ID = struct.Struct("<H")
+
+MOVED, TURNED, HURT = 1, 2, 4  # delta field flags
+
+_BOT_TYPES = list(BotType)
+
+def _position(value: float) -> int:
+    return min(0xFFFF, max(0, round(value * POSITION_SCALE)))
+
+def _velocity(value: float) -> int:
+    return min(0x7FFF, max(-0x7FFF, round(value * VELOCITY_SCALE)))
+
+def _health(value: float) -> int:
+    return min(0xFFFF, max(0, round(value)))
+
+def _heading(angle: float) -> int:
+    return round(angle * HEADING_STEPS / (2 * math.pi)) % HEADING_STEPS
+
+def _short_text(text: Optional[str]) -> bytes:
+    # Cut on a character boundary so viewers can decode it
+    encoded = (text or "").encode("utf-8")[:255].decode("utf-8", "ignore").encode("utf-8")
+    return bytes((len(encoded),)) + encoded
+
+def _frame(kind: int, body: bytes) -> bytes:
+    return _FRAME.pack(len(body) + 1, kind) + body
+
+class StateEncoder:
+    """Quantizes an arena's state once per broadcast and encodes it as frames.
+
+    ``advance`` moves the baseline to the arena's current state and returns
+    the delta from the previous baseline (None when the roster changed and
+    only a keyframe can describe it); ``keyframe`` encodes the baseline.
+    """
+
+    def __init__(self, arena: GameArena):
+        self.arena = arena
+        if max(arena.width, arena.height) * POSITION_SCALE > 0xFFFF:
+            raise ValueError(f"worlds up to {0xFFFF // POSITION_SCALE} px across can be streamed")
+        self.tick = arena.sim_ticks
+        self.roster: List = []
+        self.bots: List[Tuple[int, int, int, int]] = []  # quantized (x, y, direction, health)
+        self.projectiles: Dict[Projectile, Tuple[int, int]] = {}  # object -> (id, life)
+        self.records: Dict[int, bytes] = {}  # id -> encoded projectile
+        self.next_id = 0
+        self._keyframe: Optional[bytes] = None
+
+    def _status(self) -> Tuple[int, int]:
+        arena = self.arena
+        status = (STATUS_RUNNING if arena.game_active
+                  else STATUS_OVER if arena.winner or not any(bot.health > 0 for bot in arena.bots)
+                  else STATUS_PAUSED)
+        winner = arena.bots.index(arena.winner) if arena.winner else NO_WINNER
+        return status, winner
+
+    def advance(self) -> Optional[bytes]:
+        arena = self.arena
+        bots = arena.bots
+        elapsed = arena.sim_ticks - self.tick
+        self.tick = arena.sim_ticks
+        self._keyframe = None
+
+        roster_changed = bots is not self.roster or len(bots) != len(self.bots)
+        current = [(_position(bot.x), _position(bot.y), _heading(bot.direction), _health(bot.health))
+                   for bot in bots]
+        changed = []
+        if not roster_changed:
+            for index, (old, new) in enumerate(zip(self.bots, current)):
+                if old == new:
+                    continue
+                fields = ((MOVED if old[:2] != new[:2] else 0) | (TURNED if old[2] != new[2] else 0) |
+                          (HURT if old[3] != new[3] else 0))
+                record = _BOT_INDEX.pack(index, fields)
+                if fields & MOVED:
+                    record += _POSITION.pack(new[0], new[1])
+                if fields & TURNED:
+                    record += bytes((new[2],))
+                if fields & HURT:
+                    record += _HEALTH.pack(new[3])
+                changed.append(record)
+        self.roster = bots
+        self.bots = current
+
+        # A pooled projectile is the same shot only if its life fell by exactly the ticks
+        # elapsed; one released and re-acquired in between has more life left than that
+        seen = self.projectiles
+        now: Dict[Projectile, Tuple[int, int]] = {}
+        fired = []
+        for projectile in arena.projectiles:
+            previous = seen.get(projectile)
+            if previous is not None and projectile.life == previous[1] - elapsed:
+                now[projectile] = (previous[0], projectile.life)
+                continue
+            net_id = self.next_id
+            self.next_id = (net_id + 1) & 0xFFFF
+            now[projectile] = (net_id, projectile.life)
+            fired.append(net_id)
+        removed = set(net_id for net_id, _ in seen.values()) - set(net_id for net_id, _ in now.values())
+        self.projectiles = now
+        records = self.records
+        for net_id in removed:
+            del records[net_id]
+        # Keyframes re-send every projectile at its real position, which resets viewer drift
+        for projectile, (net_id, _) in now.items():
+            records[net_id] = _PROJECTILE.pack(net_id, _position(projectile.x), _position(projectile.y),
+                                               _velocity(projectile.vx), _velocity(projectile.vy))
+
+        if roster_changed:
+            return None
+        status, winner = self._status()
+        body = [_DELTA_HEAD.pack(self.tick, status, winner, elapsed, len(changed), len(fired), len(removed))]
+        body += changed
+        body += [records[net_id] for net_id in fired]
+        body += [_ID.pack(net_id) for net_id in sorted(removed)]
+        return _frame(DELTA, b"".join(body))
+
+    def keyframe(self) -> bytes:
+        """The baseline as a keyframe, encoded at most once per broadcast"""
+        if self._keyframe is None:
+            arena = self.arena
+            status, winner = self._status()
+            body = [_KEY_HEAD.pack(self.tick, status, winner, arena.width, arena.height,
+                                   len(self.bots), len(self.records))]
+            for bot, (x, y, direction, health) in zip(self.roster, self.bots):
+                body.append(_KEY_BOT.pack(x, y, direction, health, _health(bot.max_health),
+                                          min(0xFF, max(0, round(bot.size))), *bot.color,
+                                          _BOT_TYPES.index(bot.bot_type)))
+                body.append(_short_text(bot.team))
+                body.append(_short_text(bot.name))
+            body += self.records.values()
+            self._keyframe = _frame(KEYFRAME, b"".join(body))
+        return self._keyframe
+
+class _Viewer:
+    """Server side of one connection: a bounded frame queue drained by its own task"""
+
+    def __init__(self, writer: asyncio.StreamWriter, max_queued: int):
+        self.writer = writer
+        self.task: Optional[asyncio.Task] = None
+        self.queue: asyncio.Queue = asyncio.Queue(max_queued)
+        self.needs_keyframe = True
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.dropped = 0
+
+    def offer(self, delta: Optional[bytes], keyframe: Callable[[], bytes]):
+        """Queue this tick's frame without ever waiting; a full queue drops it"""
+        resync = self.needs_keyframe or delta is None
+        try:
+            self.queue.put_nowait(keyframe() if resync else delta)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            self.needs_keyframe = True  # the next delta would not apply
+            return
+        if resync:
+            self.needs_keyframe = False
+
+    async def pump(self):
+        writer = self.writer
+        while True:
+            frame = await self.queue.get()
+            writer.write(frame)
+            self.frames_sent += 1
+            self.bytes_sent += len(frame)
+            await writer.drain()
+
+class SpectatorServer:
+    """Runs ``arena`` in real time and broadcasts every tick to connected viewers"""
+
+    def __init__(self, arena: GameArena, speed: int = 1, keyframe_interval: int = KEYFRAME_INTERVAL,
+                 max_queued: int = MAX_QUEUED_FRAMES, restart_delay: float = RESTART_DELAY):
+        self.arena = arena
+        self.speed = speed  # sim ticks per broadcast
+        self.keyframe_interval = keyframe_interval
+        self.max_queued = max_queued
+        self.restart_delay = restart_delay
+        self.encoder = StateEncoder(arena)
+        self.viewers: List[_Viewer] = []
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.broadcasts = 0
+        self.disconnected: List[_Viewer] = []
+        self._last_keyframe = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Listen and start simulating; returns the bound port"""
+        self.server = await asyncio.start_server(self._serve, host, port)
+        self._sim = asyncio.create_task(self._simulate())
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self._sim.cancel()
+        self.server.close()
+        tasks = [viewer.task for viewer in self.viewers]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER)
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_LIMIT)
+        viewer = _Viewer(writer, self.max_queued)
+        viewer.task = asyncio.current_task()
+        self.viewers.append(viewer)
+        try:
+            await viewer.pump()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # viewer left, or the server is closing
+        finally:
+            self.viewers.remove(viewer)
+            self.disconnected.append(viewer)
+            writer.close()
+
+    async def _simulate(self):
+        arena = self.arena
+        loop = asyncio.get_running_loop()
+        arena.apply_input(InputEvent.TOGGLE_PAUSE)
+        deadline = loop.time()
+        while True:
+            if not arena.game_active:
+                self.broadcast()
+                await asyncio.sleep(self.restart_delay)
+                arena.apply_input(InputEvent.RESET)
+                arena.apply_input(InputEvent.TOGGLE_PAUSE)
+                deadline = loop.time()
+            for _ in range(self.speed):
+                arena.update()
+            self.broadcast()
+
+            # Fixed rate; after a stall, carry on from now rather than bursting to catch up
+            deadline += SIM_DT
+            delay = deadline - loop.time()
+            if delay < -SIM_DT:
+                deadline = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    def broadcast(self):
+        """Encode the current tick once and offer it to every viewer"""
+        delta = self.encoder.advance()
+        if self.encoder.tick - self._last_keyframe >= self.keyframe_interval:
+            delta = None
+        if delta is None:
+            self._last_keyframe = self.encoder.tick
+        for viewer in self.viewers:
+            viewer.offer(delta, self.encoder.keyframe)
+        self.broadcasts += 1
+
+class SpectatorClient:
+    """Viewer side: rebuilds the arena state from keyframes and deltas"""
+
+    def __init__(self):
+        self.tick = -1
+        self.status = STATUS_PAUSED
+        self.winner: Optional[int] = None
+        self.size = (0, 0)
+        self.bots: List[dict] = []
+        self.projectiles: Dict[int, List[float]] = {}  # id -> [x, y, vx, vy]
+        self.keyframes = 0
+        self.deltas = 0
+        self.bytes_received = 0
+        self.synced = False  # a keyframe has arrived
+
+    def apply(self, kind: int, body: bytes):
+        if kind == KEYFRAME:
+            self._apply_keyframe(body)
+        elif kind == DELTA and self.synced:
+            self._apply_delta(body)
+
+    def _apply_keyframe(self, body: bytes):
+        tick, status, winner, width, height, bot_count, projectile_count = _KEY_HEAD.unpack_from(body)
+        self._set_status(tick, status, winner)
+        self.size = (width, height)
+        pos = _KEY_HEAD.size
+        self.bots = []
+        for _ in range(bot_count):
+            x, y, direction, health, max_health, size, r, g, b, bot_type = _KEY_BOT.unpack_from(body, pos)
+            pos += _KEY_BOT.size
+            team, pos = self._text(body, pos)
+            name, pos = self._text(body, pos)
+            self.bots.append({
+                "x": x / POSITION_SCALE, "y": y / POSITION_SCALE,
+                "direction": direction * 2 * math.pi / HEADING_STEPS, "health": health,
+                "max_health": max_health, "size": size, "color": (r, g, b),
+                "bot_type": _BOT_TYPES[bot_type], "team": team or None, "name": name,
+            })
+        self.projectiles = {}
+        for _ in range(projectile_count):
+            pos = self._add_projectile(body, pos)
+        self.keyframes += 1
+        self.synced = True
+
+    def _apply_delta(self, body: bytes):
+        tick, status, winner, elapsed, changed, fired, removed = _DELTA_HEAD.unpack_from(body)
+        self._set_status(tick, status, winner)
+        pos = _DELTA_HEAD.size
+        for _ in range(changed):
+            index, fields = _BOT_INDEX.unpack_from(body, pos)
+            pos += _BOT_INDEX.size
+            bot = self.bots[index]
+            if fields & MOVED:
+                x, y = _POSITION.unpack_from(body, pos)
+                pos += _POSITION.size
+                bot["x"], bot["y"] = x / POSITION_SCALE, y / POSITION_SCALE
+            if fields & TURNED:
+                bot["direction"] = body[pos] * 2 * math.pi / HEADING_STEPS
+                pos += 1
+            if fields & HURT:
+                bot["health"], = _HEALTH.unpack_from(body, pos)
+                pos += _HEALTH.size
+
+        # Shots in flight move on their own; new ones arrive where they are now
+        for shot in self.projectiles.values():
+            shot[0] += shot[2] * elapsed
+            shot[1] += shot[3] * elapsed
+        for _ in range(fired):
+            pos = self._add_projectile(body, pos)
+        for _ in range(removed):
+            net_id, = _ID.unpack_from(body, pos)
+            pos += _ID.size
+            self.projectiles.pop(net_id, None)
+        self.deltas += 1
+
+    def _set_status(self, tick: int, status: int, winner: int):
+        self.tick = tick
+        self.status = status
+        self.winner = None if winner == NO_WINNER else winner
+
+    def _add_projectile(self, body: bytes, pos: int) -> int:
+        net_id, x, y, vx, vy = _PROJECTILE.unpack_from(body, pos)
+        self.projectiles[net_id] = [x / POSITION_SCALE, y / POSITION_SCALE,
+                                    vx / VELOCITY_SCALE, vy / VELOCITY_SCALE]
+        return pos + _PROJECTILE.size
+
+    @staticmethod
+    def _text(body: bytes, pos: int) -> Tuple[str, int]:
+        length = body[pos]
+        return body[pos + 1:pos + 1 + length].decode("utf-8"), pos + 1 + length
+
+    async def read_frame(self, reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+        header = await reader.readexactly(_FRAME.size)
+        length, kind = _FRAME.unpack(header)
+        body = await reader.readexactly(length - 1)
+        self.bytes_received += len(header) + len(body)
+        return kind, body
+
+    async def follow(self, reader: asyncio.StreamReader, on_frame: Optional[Callable[['SpectatorClient'], None]] = None,
+                     delay: float = 0.0):
+        """Apply frames until the connection closes; ``delay`` simulates a slow viewer"""
+        try:
+            while True:
+                self.apply(*await self.read_frame(reader))
+                if on_frame is not None:
+                    on_frame(self)
+                if delay:
+                    await asyncio.sleep(delay)
+        except asyncio.IncompleteReadError:
+            pass
+
+def _mismatches(client: SpectatorClient, encoder: StateEncoder, tolerance: float = 1.0) -> List[str]:
+    """Differences between what a viewer shows and the arena it watched"""
+    bots = encoder.arena.bots
+    if len(client.bots) != len(bots):
+        return [f"{len(client.bots)} bots shown, {len(bots)} in the arena"]
+    problems = []
+    for shown, bot in zip(client.bots, bots):
+        if (abs(shown["x"] - bot.x) > 0.5 / POSITION_SCALE or abs(shown["y"] - bot.y) > 0.5 / POSITION_SCALE
+                or shown["health"] != _health(bot.health)):
+            problems.append(f"{bot.name}: shown at ({shown['x']}, {shown['y']}) hp {shown['health']}, "
+                            f"is at ({bot.x:.2f}, {bot.y:.2f}) hp {bot.health}")
+    if set(client.projectiles) != set(net_id for net_id, _ in encoder.projectiles.values()):
+        problems.append(f"{len(client.projectiles)} projectiles shown, {len(encoder.projectiles)} in flight")
+    else:
+        for projectile, (net_id, _) in encoder.projectiles.items():
+            x, y, _, _ = client.projectiles[net_id]
+            if math.hypot(x - projectile.x, y - projectile.y) > tolerance:
+                problems.append(f"projectile {net_id} drifted {math.hypot(x - projectile.x, y - projectile.y):.2f} px")
+    return problems
+
+async def loopback(arena: GameArena, viewers: int, seconds: float, speed: int, slow: bool) -> bool:
+    """Serve ``arena`` to local viewers for a while, then check every viewer against it"""
+    server = SpectatorServer(arena, speed=speed, restart_delay=seconds)
+    port = await server.start()
+    clients, tasks, writers = [], [], []
+    for number in range(viewers):
+        delay = 0.0
+        if slow and number == viewers - 1:
+            # Takes in ten frames a second of the sixty sent, through small buffers
+            # so the backlog reaches the server quickly
+            delay = 0.1
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            sock.setblocking(False)
+            await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", port))
+            reader, writer = await asyncio.open_connection(sock=sock, limit=4096)
+        else:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        client = SpectatorClient()
+        clients.append(client)
+        writers.append(writer)
+        tasks.append(asyncio.create_task(client.follow(reader, delay=delay)))
+
+    started = time.perf_counter()
+    await asyncio.sleep(seconds)
+    elapsed = time.perf_counter() - started
+
+    # Freeze the sim and let the viewers that keep up drain their queues
+    server._sim.cancel()
+    await asyncio.sleep(0.2)
+
+    ok = True
+    print(f"{server.broadcasts} ticks broadcast in {elapsed:.1f} s ({server.broadcasts / elapsed:.0f}/s), "
+          f"tick {arena.sim_ticks}, {sum(bot.health > 0 for bot in arena.bots)} bots alive, "
+          f"{len(arena.projectiles)} projectiles")
+    by_writer = {viewer.writer.get_extra_info("peername"): viewer for viewer in server.viewers}
+    for number, (client, writer) in enumerate(zip(clients, writers)):
+        viewer = by_writer.get(writer.get_extra_info("sockname"))
+        slow_viewer = slow and number == viewers - 1
+        problems = [] if slow_viewer else _mismatches(client, server.encoder)
+        ok = ok and not problems
+        sent = viewer.bytes_sent if viewer else 0
+        print(f"  viewer {number}{' (slow)' if slow_viewer else ''}: {client.keyframes} keyframes, "
+              f"{client.deltas} deltas, {client.bytes_received / 1024:.0f} KiB "
+              f"({sent / max(1, server.broadcasts):.0f} B/tick), "
+              f"{viewer.dropped if viewer else 0} dropped, "
+              f"{'lagging, not checked' if slow_viewer else problems[0] if problems else 'in sync'}")
+
+    for task in tasks:
+        task.cancel()
+    for writer in writers:
+        writer.close()
+    await server.close()
+    return ok
+
+async def watch(host: str, port: int):
+    reader, writer = await asyncio.open_connection(host, port)
+    client = SpectatorClient()
+    last = [time.perf_counter(), 0]
+
+    def report(client: SpectatorClient):
+        now = time.perf_counter()
+        if now - last[0] >= 1.0:
+            rate = (client.bytes_received - last[1]) / (now - last[0])
+            alive = sum(bot["health"] > 0 for bot in client.bots)
+            print(f"tick {client.tick:>6}  bots {alive}/{len(client.bots)}  "
+                  f"projectiles {len(client.projectiles):>4}  {rate / 1024:.1f} KiB/s  "
+                  f"keyframes {client.keyframes}")
+            last[:] = [now, client.bytes_received]
+
+    await client.follow(reader, report)
+    writer.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="arena.py spectate", description="Stream a headless battle to viewers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--scenario", metavar="PATH", help="serve a scenario instead of the default line-up")
+    parser.add_argument("--speed", type=int, choices=[speed for speed in SPEEDS if speed], default=1,
+                        help="sim ticks per broadcast")
+    parser.add_argument("--watch", metavar="HOST:PORT", help="connect as a viewer and print what arrives")
+    parser.add_argument("--loopback", type=int, metavar="VIEWERS", help="serve to local viewers, then verify them")
+    parser.add_argument("--seconds", type=float, default=5.0, help="loopback run time")
+    parser.add_argument("--slow", action="store_true", help="make the last loopback viewer lag")
+    args = parser.parse_args(argv)
+
+    if args.watch:
+        host, _, port = args.watch.rpartition(":")
+        asyncio.run(watch(host, int(port)))
+        return
+
+    if args.scenario:
+        try:
+            scenario = load_scenario(args.scenario)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        if scenario.scale:
+            parser.error("scaled scenarios can't be streamed")
+        arena = scenario.build(headless=True, seed=args.seed)
+    else:
+        arena = GameArena(headless=True, seed=args.seed)
+
+    if args.loopback:
+        ok = asyncio.run(loopback(arena, args.loopback, args.seconds, args.speed, args.slow))
+        raise SystemExit(0 if ok else 1)
+
+    async def serve():
+        server = SpectatorServer(arena, speed=args.speed)
+        port = await server.start(args.host, args.port)
+        print(f"Spectator server on {args.host}:{port}, seed {arena.seed}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
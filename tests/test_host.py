@@ -0,0 +1,27 @@
+import pytest
+
+from host import MODES, ArenaHost
+from profiler import percentile
+from tournament import play_match
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("budget", [1, 7])
+def test_hosted_matches_match_run_match(mode, budget):
+    # Fewer arenas than matches, so arenas are recycled between seeds
+    host = ArenaHost(arenas=3, seed=10, bots_per_match=4, max_ticks=1500, budget=budget, mode=mode)
+    results = dict(host.run(8))
+    assert sorted(results) == list(range(10, 18))
+    for seed, result in results.items():
+        assert result == play_match((seed, 4, 1500))[1], f"seed {seed}"
+
+
+def test_percentile_is_nearest_rank():
+    ordered = [float(value) for value in range(1, 101)]
+    assert (percentile(ordered, 0.50), percentile(ordered, 0.95), percentile(ordered, 1.0)) == (50, 95, 100)
+    assert percentile([], 0.5) == 0.0
+
+
+def test_host_keeps_going_when_every_match_ends_in_one_round():
+    host = ArenaHost(arenas=1, seed=10, bots_per_match=4, max_ticks=1500, budget=1500, mode="batched")
+    assert [seed for seed, _ in host.run(3)] == [10, 11, 12]
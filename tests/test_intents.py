@@ -0,0 +1,69 @@
+import math
+import random
+
+import arena
+from arena import Bot, BotType, GameArena, Intent
+
+
+class CountingRandom(random.Random):
+    def __init__(self, seed):
+        super().__init__(seed)
+        self.uniform_calls = 0
+
+    def uniform(self, a, b):
+        self.uniform_calls += 1
+        return super().uniform(a, b)
+
+
+def test_each_behavior_runs_once_per_tick(monkeypatch):
+    calls = {}
+    for bot_type, behavior in list(arena.BEHAVIORS.items()):
+        def counted(bot, behavior=behavior):
+            calls[bot.name] = calls.get(bot.name, 0) + 1
+            return behavior(bot)
+        monkeypatch.setitem(arena.BEHAVIORS, bot_type, counted)
+
+    game = GameArena(headless=True, seed=4)
+    game.game_active = True
+    for _ in range(20):
+        calls.clear()
+        game.update()
+        deciding = [bot.name for bot in game.bots if bot.health > 0 and bot.target is not None]
+        assert calls == {name: 1 for name in deciding}
+
+
+def test_defensive_jitter_draws_once_per_tick():
+    rng = CountingRandom(1)
+    bot = Bot(300, 300, (0, 0, 255), "d", BotType.DEFENSIVE, rng)
+    bot.target = Bot(420, 300, (255, 0, 0), "t", BotType.AGGRESSIVE, random.Random(2))
+    rng.uniform_calls = 0
+    for _ in range(5):
+        bot.target.x = bot.x + 120  # inside range, outside the retreat distance
+        bot.target.y = bot.y
+        bot.apply(bot.decide())
+    assert rng.uniform_calls == 5
+
+
+def test_apply_moves_then_fires_as_told():
+    bot = Bot(300, 300, (255, 0, 0), "a", BotType.AGGRESSIVE, random.Random(1))
+    bot.last_shot = bot.fire_rate - 1
+    shot = bot.apply(Intent(math.pi / 2, 2.0, 0.0))
+    assert (bot.prev_x, bot.prev_y) == (300, 300)
+    assert math.isclose(bot.x, 300, abs_tol=1e-9) and math.isclose(bot.y, 302)
+    assert (bot.direction, bot.speed) == (math.pi / 2, 2.0)
+    assert shot is not None and (shot.x, shot.y, shot.owner) == (300, 300, bot)
+    assert shot.vx > 0 and math.isclose(shot.vy, 0, abs_tol=1e-9)
+    assert bot.last_shot == 0
+
+    # Not ready: the aim is ignored, and the bot still moves
+    assert bot.apply(Intent(0.0, 1.0, 0.0)) is None
+    assert math.isclose(bot.x, 301) and bot.last_shot == 1
+
+
+def test_apply_without_an_intent_keeps_course():
+    bot = Bot(300, 300, (255, 0, 0), "a", BotType.AGGRESSIVE, random.Random(1))
+    direction, speed = bot.direction, bot.speed
+    assert bot.apply(None) is None
+    assert (bot.direction, bot.speed) == (direction, speed)
+    assert math.isclose(bot.x, 300 + math.cos(direction) * speed)
+    assert math.isclose(bot.y, 300 + math.sin(direction) * speed)
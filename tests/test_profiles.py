@@ -0,0 +1,23 @@
+from arena import BOT_PROFILES, Bot, BotType
+
+
+def test_equal_overrides_share_a_profile():
+    profile = BOT_PROFILES[BotType.AGGRESSIVE]
+    assert profile.derive("range", 200) is profile.derive("range", 200)
+    assert profile.derive("range", 150) == profile
+
+
+def test_overrides_keep_their_type():
+    profile = BOT_PROFILES[BotType.AGGRESSIVE]
+    assert type(profile.derive("lead", 1).lead) is int
+    assert type(profile.derive("lead", True).lead) is bool
+    assert type(profile.derive("damage", 15.0).derive("range", 200).damage) is float
+    assert type(profile.derive("damage", 15).derive("range", 200).damage) is int
+
+
+def test_assigning_a_stat_moves_only_that_bot():
+    import random
+    bots = [Bot(100, 100, (255, 0, 0), name, BotType.SNEAKY, random.Random(1)) for name in "ab"]
+    bots[0].range = 400
+    assert (bots[0].range, bots[1].range) == (400, BOT_PROFILES[BotType.SNEAKY].range)
+    assert bots[1].profile is BOT_PROFILES[BotType.SNEAKY]
@@ -0,0 +1,11 @@
+from arena import GameArena
+
+
+def test_projectile_pool_grows_only_as_far_as_needed():
+    arena = GameArena(headless=True, seed=3)
+    assert arena.pool.allocated == 0 and not arena.pool.free
+    arena.game_active = True
+    for _ in range(600):
+        arena.update()
+    assert arena.pool.allocated == len(arena.projectiles) + len(arena.pool.free)
+    assert 0 < arena.pool.allocated < 50
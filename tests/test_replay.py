@@ -0,0 +1,78 @@
+import pytest
+
+from arena import DEFAULT_BOT_CONFIGS, GameArena, InputEvent
+from replay import Replay, ReplayPlayer, record_match
+from tournament import match_config
+
+
+def state(arena: GameArena) -> tuple:
+    return (arena.sim_ticks, arena.tick, arena.winner_label,
+            tuple((bot.name, bot.x, bot.y, bot.health) for bot in arena.bots),
+            tuple((projectile.x, projectile.y, projectile.life) for projectile in arena.projectiles))
+
+
+def play_session(seed: int) -> GameArena:
+    """A windowless session with the player pausing, adding bots and resetting"""
+    arena = GameArena(headless=True, seed=seed)
+    Replay.attach(arena)
+    inputs = {0: InputEvent.TOGGLE_PAUSE, 150: InputEvent.ADD_BOT, 300: InputEvent.TOGGLE_PAUSE,
+              301: InputEvent.TOGGLE_PAUSE, 420: InputEvent.ADD_BOT, 700: InputEvent.RESET,
+              701: InputEvent.TOGGLE_PAUSE}
+    for step in range(1200):
+        if step in inputs:
+            arena.apply_input(inputs[step])
+        arena.update()
+    arena.recorder.finish(arena)
+    return arena
+
+
+@pytest.mark.parametrize("seed", [1, 42])
+def test_replay_reproduces_the_session(seed):
+    arena = play_session(seed)
+    replay = Replay.from_bytes(arena.recorder.to_bytes())
+    assert state(ReplayPlayer(replay).play_to_end()) == state(arena)
+
+
+def test_seek_backwards_replays_from_the_start():
+    arena = play_session(7)
+    player = ReplayPlayer(arena.recorder)
+    middle = state(player.seek(500))
+    player.seek(1000)
+    assert state(player.seek(500)) == middle
+    assert state(player.play_to_end()) == state(arena)
+
+
+def test_recorded_match_matches_its_result():
+    result, replay = record_match(match_config(3), max_ticks=3000, seed=3)
+    assert ReplayPlayer(Replay.from_bytes(replay.to_bytes())).play_to_end().result() == result
+
+
+def test_same_seed_same_battle():
+    first = GameArena(headless=True, bot_configs=DEFAULT_BOT_CONFIGS, seed=9)
+    second = GameArena(headless=True, bot_configs=DEFAULT_BOT_CONFIGS, seed=9)
+    for arena in (first, second):
+        arena.game_active = True
+        for _ in range(800):
+            arena.update()
+    assert state(first) == state(second)
+
+
+@pytest.mark.parametrize("seed", [-1, 2**64])
+def test_seeds_that_cant_be_stored_are_refused_up_front(seed):
+    with pytest.raises(ValueError):
+        Replay.attach(GameArena(headless=True, seed=seed))
+    with pytest.raises(ValueError):
+        record_match(match_config(1), max_ticks=10, seed=seed)
+
+
+def test_truncated_replays_raise_value_error():
+    data = play_session(3).recorder.to_bytes()
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            Replay.from_bytes(data[:length])
+
+
+def test_long_names_are_cut_on_a_character_boundary():
+    config = [(100, 100, (255, 0, 0), "é" * 200, DEFAULT_BOT_CONFIGS[0][4]), DEFAULT_BOT_CONFIGS[1]]
+    replay = Replay.from_bytes(Replay(5, config).to_bytes())
+    assert replay.bot_configs[0][3] == "é" * 127
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+from scenario import Scenario, load_scenario
+
+
+@pytest.mark.parametrize("stats", [{"size": 300}, {"max_health": 70_000}, {"range": "far"},
+                                   {"speed": True}, {"fire_rate": float("nan")}, {"armor": 5}])
+def test_bad_stats_are_rejected(stats):
+    with pytest.raises(ValueError):
+        Scenario.from_dict({"teams": [{"stats": stats}]})
+
+
+def test_stat_overrides_reach_the_bots():
+    scenario = Scenario.from_dict({"teams": [{"count": 3, "stats": {"range": 200, "size": 30}}]})
+    arena = scenario.build(headless=True, seed=1)
+    assert all((bot.range, bot.size) == (200, 30) for bot in arena.bots)
+
+
+def test_numpy_is_loaded_only_for_scaled_scenarios():
+    code = ("import sys, scenario, spectator\n"
+            "scenario.load_scenario('scenarios/two_armies.toml').build(headless=True, seed=1)\n"
+            "print('numpy' in sys.modules)")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
+    assert load_scenario("scenarios/swarm.toml").build(headless=True, seed=1).world is not None
+
+
+def test_json_scenarios_need_no_tomllib():
+    # As on Python < 3.11, where the module doesn't exist
+    code = ("import sys; sys.modules['tomllib'] = None\n"
+            "import scenario, spectator\n"
+            "print(len(scenario.load_scenario('scenarios/melee.json').build(headless=True, seed=1).bots))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert int(output) > 0
@@ -0,0 +1,43 @@
+from scheduler import RetargetScheduler
+
+
+def test_every_key_is_due_once_per_interval():
+    scheduler = RetargetScheduler(interval=10)
+    for key in range(25):
+        scheduler.add(key)
+    assert scheduler.begin_tick(0) == list(range(25))  # all urgent on joining
+    seen = [key for tick in range(1, 11) for key in scheduler.begin_tick(tick)]
+    assert sorted(seen) == list(range(25))
+
+
+def test_budget_carries_work_over_urgent_first():
+    scheduler = RetargetScheduler(interval=4, budget=3)
+    for key in range(8):
+        scheduler.add(key)
+    assert scheduler.begin_tick(0) == [0, 1, 2]
+    assert scheduler.begin_tick(1) == [3, 4, 5]  # 1 is due too, but the budget is spent
+    assert list(scheduler.deferred) == [1]
+    scheduler.set_target(2, 0)
+    scheduler.remove(0)  # 2 loses its target
+    assert scheduler.begin_tick(2) == [6, 7, 2]
+    assert scheduler.begin_tick(3) == [1, 3, 7]  # carried over first, then the due bucket
+
+
+def test_bots_waiting_on_a_retarget_leave_dead_targets_alone():
+    from arena import GameArena
+
+    arena = GameArena(headless=True, seed=2, ai_budget=1)
+    arena.game_active = True
+    for _ in range(5):
+        arena.update()
+    victim = arena.bots[0]
+    chasers = [bot for bot in arena.bots[1:] if bot.health > 0]
+    for bot in chasers:
+        bot.target = victim
+        arena.scheduler.set_target(bot, victim)
+    victim.health = 0
+    arena.scheduler.remove(victim)
+    arena.update()  # one re-target this tick; the rest still point at the corpse
+    waiting = [bot for bot in chasers if bot.target is victim]
+    assert waiting
+    assert all(bot.decide() is None for bot in waiting)
@@ -0,0 +1,57 @@
+from arena import GameArena
+from snapshot import ArenaSnapshot, rollouts
+
+
+def play(arena: GameArena, ticks: int) -> GameArena:
+    arena.game_active = True
+    for _ in range(ticks):
+        if not arena.game_active:
+            break
+        arena.update()
+    return arena
+
+
+def state(arena: GameArena) -> tuple:
+    return (arena.tick, arena.winner_label,
+            tuple((bot.x, bot.y, bot.health) for bot in arena.bots),
+            tuple((projectile.x, projectile.y) for projectile in arena.projectiles))
+
+
+def test_restored_snapshot_continues_exactly():
+    arena = play(GameArena(headless=True, seed=7), 300)
+    snap = ArenaSnapshot.capture(arena)
+    expected = state(play(arena, 400))
+
+    snap.restore(arena)
+    assert state(play(arena, 400)) == expected
+
+    fresh = GameArena(headless=True, bot_configs=[])
+    ArenaSnapshot.from_bytes(snap.to_bytes()).restore(fresh)
+    assert state(play(fresh, 400)) == expected
+
+
+def test_unseeded_rollout_is_the_original_continuation():
+    arena = play(GameArena(headless=True, seed=3), 200)
+    snap = ArenaSnapshot.capture(arena)
+    play(arena, 500)
+    result, = rollouts(snap, [None], max_ticks=500)
+    assert result == arena.result()
+
+
+def test_seeded_rollouts_are_repeatable():
+    snap = ArenaSnapshot.capture(play(GameArena(headless=True, seed=3), 200))
+    assert list(rollouts(snap, range(5), max_ticks=300)) == list(rollouts(snap, range(5), max_ticks=300))
+
+
+def test_finished_battles_are_not_played_on():
+    arena = play(GameArena(headless=True, seed=3), 100)
+    for bot in arena.bots:
+        bot.health = 0
+    arena.game_active = False  # a draw
+    result, = rollouts(ArenaSnapshot.capture(arena), [1], max_ticks=50)
+    assert (result.ticks, result.winner, result.finished) == (100, None, True)
+
+    arena = play(GameArena(headless=True, seed=3), 5000)
+    assert arena.winner is not None
+    result, = rollouts(ArenaSnapshot.capture(arena), [1], max_ticks=50)
+    assert (result.ticks, result.winner) == (arena.tick, arena.winner.name)
@@ -0,0 +1,49 @@
+import pytest
+
+from arena import GameArena
+from scenario import load_scenario
+from spectator import _FRAME, SpectatorClient, StateEncoder, _mismatches
+
+
+def feed(client: SpectatorClient, frame: bytes):
+    _, kind = _FRAME.unpack_from(frame)
+    client.apply(kind, frame[_FRAME.size:])
+
+
+@pytest.mark.parametrize("speed", [1, 4, 16])
+def test_every_decoded_frame_matches_the_arena(speed):
+    # Enough shots that pooled projectiles are released and re-acquired between broadcasts
+    arena = load_scenario("scenarios/two_armies.toml").build(headless=True, seed=3)
+    encoder = StateEncoder(arena)
+    client = SpectatorClient()
+    encoder.advance()
+    feed(client, encoder.keyframe())
+    arena.game_active = True
+    for _ in range(1200 // speed):
+        for _ in range(speed):
+            arena.update()
+        delta = encoder.advance()
+        feed(client, encoder.keyframe() if delta is None else delta)
+        assert _mismatches(client, encoder) == [], f"tick {arena.sim_ticks}"
+
+
+def test_keyframe_clamps_stats_too_large_for_the_wire():
+    arena = GameArena(headless=True, seed=1)
+    bot = arena.bots[0]
+    bot.size = 300
+    bot.max_health = bot.health = 70_000
+    encoder = StateEncoder(arena)
+    encoder.advance()
+    client = SpectatorClient()
+    feed(client, encoder.keyframe())
+    assert (client.bots[0]["size"], client.bots[0]["health"], client.bots[0]["max_health"]) == (255, 0xFFFF, 0xFFFF)
+
+
+def test_long_names_are_cut_on_a_character_boundary():
+    arena = GameArena(headless=True, seed=1)
+    arena.bots[0].name = "é" * 200
+    encoder = StateEncoder(arena)
+    encoder.advance()
+    client = SpectatorClient()
+    feed(client, encoder.keyframe())
+    assert client.bots[0]["name"] == "é" * 127
@@ -0,0 +1,39 @@
+import pytest
+
+from scenario import Scenario
+from tuning import Evaluator, default_params, param
+
+
+def test_thresholds_only_tune_the_types_that_use_them():
+    assert param("defensive.retreat_distance").default == 100
+    assert param("sneaky.circle_radius").default == 80
+    with pytest.raises(ValueError):
+        param("aggressive.retreat_distance")
+    with pytest.raises(ValueError):
+        param("defensive.circle_radius")
+    assert all(p.name for p in default_params())
+
+
+def test_tuned_stats_load_as_scenario_stats():
+    stats = {p.stat: p.snap(p.high) for p in default_params() if p.bot_type.value == "defensive"}
+    scenario = Scenario.from_dict({"teams": [{"types": "defensive", "count": 2, "stats": stats}]})
+    bot = scenario.build(headless=True, seed=1).bots[0]
+    assert all(getattr(bot, stat) == value for stat, value in stats.items())
+
+
+def test_cache_key_ignores_overrides_equal_to_the_stock_stats():
+    evaluator = Evaluator(matches=2, workers=1)
+    try:
+        assert evaluator.key({}) == evaluator.key({"defensive": {"retreat_distance": 100}})
+        assert evaluator.key({}) != evaluator.key({"defensive": {"retreat_distance": 110}})
+    finally:
+        evaluator.close()
+
+
+def test_cache_keys_follow_the_simulation_version(monkeypatch):
+    import tuning
+
+    evaluator = Evaluator(matches=2, workers=1)
+    key = evaluator.key({})
+    monkeypatch.setattr(tuning, "SIM_VERSION", tuning.SIM_VERSION + 1)
+    assert evaluator.key({}) != key
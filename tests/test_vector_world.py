@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from arena import GameArena, random_bot_config
+from scenario import load_scenario
+from vector_world import ScaledArena, VectorWorld
+
+
+def assert_same(arena: GameArena, world: VectorWorld):
+    assert [bot.health for bot in arena.bots] == world.health.tolist()
+    assert [bot.damage_dealt for bot in arena.bots] == world.damage_dealt.tolist()
+    np.testing.assert_allclose(world.x, [bot.x for bot in arena.bots], atol=1e-6)
+    np.testing.assert_allclose(world.y, [bot.y for bot in arena.bots], atol=1e-6)
+    shots = sorted((round(p.x, 6), round(p.y, 6)) for p in arena.projectiles)
+    assert shots == sorted(zip(np.round(world.px, 6).tolist(), np.round(world.py, 6).tolist()))
+
+
+def play_both(configs, seed: int, ticks: int, swept: bool, ai_budget=None, **kwargs):
+    arena = GameArena(headless=True, bot_configs=configs, seed=seed, swept_collisions=swept,
+                      ai_budget=ai_budget, **kwargs)
+    bounds = (arena.width, arena.height)
+    world = VectorWorld(configs, rng=random.Random(seed), bounds=bounds, swept=swept, ai_budget=ai_budget)
+    arena.game_active = True
+    for _ in range(ticks):
+        arena.update()
+        world.step()
+        if not arena.game_active:
+            break
+    return arena, world
+
+
+@pytest.mark.parametrize("swept", [True, False])
+@pytest.mark.parametrize("lead", [True, False])
+def test_world_plays_the_same_battle(swept, lead):
+    rng = random.Random(11)
+    configs = [random_bot_config(rng) + (None, {"lead": lead}) for _ in range(40)]
+    arena, world = play_both(configs, seed=11, ticks=1500, swept=swept)
+    assert sum(bot.health <= 0 for bot in arena.bots) > 10  # enough fighting to mean something
+    assert_same(arena, world)
+    assert world.finished == (not arena.game_active)
+
+
+@pytest.mark.parametrize("swept", [True, False])
+@pytest.mark.parametrize("ai_budget", [None, 2])
+def test_teams_and_large_worlds_match(swept, ai_budget):
+    # A small budget leaves chasers of dead bots waiting on their re-target
+    scenario = load_scenario("scenarios/two_armies.toml")
+    configs = scenario.bot_configs(random.Random(5))
+    arena, world = play_both(configs, seed=5, ticks=600, swept=swept, ai_budget=ai_budget,
+                             width=scenario.width, height=scenario.height)
+    assert_same(arena, world)
+
+
+def test_scaled_arena_reports_like_game_arena():
+    rng = random.Random(4)
+    configs = [random_bot_config(rng) for _ in range(20)]
+    arenas = [arena_class(headless=True, bot_configs=configs, seed=4) for arena_class in (GameArena, ScaledArena)]
+    for ticks in (200, 5000):
+        for arena in arenas:
+            arena.game_active = True
+            while arena.game_active and arena.tick < ticks:
+                arena.update()
+        plain, scaled = (arena.result() for arena in arenas)
+        assert scaled == plain
+    assert sum(bot.damage_dealt for bot in plain.bots) > 0
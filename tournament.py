@@ -0,0 +1,143 @@
+"""Rank bot archetypes by playing many seeded headless matches in parallel.
+
+    python arena.py tournament --matches 10000 --workers 8
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+from dataclasses import asdict
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from arena import BotType, MatchResult, random_bot_config, run_match
+
+DEFAULT_BOTS_PER_MATCH = 5
+DEFAULT_MAX_TICKS = 5000
+
+def match_config(seed: int, bots_per_match: int = DEFAULT_BOTS_PER_MATCH) -> list:
+    """Random line-up for a match, fully determined by the seed"""
+    rng = random.Random(seed)
+    return [random_bot_config(rng) for _ in range(bots_per_match)]
+
+def play_match(job: Tuple[int, int, int]) -> Tuple[int, MatchResult]:
+    """Worker entry point: (seed, bots_per_match, max_ticks) -> (seed, result)"""
+    seed, bots_per_match, max_ticks = job
+    config = match_config(seed, bots_per_match)
+    return seed, run_match(config, max_ticks, seed=seed)
+
+class TournamentStats:
+    """Running aggregate of match results per bot type"""
+
+    def __init__(self):
+        self.matches = 0
+        self.total_ticks = 0
+        self.draws = 0
+        self.timeouts = 0
+        self.appearances: Dict[str, int] = {t.value: 0 for t in BotType}
+        self.wins: Dict[str, int] = {t.value: 0 for t in BotType}
+        self.damage: Dict[str, int] = {t.value: 0 for t in BotType}
+
+    def add(self, result: MatchResult):
+        self.matches += 1
+        self.total_ticks += result.ticks
+        if not result.finished:
+            self.timeouts += 1
+        elif result.winner_type is None:
+            self.draws += 1
+        else:
+            self.wins[result.winner_type] += 1
+        for bot in result.bots:
+            self.appearances[bot.bot_type] += 1
+            self.damage[bot.bot_type] += bot.damage_dealt
+
+    @property
+    def average_ticks(self) -> float:
+        return self.total_ticks / self.matches if self.matches else 0.0
+
+    def summary(self) -> dict:
+        types = {}
+        for bot_type, seen in self.appearances.items():
+            types[bot_type] = {
+                "appearances": seen,
+                "wins": self.wins[bot_type],
+                "win_rate": self.wins[bot_type] / seen if seen else 0.0,
+                "avg_damage_dealt": self.damage[bot_type] / seen if seen else 0.0,
+            }
+        return {
+            "matches": self.matches,
+            "draws": self.draws,
+            "timeouts": self.timeouts,
+            "avg_match_ticks": self.average_ticks,
+            "types": types,
+        }
+
+    def report(self) -> str:
+        lines = [
+            f"Matches: {self.matches}  draws: {self.draws}  timeouts: {self.timeouts}  "
+            f"avg length: {self.average_ticks:.0f} ticks",
+            f"{'type':<12}{'played':>8}{'wins':>8}{'win rate':>10}{'avg dmg':>10}",
+        ]
+        ranked = sorted(self.summary()["types"].items(), key=lambda kv: kv[1]["win_rate"], reverse=True)
+        for bot_type, row in ranked:
+            lines.append(f"{bot_type:<12}{row['appearances']:>8}{row['wins']:>8}"
+                         f"{row['win_rate']:>10.1%}{row['avg_damage_dealt']:>10.1f}")
+        return "\n".join(lines)
+
+def run_tournament(matches: int, workers: Optional[int] = None, seed: int = 0,
+                   bots_per_match: int = DEFAULT_BOTS_PER_MATCH,
+                   max_ticks: int = DEFAULT_MAX_TICKS) -> Iterator[Tuple[int, MatchResult]]:
+    """Yield (seed, result) pairs as workers finish them, in completion order"""
+    jobs = [(seed + i, bots_per_match, max_ticks) for i in range(matches)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        yield from map(play_match, jobs)
+        return
+
+    # Big enough chunks to amortize IPC, small enough to keep every worker busy
+    chunksize = max(1, matches // (workers * 16))
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(play_match, jobs, chunksize)
+
+def aggregate(results: Iterable[Tuple[int, MatchResult]], output=None,
+              progress_every: int = 0) -> TournamentStats:
+    stats = TournamentStats()
+    for seed, result in results:
+        stats.add(result)
+        if output is not None:
+            output.write(json.dumps({"seed": seed, **asdict(result)}) + "\n")
+        if progress_every and stats.matches % progress_every == 0:
+            print(f"  {stats.matches} matches played")
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="arena.py tournament", description="Run a parallel bot tournament")
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first match")
+    parser.add_argument("--bots", type=int, default=DEFAULT_BOTS_PER_MATCH, help="bots per match")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--output", help="write one JSON line per match to this file")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_tournament(args.matches, args.workers, args.seed, args.bots, args.max_ticks)
+    progress_every = 0 if args.json else max(1, args.matches // 10)
+    if args.output:
+        with open(args.output, "w") as output:
+            stats = aggregate(results, output, progress_every)
+    else:
+        stats = aggregate(results, progress_every=progress_every)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps({**stats.summary(), "seconds": elapsed}, indent=2))
+    else:
+        print(stats.report())
+        print(f"{stats.matches / elapsed:.1f} matches/sec")
+
+if __name__ == "__main__":
+    main()
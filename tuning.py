@@ -0,0 +1,430 @@
+"""Tune bot stats for balance with grid or evolutionary search over seeded headless matches.
+
+A candidate sets some profile stats per bot type: health, damage, speed and
+fire rate, plus the defensive retreat distance and the sneaky circling radius.
+Every candidate plays the same seeded tournament line-ups, with its stats
+applied to every bot of each type, spread over worker processes. Its score
+(lower is better) is the spread of win rates across types, as a fraction of
+their mean, plus the share of matches nobody won. A line-up where every type
+wins equally often and every match ends scores 0.
+
+Scores are cached under a hash of the candidate and the match settings, in
+memory and optionally in a JSON-lines file. A candidate that comes up again
+is never re-simulated, in this run or the next. Values snap to each stat's
+step, so the evolutionary search revisits candidates often.
+
+    python arena.py tune --search evolve --generations 12 --population 16 --matches 200
+    python arena.py tune --search grid --params defensive.retreat_distance sneaky.circle_radius --steps 5
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from arena import BOT_PROFILES, BotProfile, BotType, MatchResult, run_match
+from tournament import DEFAULT_BOTS_PER_MATCH, TournamentStats, match_config
+
+DEFAULT_MATCHES = 100
+DEFAULT_MAX_TICKS = 3000
+MAX_GRID = 5000  # most candidates a grid search may have
+# Bump when the same profiles and seeds would play out differently, so cached
+# scores aren't reused; new profile fields change the key by themselves
+SIM_VERSION = 2  # continues the replay format's number, which keys used to carry
+
+# (low, high, step) of every tunable stat
+STAT_RANGES: Dict[str, Tuple[float, float, float]] = {
+    "max_health": (40, 200, 10),
+    "damage": (5, 40, 1),
+    "speed": (1.0, 4.0, 0.1),
+    "fire_rate": (20, 120, 5),
+    "retreat_distance": (40, 200, 10),
+    "circle_radius": (40, 150, 10),
+}
+# Behavior thresholds only steer the types that read them; tuning them elsewhere changes nothing
+STAT_USERS: Dict[str, Tuple[BotType, ...]] = {
+    "retreat_distance": (BotType.DEFENSIVE,),
+    "circle_radius": (BotType.SNEAKY,),
+}
+_STAT_TYPES = {stat.name: stat.type for stat in fields(BotProfile)}
+
+# {bot type value: {stat: value}}, the shape bot configs take as their stats
+Overrides = Dict[str, Dict[str, float]]
+
+@dataclass(frozen=True)
+class Param:
+    """One stat of one bot type, searched over [low, high] in steps of ``step``"""
+    bot_type: BotType
+    stat: str
+    low: float
+    high: float
+    step: float
+
+    @property
+    def name(self) -> str:
+        return f"{self.bot_type.value}.{self.stat}"
+
+    @property
+    def default(self) -> float:
+        return self.snap(getattr(BOT_PROFILES[self.bot_type], self.stat))
+
+    def snap(self, value: float) -> float:
+        """Nearest step inside the range, typed like the profile field"""
+        steps = round((min(max(value, self.low), self.high) - self.low) / self.step)
+        value = round(self.low + steps * self.step, 6)
+        return int(value) if _STAT_TYPES[self.stat] is int else value
+
+    def grid(self, points: int) -> List[float]:
+        """``points`` values spread evenly over the range (duplicates dropped)"""
+        if points < 2:
+            return [self.default]
+        spread = (self.snap(self.low + (self.high - self.low) * i / (points - 1)) for i in range(points))
+        return list(dict.fromkeys(spread))
+
+def param(name: str) -> Param:
+    """Param from ``type.stat``, e.g. ``sneaky.circle_radius``"""
+    type_name, _, stat = name.partition(".")
+    if stat not in STAT_RANGES:
+        raise ValueError(f"can't tune {stat!r}; tunable stats: {', '.join(STAT_RANGES)}")
+    bot_type = BotType(type_name)
+    users = STAT_USERS.get(stat)
+    if users is not None and bot_type not in users:
+        raise ValueError(f"{stat} has no effect on {bot_type.value} bots; "
+                         f"only {', '.join(user.value for user in users)} bots use it")
+    return Param(bot_type, stat, *STAT_RANGES[stat])
+
+def default_params() -> List[Param]:
+    """Health, damage, speed and fire rate of every type, and the two behavior thresholds"""
+    params = [param(f"{bot_type.value}.{stat}") for bot_type in BotType
+              for stat in ("max_health", "damage", "speed", "fire_rate")]
+    return params + [param("defensive.retreat_distance"), param("sneaky.circle_radius")]
+
+def overrides(params: Sequence[Param], values: Sequence[float]) -> Overrides:
+    stats: Overrides = {}
+    for p, value in zip(params, values):
+        stats.setdefault(p.bot_type.value, {})[p.stat] = value
+    return stats
+
+def tuned_profiles(stats: Overrides) -> Dict[BotType, BotProfile]:
+    """BOT_PROFILES with a candidate's stats applied"""
+    return {bot_type: replace(profile, **stats.get(bot_type.value, {}))
+            for bot_type, profile in BOT_PROFILES.items()}
+
+def play_tuned_match(job: Tuple[int, int, int, int, Overrides]) -> Tuple[int, MatchResult]:
+    """Worker entry point: (candidate, seed, bots_per_match, max_ticks, stats) -> (candidate, result)"""
+    candidate, seed, bots_per_match, max_ticks, stats = job
+    config = [line + (None, stats.get(line[4].value)) for line in match_config(seed, bots_per_match)]
+    return candidate, run_match(config, max_ticks, seed=seed)
+
+@dataclass
+class Evaluation:
+    """A candidate's score over the evaluator's matches"""
+    key: str
+    stats: Overrides
+    score: float
+    win_rates: Dict[str, float]
+    undecided: float  # share of matches that ended in a draw or ran out of ticks
+    cached: bool = False
+
+def score(stats: TournamentStats) -> Tuple[float, Dict[str, float], float]:
+    """(score, win rate per type, undecided share); lower scores are more balanced"""
+    summary = stats.summary()
+    win_rates = {bot_type: row["win_rate"] for bot_type, row in summary["types"].items() if row["appearances"]}
+    undecided = (stats.draws + stats.timeouts) / stats.matches if stats.matches else 1.0
+    mean = statistics.fmean(win_rates.values()) if win_rates else 0.0
+    spread = statistics.pstdev(win_rates.values()) / mean if mean > 0 else float("inf")
+    return spread + undecided, win_rates, undecided
+
+class ResultCache:
+    """Evaluations by candidate hash, in memory and appended to ``path`` when given"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: Dict[str, dict] = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.entries[entry["key"]] = entry
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.entries.get(key)
+
+    def put(self, entry: dict):
+        self.entries[entry["key"]] = entry
+        if self.path:
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+class Evaluator:
+    """Scores candidates on the same seeded matches, in parallel, through a cache.
+
+    Match ``i`` uses seed ``seed + i`` and its tournament line-up for every
+    candidate, so candidates differ only in their stats. A batch of
+    candidates is played as one pool of matches so every worker stays busy.
+    """
+
+    def __init__(self, matches: int = DEFAULT_MATCHES, seed: int = 0,
+                 bots_per_match: int = DEFAULT_BOTS_PER_MATCH, max_ticks: int = DEFAULT_MAX_TICKS,
+                 workers: Optional[int] = None, cache: Optional[ResultCache] = None):
+        self.matches = matches
+        self.seed = seed
+        self.bots_per_match = bots_per_match
+        self.max_ticks = max_ticks
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache if cache is not None else ResultCache()
+        self.simulated = 0  # candidates played out
+        self.hits = 0  # candidates answered from the cache
+        self.matches_played = 0
+        self._pool = None
+
+    def key(self, stats: Overrides) -> str:
+        """Hash of the profiles a candidate plays with and everything else that decides its results.
+
+        Candidates that spell the same profiles differently (a stat set to
+        its stock value, or left out) share a key.
+        """
+        profiles = {bot_type.value: asdict(profile) for bot_type, profile in tuned_profiles(stats).items()}
+        settings = {"profiles": profiles, "matches": self.matches, "seed": self.seed,
+                    "bots": self.bots_per_match, "max_ticks": self.max_ticks, "sim": SIM_VERSION}
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+    def _play(self, jobs: List[tuple]) -> Iterator[Tuple[int, MatchResult]]:
+        if self.workers == 1:
+            return map(play_tuned_match, jobs)
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers)
+        # Big enough chunks to amortize IPC, small enough to keep every worker busy
+        chunksize = max(1, len(jobs) // (self.workers * 16))
+        return self._pool.imap_unordered(play_tuned_match, jobs, chunksize)
+
+    def evaluate(self, candidates: Sequence[Overrides]) -> List[Evaluation]:
+        """Evaluation per candidate, in order; repeats and cached candidates are not played"""
+        keys = [self.key(stats) for stats in candidates]
+        found = {key: self.cache.get(key) for key in dict.fromkeys(keys)}
+        missing = [key for key, entry in found.items() if entry is None]
+        stats_for = dict(zip(keys, candidates))
+
+        jobs = [(index, self.seed + i, self.bots_per_match, self.max_ticks, stats_for[key])
+                for index, key in enumerate(missing) for i in range(self.matches)]
+        tallies = [TournamentStats() for _ in missing]
+        for index, result in self._play(jobs):
+            tallies[index].add(result)
+        self.matches_played += len(jobs)
+        self.simulated += len(missing)
+
+        for key, tally in zip(missing, tallies):
+            value, win_rates, undecided = score(tally)
+            entry = found[key] = {"key": key, "stats": stats_for[key], "score": value,
+                                  "win_rates": win_rates, "undecided": undecided}
+            self.cache.put(entry)
+
+        evaluations = []
+        fresh = set(missing)
+        for key in keys:
+            entry = found[key]
+            cached = key not in fresh
+            self.hits += cached
+            evaluations.append(Evaluation(key, entry["stats"], entry["score"], entry["win_rates"],
+                                          entry["undecided"], cached))
+            fresh.discard(key)  # later repeats in the batch count as hits
+        return evaluations
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+@dataclass
+class Round:
+    """One generation (or grid batch) of a search, for the convergence report"""
+    index: int
+    candidates: int
+    simulated: int
+    best: float  # best score so far
+    round_best: float
+    round_mean: float
+    seconds: float
+
+class TuningRun:
+    """The best candidate found and how the search got there"""
+
+    def __init__(self, params: Sequence[Param], baseline: Evaluation):
+        self.params = list(params)
+        self.baseline = baseline
+        self.best = baseline
+        self.rounds: List[Round] = []
+
+    def add_round(self, evaluations: List[Evaluation], simulated: int, seconds: float):
+        round_best = min(evaluations, key=lambda evaluation: evaluation.score)
+        if round_best.score < self.best.score:
+            self.best = round_best
+        scores = [evaluation.score for evaluation in evaluations]
+        self.rounds.append(Round(len(self.rounds), len(evaluations), simulated, self.best.score,
+                                 round_best.score, statistics.fmean(scores), seconds))
+
+    def summary(self) -> dict:
+        return {
+            "params": [p.name for p in self.params],
+            "baseline": asdict(self.baseline),
+            "best": asdict(self.best),
+            "profiles": {bot_type.value: asdict(profile)
+                         for bot_type, profile in tuned_profiles(self.best.stats).items()},
+            "convergence": [asdict(row) for row in self.rounds],
+        }
+
+    def report(self) -> str:
+        lines = [f"{'round':>5} {'tried':>6} {'played':>7} {'best so far':>12} {'round best':>11} "
+                 f"{'round mean':>11} {'seconds':>8}"]
+        for row in self.rounds:
+            lines.append(f"{row.index:>5} {row.candidates:>6} {row.simulated:>7} {row.best:>12.3f} "
+                         f"{row.round_best:>11.3f} {row.round_mean:>11.3f} {row.seconds:>8.1f}")
+        lines.append("")
+        lines.append(f"{'type':<12}{'stock win rate':>15}{'tuned win rate':>15}")
+        for bot_type in BotType:
+            name = bot_type.value
+            lines.append(f"{name:<12}{self.baseline.win_rates.get(name, 0.0):>15.1%}"
+                         f"{self.best.win_rates.get(name, 0.0):>15.1%}")
+        lines.append(f"score: stock {self.baseline.score:.3f} -> tuned {self.best.score:.3f} "
+                     f"(undecided {self.baseline.undecided:.1%} -> {self.best.undecided:.1%})")
+        lines.append("")
+        lines.append("tuned stats:")
+        for p in self.params:
+            value = self.best.stats.get(p.bot_type.value, {}).get(p.stat, p.default)
+            lines.append(f"  {p.name:<28} {p.default:>7} -> {value}")
+        return "\n".join(lines)
+
+def _timed_round(run: TuningRun, evaluator: Evaluator, candidates: List[Overrides]) -> List[Evaluation]:
+    simulated, start = evaluator.simulated, time.perf_counter()
+    evaluations = evaluator.evaluate(candidates)
+    run.add_round(evaluations, evaluator.simulated - simulated, time.perf_counter() - start)
+    return evaluations
+
+def grid_search(params: Sequence[Param], evaluator: Evaluator, points: int = 3,
+                batch: int = 16, progress: bool = False) -> TuningRun:
+    """Every combination of ``points`` values per param, ``batch`` candidates per round"""
+    grids = [p.grid(points) for p in params]
+    size = 1
+    for values in grids:
+        size *= len(values)
+    if size > MAX_GRID:
+        raise ValueError(f"a grid of {size} candidates is too large (limit {MAX_GRID}); "
+                         "tune fewer params or use fewer steps")
+
+    run = TuningRun(params, evaluator.evaluate([overrides(params, [p.default for p in params])])[0])
+    combinations = itertools.product(*grids)
+    while True:
+        chunk = [overrides(params, values) for values in itertools.islice(combinations, batch)]
+        if not chunk:
+            return run
+        _timed_round(run, evaluator, chunk)
+        if progress:
+            print(f"  round {len(run.rounds) - 1}: best {run.best.score:.3f}")
+
+def evolve(params: Sequence[Param], evaluator: Evaluator, generations: int = 10, population: int = 12,
+           elite: int = 2, mutation: float = 0.25, seed: int = 0, progress: bool = False) -> TuningRun:
+    """(elite + offspring) evolution from the stock stats.
+
+    Parents are picked by two-way tournaments, mixed gene by gene, and each
+    gene mutates with probability ``mutation`` by a gaussian step of a sixth
+    of its range, snapped back onto the grid. The best ``elite`` candidates
+    carry over unchanged, and cost nothing to score again.
+    """
+    rng = random.Random(seed)
+    params = list(params)
+    stock = [p.default for p in params]
+
+    def mutate(values: List[float], rate: float) -> List[float]:
+        return [p.snap(value + rng.gauss(0, (p.high - p.low) / 6)) if rng.random() < rate else value
+                for p, value in zip(params, values)]
+
+    run = TuningRun(params, evaluator.evaluate([overrides(params, stock)])[0])
+    members = [stock] + [mutate(stock, max(mutation, 0.5)) for _ in range(population - 1)]
+    for generation in range(generations):
+        evaluations = _timed_round(run, evaluator, [overrides(params, values) for values in members])
+        if progress:
+            print(f"  generation {generation}: best {run.best.score:.3f}")
+
+        ranked = sorted(zip(evaluations, members), key=lambda pair: pair[0].score)
+        survivors = [values for _, values in ranked[:max(2, population // 2)]]
+
+        def pick() -> List[float]:
+            first, second = rng.sample(range(len(survivors)), 2)
+            return survivors[min(first, second)]  # survivors are ranked, so the lower index wins
+
+        offspring = [values for _, values in ranked[:elite]]
+        while len(offspring) < population:
+            mother, father = pick(), pick()
+            child = [rng.choice(genes) for genes in zip(mother, father)]
+            offspring.append(mutate(child, mutation))
+        members = offspring
+    return run
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="arena.py tune", description="Search bot stats for a balanced line-up")
+    parser.add_argument("--search", choices=("evolve", "grid"), default="evolve")
+    parser.add_argument("--params", nargs="+", metavar="TYPE.STAT",
+                        help=f"stats to tune (default: all); tunable: {', '.join(STAT_RANGES)}")
+    parser.add_argument("--steps", type=int, default=3, help="grid points per param")
+    parser.add_argument("--generations", type=int, default=10)
+    parser.add_argument("--population", type=int, default=12)
+    parser.add_argument("--elite", type=int, default=2)
+    parser.add_argument("--mutation", type=float, default=0.25, help="chance each stat mutates")
+    parser.add_argument("--search-seed", type=int, default=0, help="seed of the evolutionary search")
+    parser.add_argument("--matches", type=int, default=DEFAULT_MATCHES, help="matches per candidate")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first match")
+    parser.add_argument("--bots", type=int, default=DEFAULT_BOTS_PER_MATCH, help="bots per match")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--cache", metavar="PATH", help="JSON-lines file of scored candidates, reused across runs")
+    parser.add_argument("--output", metavar="PATH", help="write the tuned profiles and convergence as JSON")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        params = [param(name) for name in args.params] if args.params else default_params()
+    except ValueError as e:
+        parser.error(str(e))
+    if args.search == "evolve" and args.population < 2:
+        parser.error("the population needs at least two candidates")
+
+    cache = ResultCache(args.cache)
+    evaluator = Evaluator(args.matches, args.seed, args.bots, args.max_ticks, args.workers, cache)
+    progress = not args.json
+    try:
+        if args.search == "grid":
+            run = grid_search(params, evaluator, args.steps, progress=progress)
+        else:
+            run = evolve(params, evaluator, args.generations, args.population, args.elite,
+                         args.mutation, args.search_seed, progress=progress)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        evaluator.close()
+
+    summary = run.summary()
+    summary["evaluator"] = {"simulated": evaluator.simulated, "cache_hits": evaluator.hits,
+                            "matches_played": evaluator.matches_played, "cached_candidates": len(cache)}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(run.report())
+        print(f"{evaluator.simulated} candidates played ({evaluator.matches_played} matches), "
+              f"{evaluator.hits} answered from the cache")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,611 @@
+"""NumPy structure-of-arrays backend for the arena simulation.
+
+``VectorWorld`` keeps every bot and projectile attribute in contiguous arrays
+and runs movement, bounds clamping, distances and hit tests as batched array
+operations. It follows the same rules as ``GameArena.update`` and consumes the
+random stream in the same order, so a world built from the same seed plays out
+the same match.
+
+Re-targeting follows the same RetargetScheduler, keyed by row index. Every
+bot decides from the start-of-tick snapshot and all intents are applied
+together, so a whole tick is a handful of array operations with no per-bot
+Python loop.
+
+Neighbour searches (nearest enemy, projectile hits) go through a cell index
+rebuilt with one sort per query: bots sorted by cell key plus a per-cell start
+table. That keeps 10k bots and 50k projectiles well away from an all-pairs
+distance matrix. Hits are swept: every (shot, nearby bot) pair is solved for
+the point where the shot's step enters the bot's circle, all in one batch.
+
+``ScaledArena`` is the GameArena that scenarios with ``scale = true`` run on.
+It plays the battle on a VectorWorld and draws straight from its arrays.
+"""
+import math
+import random
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from arena import (ARENA_HEIGHT, ARENA_WIDTH, PROJECTILE_LIFE, PROJECTILE_REACH, PROJECTILE_SIZE,
+                   PROJECTILE_SPEED, Bot, BotType, GameArena, MatchResult)
+from battle_log import LogLevel
+from scheduler import RetargetScheduler
+from spatial import CELL_SIZE
+
+# Integer codes for the type column
+KIND_CODES = {
+    BotType.AGGRESSIVE: 0,
+    BotType.DEFENSIVE: 1,
+    BotType.SNEAKY: 2,
+    BotType.BERSERKER: 3,
+}
+
+# Rows per brute-force re-target batch, bounds the N x B distance matrix
+RETARGET_CHUNK = 2048
+# Rings searched around a bot before falling back to brute force
+MAX_SEARCH_RING = 6
+# Below this many (due bot, alive bot) pairs a plain distance matrix is cheaper
+BRUTE_FORCE_PAIRS = 1 << 18
+
+def _atan2(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Element-wise math.atan2.
+
+    np.arctan2 can differ from libm by an ulp, and the pursuit dynamics
+    amplify that into a different match within a few hundred ticks.
+    """
+    return np.fromiter(map(math.atan2, y.tolist(), x.tolist()), dtype=np.float64, count=len(y))
+
+def _entry(x0: np.ndarray, y0: np.ndarray, dx: np.ndarray, dy: np.ndarray,
+           cx: np.ndarray, cy: np.ndarray, radius: np.ndarray) -> np.ndarray:
+    """Fraction of each step (x0, y0) + t * (dx, dy) at which it enters the circle; inf for a miss.
+
+    Same arithmetic, in the same order, as the swept test in Projectile.update.
+    """
+    fx = x0 - cx
+    fy = y0 - cy
+    c = fx * fx + fy * fy - radius * radius
+    b = fx * dx + fy * dy
+    step = dx * dx + dy * dy
+    disc = b * b - step * c
+    crossing = (b < 0) & (radius > 0) & (disc > 0)
+    entry = np.full(len(c), np.inf)
+    entry[crossing] = (-b[crossing] - np.sqrt(disc[crossing])) / step[crossing]
+    entry[entry >= 1] = np.inf
+    entry[c < 0] = 0.0
+    return entry
+
+def _ring_offsets(ring: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Cell offsets at Chebyshev distance ``ring``"""
+    if ring == 0:
+        return np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    span = np.arange(-ring, ring + 1)
+    side = np.arange(-ring + 1, ring)
+    ox = np.concatenate((span, span, np.full(len(side), -ring), np.full(len(side), ring)))
+    oy = np.concatenate((np.full(len(span), -ring), np.full(len(span), ring), side, side))
+    return ox, oy
+
+class _CellIndex:
+    """Bots bucketed into square cells: sorted by cell key, with each cell's slice start.
+
+    With ``reach`` (at most ``cell_size`` per bot), a bot is listed in every
+    cell its reach overlaps, so a point only needs to look in its own cell.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, members: np.ndarray,
+                 cell_size: float, width: float, height: float,
+                 reach: Optional[np.ndarray] = None):
+        self.cell_size = cell_size
+        self.cols = max(1, int(math.ceil(width / cell_size)))
+        self.rows = max(1, int(math.ceil(height / cell_size)))
+        mx, my = x[members], y[members]
+        if reach is None:
+            cx, cy = self.cells(mx, my)
+            keys = cx * self.rows + cy
+        else:
+            x0, y0 = self.cells(mx - reach, my - reach)
+            x1, y1 = self.cells(mx + reach, my + reach)
+            stamped, stamped_keys = [], []
+            for dx in range(3):
+                for dy in range(3):
+                    covers = (x0 + dx <= x1) & (y0 + dy <= y1)
+                    stamped.append(members[covers])
+                    stamped_keys.append((x0[covers] + dx) * self.rows + y0[covers] + dy)
+            members = np.concatenate(stamped)
+            keys = np.concatenate(stamped_keys)
+        order = np.argsort(keys, kind="stable")
+        self.members = members[order]
+        self.counts = np.bincount(keys, minlength=self.cols * self.rows)
+        self.starts = np.cumsum(self.counts) - self.counts
+
+    def cells(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Cell coordinates, clamped to the grid like SpatialGrid"""
+        cx = np.clip(np.floor(x / self.cell_size).astype(np.int64), 0, self.cols - 1)
+        cy = np.clip(np.floor(y / self.cell_size).astype(np.int64), 0, self.rows - 1)
+        return cx, cy
+
+    def pairs(self, cx: np.ndarray, cy: np.ndarray, ox: np.ndarray, oy: np.ndarray):
+        """(query row, bot) pairs for every bot in the cells at (cx + ox, cy + oy)"""
+        qx = (cx[:, None] + ox).ravel()
+        qy = (cy[:, None] + oy).ravel()
+        rows = np.repeat(np.arange(len(cx)), len(ox))
+        inside = (qx >= 0) & (qx < self.cols) & (qy >= 0) & (qy < self.rows)
+        query = qx[inside] * self.rows + qy[inside]
+        counts = self.counts[query]
+        occupied = counts > 0
+        rows, query, counts = rows[inside][occupied], query[occupied], counts[occupied]
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        lo = self.starts[query]
+        ends = np.cumsum(counts)
+        slots = np.arange(total) - np.repeat(ends - counts, counts) + np.repeat(lo, counts)
+        return np.repeat(rows, counts), self.members[slots]
+
+class VectorWorld:
+    """Arena state as parallel arrays with a vectorized tick"""
+
+    def __init__(self, bot_configs: Sequence[tuple], rng=random, ai_budget: Optional[int] = None,
+                 bounds: Tuple[int, int] = (ARENA_WIDTH, ARENA_HEIGHT), swept: bool = True):
+        # Build through Bot so stats and the initial heading draw match GameArena
+        bots = [Bot(x, y, color, name, bot_type, rng, None, *extra, bounds=bounds)
+                for x, y, color, name, bot_type, *extra in bot_configs]
+        self._load_bots(bots, ai_budget, bounds, swept)
+        self.rng = rng
+
+    @classmethod
+    def from_bots(cls, bots: List[Bot], projectiles: Sequence = (), rng=random,
+                  ai_budget: Optional[int] = None, swept: bool = True) -> 'VectorWorld':
+        """Copy the current state of a GameArena's bots and projectiles.
+
+        The re-target schedule starts fresh: every alive bot re-targets on the
+        first step.
+        """
+        world = cls.__new__(cls)
+        world._load_bots(bots, ai_budget, bots[0].bounds if bots else (ARENA_WIDTH, ARENA_HEIGHT), swept)
+        world.rng = rng
+        index = {id(bot): i for i, bot in enumerate(bots)}
+        for projectile in projectiles:
+            world._append_projectiles(
+                np.array([projectile.x]), np.array([projectile.y]),
+                np.array([projectile.vx]), np.array([projectile.vy]),
+                np.array([projectile.damage]), np.array([index[id(projectile.owner)]]),
+                np.array([projectile.life]))
+        return world
+
+    def _load_bots(self, bots: List[Bot], ai_budget: Optional[int], bounds: Tuple[int, int], swept: bool):
+        self.names = [bot.name for bot in bots]
+        self.count = len(bots)
+        self.width, self.height = bounds
+        index = {id(bot): i for i, bot in enumerate(bots)}
+
+        def column(attr, dtype):
+            return np.array([getattr(bot, attr) for bot in bots], dtype=dtype)
+
+        self.x = column('x', np.float64)
+        self.y = column('y', np.float64)
+        self.vx = column('vx', np.float64)
+        self.vy = column('vy', np.float64)
+        self.direction = column('direction', np.float64)
+        self.speed = column('speed', np.float64)
+        self.health = column('health', np.int64)
+        self.max_health = column('max_health', np.int64)
+        self.damage = column('damage', np.int64)
+        self.fire_rate = column('fire_rate', np.int64)
+        self.range = column('range', np.float64)
+        self.size = column('size', np.float64)
+        self.retreat_distance = column('retreat_distance', np.float64)
+        self.circle_radius = column('circle_radius', np.float64)
+        self.last_shot = column('last_shot', np.int64)
+        self.damage_dealt = column('damage_dealt', np.int64)  # per shooter, capped at what the target had left
+        self.kind = np.array([KIND_CODES[bot.bot_type] for bot in bots], dtype=np.int8)
+        self.lead = np.array([bot.profile.lead for bot in bots], dtype=bool)
+        self.target = np.array([index[id(bot.target)] if bot.target is not None else -1
+                                for bot in bots], dtype=np.int64)
+        # Team codes index team_names; -1 fights everyone
+        self.team_names = list(dict.fromkeys(bot.team for bot in bots if bot.team is not None))
+        codes = {team: code for code, team in enumerate(self.team_names)}
+        self.team = np.array([codes.get(bot.team, -1) for bot in bots], dtype=np.int64)
+
+        # Cells must be at least as large as the furthest a bot can be hit from
+        # the point a shot is looked up by, for the 3x3 stamping of the hit search
+        self.swept = swept
+        self.reach = PROJECTILE_REACH if swept else 0
+        self.cell_size = max(CELL_SIZE, float(self.size.max(initial=0)) + self.reach)
+
+        self.px = np.empty(0)
+        self.py = np.empty(0)
+        self.pvx = np.empty(0)
+        self.pvy = np.empty(0)
+        self.pdamage = np.empty(0, dtype=np.int64)
+        self.powner = np.empty(0, dtype=np.int64)
+        self.plife = np.empty(0, dtype=np.int64)
+
+        self.scheduler = RetargetScheduler(budget=ai_budget)
+        for i, bot in enumerate(bots):
+            if bot.health > 0:
+                self.scheduler.add(i)
+
+        self.tick = 0
+        self.finished = False
+        self.winner: Optional[int] = None
+
+    @property
+    def projectile_count(self) -> int:
+        return len(self.px)
+
+    def _append_projectiles(self, x, y, vx, vy, damage, owner, life):
+        self.px = np.concatenate((self.px, x))
+        self.py = np.concatenate((self.py, y))
+        self.pvx = np.concatenate((self.pvx, vx))
+        self.pvy = np.concatenate((self.pvy, vy))
+        self.pdamage = np.concatenate((self.pdamage, damage))
+        self.powner = np.concatenate((self.powner, owner))
+        self.plife = np.concatenate((self.plife, life))
+
+    def step(self):
+        """Advance one tick, mirroring GameArena.update"""
+        if self.finished:
+            return
+        self.tick += 1
+
+        scheduler = self.scheduler
+        self._retarget(scheduler.begin_tick(self.tick))
+
+        alive = self.health > 0
+        idx = np.flatnonzero(alive)
+        self.last_shot[idx] += 1
+
+        # Decide and fire from the start-of-tick snapshot, then move everyone
+        fire_idx, fire_angle = self._behave(idx)
+        fire_x, fire_y = self.x[fire_idx], self.y[fire_idx]
+        self.vx[idx] = np.cos(self.direction[idx]) * self.speed[idx]
+        self.vy[idx] = np.sin(self.direction[idx]) * self.speed[idx]
+        size = self.size[idx]
+        self.x[idx] = np.maximum(size, np.minimum(self.width - size, self.x[idx] + self.vx[idx]))
+        self.y[idx] = np.maximum(size, np.minimum(self.height - size, self.y[idx] + self.vy[idx]))
+
+        survivors = self._update_projectiles()
+
+        # Chasers of bots that just died re-target on the next tick
+        for i in np.flatnonzero(alive & (self.health <= 0)).tolist():
+            scheduler.remove(i)
+
+        self._keep_projectiles(survivors)
+        if len(fire_idx):
+            self._append_projectiles(
+                fire_x, fire_y,
+                np.cos(fire_angle) * PROJECTILE_SPEED, np.sin(fire_angle) * PROJECTILE_SPEED,
+                self.damage[fire_idx], fire_idx,
+                np.full(len(fire_idx), PROJECTILE_LIFE, dtype=np.int64))
+
+        alive_idx = np.flatnonzero(self.health > 0)
+        teams = self.team[alive_idx]
+        if len(alive_idx) <= 1 or (teams[0] >= 0 and (teams == teams[0]).all()):
+            self.finished = True
+            self.winner = int(alive_idx[0]) if len(alive_idx) else None
+
+    def _enemies(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Mask of (a, b) pairs that may fight: different bots, not teammates"""
+        team = self.team[a]
+        return (a != b) & ((team < 0) | (self.team[b] != team))
+
+    def _retarget(self, due: List[int]):
+        """Point each bot in ``due`` at its nearest alive enemy (lowest index on ties)"""
+        if not due:
+            return
+        due_idx = np.array(due, dtype=np.int64)
+        alive = self.health > 0
+        best = np.full(len(due_idx), -1, dtype=np.int64)
+        best_dist = np.full(len(due_idx), np.inf)
+
+        # One search per team, over just that team's enemies
+        codes = self.team[due_idx]
+        for code in np.unique(codes).tolist():
+            rows = np.flatnonzero(codes == code)
+            enemies = np.flatnonzero(alive & (self.team != code)) if code >= 0 else np.flatnonzero(alive)
+            if not len(enemies):
+                continue
+            if len(rows) * len(enemies) <= BRUTE_FORCE_PAIRS:
+                self._nearest_brute(due_idx, rows, enemies, best, best_dist)
+            else:
+                self._nearest_rings(due_idx, rows, enemies, best, best_dist)
+
+        self.target[due_idx] = best
+        scheduler = self.scheduler
+        for i, t in zip(due, best.tolist()):
+            scheduler.set_target(i, t if t >= 0 else None)
+
+    def _nearest_brute(self, due_idx, rows, enemies, best, best_dist):
+        """Fill best/best_dist for ``rows`` of ``due_idx`` by comparing against every enemy"""
+        for lo in range(0, len(rows), RETARGET_CHUNK):
+            chunk = rows[lo:lo + RETARGET_CHUNK]
+            me = due_idx[chunk]
+            dist = np.sqrt((self.x[me, None] - self.x[enemies])**2 +
+                           (self.y[me, None] - self.y[enemies])**2)
+            dist[me[:, None] == enemies] = np.inf
+            closest = np.argmin(dist, axis=1)
+            closest_dist = dist[np.arange(len(chunk)), closest]
+            best[chunk] = np.where(closest_dist != np.inf, enemies[closest], -1)
+            best_dist[chunk] = closest_dist
+
+    def _nearest_rings(self, due_idx, rows, enemies, best, best_dist):
+        """Search outward ring by ring over a cell index of ``enemies``.
+
+        Uses the stop rule of SpatialGrid.nearest, so the answer is exact.
+        Cells are sized for about one enemy each; rows still unresolved after
+        MAX_SEARCH_RING rings (the nearest enemy is far away) fall back to
+        brute force.
+        """
+        cell_size = max(self.cell_size, math.sqrt(self.width * self.height / len(enemies)))
+        index = _CellIndex(self.x, self.y, enemies, cell_size, self.width, self.height)
+        me_all = due_idx[rows]
+        cx, cy = index.cells(self.x[me_all], self.y[me_all])
+        pending = np.arange(len(rows))
+
+        for ring in range(max(index.cols, index.rows) + 1):
+            # Anything in this ring or beyond is at least (ring - 1) cells away
+            done = (best[rows] >= 0) & (best_dist[rows] < (ring - 1) * cell_size)
+            pending = pending[~done[pending]]
+            if not len(pending):
+                return
+            if ring > MAX_SEARCH_RING:
+                self._nearest_brute(due_idx, rows[pending], enemies, best, best_dist)
+                return
+
+            local, bots = index.pairs(cx[pending], cy[pending], *_ring_offsets(ring))
+            local = pending[local]
+            me = me_all[local]
+            keep = me != bots
+            local, bots, me = local[keep], bots[keep], me[keep]
+            if not len(local):
+                continue
+            dist = np.sqrt((self.x[me] - self.x[bots])**2 + (self.y[me] - self.y[bots])**2)
+            # Closest candidate per row, then merge with the best so far
+            order = np.lexsort((bots, dist, local))
+            local, bots, dist = local[order], bots[order], dist[order]
+            first = np.ones(len(local), dtype=bool)
+            first[1:] = local[1:] != local[:-1]
+            target_rows, bots, dist = rows[local[first]], bots[first], dist[first]
+            better = ((dist < best_dist[target_rows]) |
+                      ((dist == best_dist[target_rows]) & (bots < best[target_rows])))
+            best[target_rows[better]] = bots[better]
+            best_dist[target_rows[better]] = dist[better]
+
+    def _behave(self, idx: np.ndarray):
+        """Run the type behaviors for ``idx``; returns (shooter indices, aim angles)"""
+        targets = self.target[idx]
+        # Dead targets are ignored until the re-target comes round, as in Bot.decide
+        has_target = (targets >= 0) & (self.health[targets] > 0)
+        sel = idx[has_target]
+        t = targets[has_target]
+
+        x, y = self.x[sel], self.y[sel]
+        tx, ty = self.x[t], self.y[t]
+        angle = _atan2(ty - y, tx - x)
+        dist = np.sqrt((x - tx)**2 + (y - ty)**2)
+        kind = self.kind[sel]
+        reach = self.range[sel]
+        direction = self.direction[sel]
+
+        # Aggressive and berserker: chase and shoot in range
+        chase = (kind == 0) | (kind == 3)
+        direction[chase] = angle[chase]
+        want = chase & (dist < reach)
+
+        # Defensive: retreat when close, shoot and jitter at mid range
+        defensive = kind == 1
+        retreat = defensive & (dist < self.retreat_distance[sel])
+        direction[retreat] = angle[retreat] + math.pi
+        jitter = defensive & ~retreat & (dist < reach)
+        want |= jitter
+        count = int(np.count_nonzero(jitter))
+        if count:
+            rng = self.rng
+            direction[jitter] += np.array([rng.uniform(-0.2, 0.2) for _ in range(count)])
+
+        # Sneaky: circle at mid range, otherwise creep in slowly
+        sneaky = kind == 2
+        circle = sneaky & (reach > dist) & (dist > self.circle_radius[sel])
+        direction[circle] = angle[circle] + math.pi / 2
+        want |= circle
+        approach = sneaky & ~circle
+        direction[approach] = angle[approach]
+        self.speed[sel[approach]] = 1.0
+
+        self.direction[sel] = direction
+
+        fire = want & (self.last_shot[sel] >= self.fire_rate[sel])
+        shooters = sel[fire]
+        self.last_shot[shooters] = 0
+        return shooters, self._aim(shooters, t[fire], angle[fire])
+
+    def _aim(self, shooters: np.ndarray, targets: np.ndarray, angle: np.ndarray) -> np.ndarray:
+        """Firing angles, led like Bot._aim where the shooter leads and the target is slower than a shot"""
+        vx, vy = self.vx[targets], self.vy[targets]
+        a = vx * vx + vy * vy - PROJECTILE_SPEED * PROJECTILE_SPEED
+        lead = self.lead[shooters] & (a < 0)
+        if not lead.any():
+            return angle
+        shooters, targets, vx, vy, a = shooters[lead], targets[lead], vx[lead], vy[lead], a[lead]
+        dx = self.x[targets] + vx - self.x[shooters]
+        dy = self.y[targets] + vy - self.y[shooters]
+        b = dx * vx + dy * vy
+        ticks = (-b - np.sqrt(b * b - a * (dx * dx + dy * dy))) / a
+        angle[lead] = _atan2(dy + vy * ticks, dx + vx * ticks)
+        return angle
+
+    def _update_projectiles(self) -> np.ndarray:
+        """Move projectiles and apply hits; returns the survivor mask"""
+        n = self.projectile_count
+        if not n:
+            return np.zeros(0, dtype=bool)
+
+        x0, y0 = self.px, self.py
+        self.px = x0 + self.pvx
+        self.py = y0 + self.pvy
+        self.plife -= 1
+
+        hit = np.zeros(n, dtype=bool)
+        alive_idx = np.flatnonzero(self.health > 0)
+        if n * len(alive_idx) <= BRUTE_FORCE_PAIRS:
+            # Few enough to test every pair
+            rows = np.repeat(np.arange(n), len(alive_idx))  # row-major: by projectile, then bot
+            bots = np.tile(alive_idx, n)
+        else:
+            # Every bot a projectile can touch is listed in the cell of the
+            # middle of its step (of its end point, unswept)
+            index = _CellIndex(self.x, self.y, alive_idx, self.cell_size, self.width, self.height,
+                               reach=self.size[alive_idx] + self.reach)
+            if self.swept:
+                cells = index.cells(x0 + self.pvx * 0.5, y0 + self.pvy * 0.5)
+            else:
+                cells = index.cells(self.px, self.py)
+            rows, bots = index.pairs(*cells, *_ring_offsets(0))
+        enemies = self._enemies(self.powner[rows], bots)
+        rows, bots = rows[enemies], bots[enemies]
+
+        if self.swept:
+            entry = _entry(x0[rows], y0[rows], self.pvx[rows], self.pvy[rows],
+                           self.x[bots], self.y[bots], self.size[bots])
+            close = entry != np.inf
+            rows, bots, entry = rows[close], bots[close], entry[close]
+            # Earliest entry first, lowest bot on ties
+            order = np.lexsort((bots, entry, rows))
+        else:
+            close = (np.sqrt((self.px[rows] - self.x[bots])**2 + (self.py[rows] - self.y[bots])**2)
+                     < self.size[bots])
+            rows, bots = rows[close], bots[close]
+            order = np.lexsort((bots, rows))
+        rows, bots = rows[order], bots[order]
+
+        if len(rows):
+            # Resolve in projectile order, first bot hit first: an earlier hit may already have killed the bot
+            health = self.health
+            pdamage = self.pdamage
+            resolved = -1
+            dealt = []
+            for row, bot in zip(rows.tolist(), bots.tolist()):
+                if row == resolved or health[bot] <= 0:
+                    continue
+                dealt.append(min(pdamage[row], health[bot]))
+                health[bot] -= dealt[-1]
+                hit[row] = True
+                resolved = row
+            np.add.at(self.damage_dealt, self.powner[hit], dealt)
+
+        in_bounds = ((self.px >= 0) & (self.px <= self.width) &
+                     (self.py >= 0) & (self.py <= self.height) & (self.plife > 0))
+        return ~hit & in_bounds
+
+    def _keep_projectiles(self, keep: np.ndarray):
+        if len(keep) and not keep.all():
+            self.px = self.px[keep]
+            self.py = self.py[keep]
+            self.pvx = self.pvx[keep]
+            self.pvy = self.pvy[keep]
+            self.pdamage = self.pdamage[keep]
+            self.powner = self.powner[keep]
+            self.plife = self.plife[keep]
+
+    def run(self, max_ticks: int) -> Optional[str]:
+        """Step until the match ends or ``max_ticks``; returns the winner's name"""
+        while not self.finished and self.tick < max_ticks:
+            self.step()
+        return self.names[self.winner] if self.winner is not None else None
+
+class ScaledArena(GameArena):
+    """GameArena that runs its battle on VectorWorld, for thousands of bots.
+
+    Bot objects are built only to seed the arrays. Positions, health and
+    projectiles live in ``self.world`` and are drawn straight from it; the bot
+    objects get health, damage dealt and position back whenever ``result()``
+    is read and when the battle ends. Bots cannot join mid-battle.
+    """
+
+    def _initialize_bots(self):
+        super()._initialize_bots()
+        self.world = VectorWorld.from_bots(self.bots, rng=self.rng, ai_budget=self.ai_budget,
+                                           swept=self.swept_collisions)
+        self._colors = [bot.color for bot in self.bots]
+
+    def _add_random_bot(self):
+        self._add_message("Bots can't join a scaled battle")
+
+    @property
+    def battle_over(self) -> bool:
+        return self.world.finished
+
+    def update(self):
+        if not self.game_active or self.winner:
+            return
+        self.tick += 1
+        self.sim_ticks += 1
+
+        world = self.world
+        profiler = self.profiler
+        if profiler is not None:
+            start = time.perf_counter()
+        world.step()
+        if profiler is not None:
+            profiler.add("vector", time.perf_counter() - start)
+
+        if world.finished:
+            self.game_active = False
+            self._sync_bots()
+            if world.winner is not None:
+                self.winner = self.bots[world.winner]
+                self._add_message(f"🏆 {self.winner_label} wins the battle!", LogLevel.RESULT)
+            else:
+                self._add_message("💥 Battle ended in a draw!", LogLevel.RESULT)
+
+        if profiler is not None:
+            profiler.end_tick(int(np.count_nonzero(world.health > 0)), world.projectile_count)
+
+    def _sync_bots(self):
+        """Copy health, damage dealt and position back from the world onto the bot objects"""
+        world = self.world
+        for bot, health, dealt, x, y in zip(self.bots, world.health.tolist(), world.damage_dealt.tolist(),
+                                            world.x.tolist(), world.y.tolist()):
+            bot.health = health
+            bot.damage_dealt = dealt
+            bot.x, bot.y = x, y
+
+    def result(self) -> MatchResult:
+        self._sync_bots()
+        return super().result()
+
+    def _draw_world(self, window, alpha: float):
+        """Queue alive bots and projectiles inside the view, culled as arrays"""
+        world = self.world
+        batch = window.sprite_batch
+        camera = window.camera
+        ox, oy = camera.offset if camera is not None else (0, 0)
+        right, bottom = ox + ARENA_WIDTH, oy + ARENA_HEIGHT
+
+        x, y, size = world.x, world.y, world.size
+        visible = ((world.health > 0) & (x + size >= ox) & (x - size <= right) &
+                   (y + size >= oy) & (y - size <= bottom))
+        colors = self._colors
+        for i in np.flatnonzero(visible).tolist():
+            body = window.bot_sprite(colors[i], int(size[i]), world.direction[i])
+            batch.add_centered(body, x[i] - ox, y[i] - oy)
+
+        px, py = world.px, world.py
+        visible = (px >= ox) & (px <= right) & (py >= oy) & (py <= bottom)
+        sprite = window.projectile_sprite(PROJECTILE_SIZE)
+        for i in np.flatnonzero(visible).tolist():
+            batch.add(sprite, px[i] - ox - PROJECTILE_SIZE, py[i] - oy - PROJECTILE_SIZE)
+
+    def _team_summary(self) -> List[tuple]:
+        world = self.world
+        alive = world.health > 0
+        rows = []
+        for code, team in enumerate(world.team_names + [None]):
+            members = world.team == (code if team is not None else -1)
+            total = int(np.count_nonzero(members))
+            if total:
+                label = f"Team {team}" if team is not None else "Free-for-all"
+                color = self._colors[int(np.argmax(members))]
+                rows.append((label, color, int(np.count_nonzero(members & alive)), total))
+        return rows
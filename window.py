@@ -0,0 +1,477 @@
+"""The game window: pygame display, fonts, input and drawing for a GameArena.
+
+Only windowed arenas import this module, so headless matches, tournament
+workers and CLI commands never load pygame. Only the display and font
+modules are initialized; audio, joysticks and the rest stay off.
+
+    python arena.py [--seed 42] [--record battle.replay]
+"""
+import argparse
+import math
+import time
+from typing import List, Optional, Tuple
+
+import pygame
+
+from arena import (ARENA_HEIGHT, ARENA_WIDTH, BLACK, DARK_BLUE, GRAY, GREEN, ORANGE, RED, WHITE,
+                   WINDOW_HEIGHT, WINDOW_WIDTH, YELLOW, Bot, GameArena, InputEvent, Projectile)
+from battle_log import EventLog, LogLevel
+from profiler import TickProfiler
+from render import HEADINGS, Camera, RenderCache, SpriteBatch, heading_step
+
+CAMERA_PAN_STEP = 12    # pixels per frame while an arrow key is held
+MAX_DIRTY_RECTS = 200   # beyond this many sprites, repaint the whole arena view
+
+# Sprites are keyed on everything that changes how they look and cached in
+# the RenderCache; magenta is the transparent color key
+SPRITE_KEY = (255, 0, 255)
+
+def build_bot_sprite(color: tuple, size: int, heading: int) -> pygame.Surface:
+    """Bot body with its direction indicator, centered in the surface"""
+    reach = size // 2 + 5
+    center = reach + 2
+    surface = pygame.Surface((center * 2 + 1, center * 2 + 1)).convert()
+    surface.fill(SPRITE_KEY)
+    surface.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+    pygame.draw.rect(surface, color, (center - size // 2, center - size // 2, size, size))
+    angle = heading * 2 * math.pi / HEADINGS
+    end = (center + math.cos(angle) * reach, center + math.sin(angle) * reach)
+    pygame.draw.line(surface, WHITE, (center, center), end, 3)
+    return surface
+
+def build_health_bar(width: int, filled: int) -> pygame.Surface:
+    surface = pygame.Surface((width, 4)).convert()
+    surface.fill(RED)
+    surface.fill(GREEN, (0, 0, filled, 4))
+    return surface
+
+def build_projectile_sprite(radius: int) -> pygame.Surface:
+    surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1)).convert()
+    surface.fill(SPRITE_KEY)
+    surface.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+    pygame.draw.circle(surface, YELLOW, (radius, radius), radius)
+    return surface
+
+class ArenaWindow:
+    """Window onto one GameArena: draws its frames and turns keys into inputs.
+
+    The arena decides what is in the world (``GameArena._draw_world``); the
+    window owns everything pygame: the screen, clock, fonts, sprite caches,
+    camera and the dirty-rect bookkeeping between frames.
+    """
+
+    def __init__(self, arena: GameArena):
+        self.arena = arena
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.display.set_caption("AI Bot Arena - Python Version")
+        self.clock = pygame.time.Clock()
+        self.font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 24)
+        self.overlay_font = pygame.font.Font(None, 18)
+        self.render_cache = RenderCache(label_font=self.small_font)
+        self.sprite_batch = SpriteBatch(self.render_cache)
+        # Worlds bigger than the view scroll under a camera
+        width, height = arena.width, arena.height
+        self.camera = (Camera(width, height, ARENA_WIDTH, ARENA_HEIGHT)
+                       if width > ARENA_WIDTH or height > ARENA_HEIGHT else None)
+        # Sprites are clipped to the world view (labels may hang below a
+        # fixed arena) so they never touch the side panel
+        self.world_rect = (self.camera.view_rect if self.camera is not None
+                           else pygame.Rect(0, 0, ARENA_WIDTH, WINDOW_HEIGHT))
+        self.panel_rect = pygame.Rect(ARENA_WIDTH, 0, WINDOW_WIDTH - ARENA_WIDTH, WINDOW_HEIGHT)
+        self.show_profiler = False
+        self._overlay_lines: List[str] = []
+
+        # Dirty-rect state: what was drawn last frame, and what the panel showed
+        self._full_redraw = True
+        self._drawn: List[pygame.Rect] = []
+        self._panel_state: Optional[tuple] = None
+        self._floor_offset: Optional[Tuple[float, float]] = None
+
+    def close(self):
+        pygame.quit()
+
+    def bot_sprite(self, color: tuple, size: int, direction: float) -> pygame.Surface:
+        """Body sprite of a bot facing ``direction``, from cache when possible"""
+        heading = heading_step(direction)
+        return self.render_cache.surface(("bot", color, size, heading), build_bot_sprite, color, size, heading)
+
+    def projectile_sprite(self, radius: int) -> pygame.Surface:
+        return self.render_cache.surface(("projectile", radius), build_projectile_sprite, radius)
+
+    def queue_bot(self, bot: Bot, alpha: float = 1.0, offset: Tuple[float, float] = (0, 0)):
+        """Queue the bot's sprites, ``alpha`` of the way from its last position"""
+        if bot.health <= 0:
+            return
+
+        x = bot.prev_x + (bot.x - bot.prev_x) * alpha - offset[0]
+        y = bot.prev_y + (bot.y - bot.prev_y) * alpha - offset[1]
+        batch = self.sprite_batch
+        cache = self.render_cache
+        profile = bot.profile
+        size = profile.size
+
+        # Body and direction indicator
+        batch.add_centered(self.bot_sprite(bot.color, size, bot.direction), x, y)
+
+        # Health bar, one sprite per filled width
+        bar_width = size * 1.5
+        filled = min(int(bar_width * bot.health / profile.max_health), int(bar_width))
+        bar = cache.surface(("bar", int(bar_width), filled), build_health_bar, int(bar_width), filled)
+        batch.add(bar, x - bar_width // 2, y - size - 10)
+
+        # Name
+        batch.add_centered(cache.text(cache.label_font, bot.name, WHITE), x, y + size + 15)
+
+    def queue_projectile(self, projectile: Projectile, alpha: float = 1.0,
+                         offset: Tuple[float, float] = (0, 0)):
+        """Queue the projectile's sprite"""
+        x = projectile.prev_x + (projectile.x - projectile.prev_x) * alpha - offset[0]
+        y = projectile.prev_y + (projectile.y - projectile.prev_y) * alpha - offset[1]
+        size = projectile.size
+        self.sprite_batch.add(self.projectile_sprite(size), int(x) - size, int(y) - size)
+
+    def draw(self, alpha: float = 1.0):
+        """Render a frame, interpolated ``alpha`` into the current tick.
+
+        Only what changed goes to the display: last frame's sprites are
+        erased from the background, this frame's are blitted in one batch,
+        and the side panel is repainted only when its contents change.
+        """
+        cache = self.render_cache
+        screen = self.screen
+        world_rect = self.world_rect
+        profiler = self.arena.profiler
+        if profiler is not None:
+            clock = time.perf_counter
+            mark = clock()
+
+        # Arena floor, grid and border are baked once (per camera position)
+        background = cache.surface("background", self._bake_background)
+        world_background = background
+        world_moved = False
+        if self.camera is not None:
+            world_background = cache.surface("view", self._bake_view)
+            if self.camera.offset != self._floor_offset:
+                self._draw_scrolled_floor(world_background)
+                world_moved = True
+
+        erased = self._drawn
+        if self._full_redraw:
+            screen.blit(background, (0, 0))
+            screen.blit(world_background, world_rect, world_rect)
+        elif world_moved or len(erased) > MAX_DIRTY_RECTS:
+            screen.blit(world_background, world_rect, world_rect)
+            erased = [world_rect]
+        else:
+            screen.blits([(world_background, rect, rect) for rect in erased], doreturn=False)
+
+        screen.set_clip(world_rect)
+        self.arena._draw_world(self, alpha)
+        drawn = self.sprite_batch.draw(screen)
+        banner = self._draw_banner()
+        if banner is not None:
+            drawn.append(banner)
+        screen.set_clip(None)
+        self._drawn = drawn
+
+        if profiler is not None:
+            now = clock()
+            profiler.add("draw_world", now - mark)
+            mark = now
+
+        panel_changed = self._draw_ui()
+        cache.end_frame()
+
+        if profiler is not None:
+            now = clock()
+            profiler.add("draw_ui", now - mark)
+            mark = now
+
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            dirty = erased + drawn if len(drawn) <= MAX_DIRTY_RECTS else [world_rect]
+            if panel_changed:
+                dirty.append(self.panel_rect)
+            pygame.display.update(dirty)
+
+        if profiler is not None:
+            profiler.add("flip", clock() - mark)
+            profiler.end_frame()
+
+    def _bake_view(self) -> pygame.Surface:
+        return pygame.Surface(self.camera.view_rect.size).convert()
+
+    def _draw_scrolled_floor(self, surface: pygame.Surface):
+        """Floor, grid and border of a world larger than the view, at the camera's position"""
+        camera = self.camera
+        ox, oy = self._floor_offset = camera.offset
+        floor = self.render_cache.surface("floor", self._bake_floor_tile)
+        world_rect = pygame.Rect(-ox, -oy, self.arena.width, self.arena.height)
+        surface.fill(BLACK)
+        surface.set_clip(world_rect)
+        surface.blit(floor, (-(ox % 50), -(oy % 50)))
+        surface.set_clip(None)
+        pygame.draw.rect(surface, WHITE, world_rect, 3)
+
+    def _bake_floor_tile(self) -> pygame.Surface:
+        """View-sized floor with grid lines, one cell larger so it can scroll"""
+        width, height = ARENA_WIDTH + 50, ARENA_HEIGHT + 50
+        surface = pygame.Surface((width, height)).convert()
+        surface.fill(DARK_BLUE)
+        for i in range(0, width, 50):
+            pygame.draw.line(surface, GRAY, (i, 0), (i, height), 1)
+        for i in range(0, height, 50):
+            pygame.draw.line(surface, GRAY, (0, i), (width, i), 1)
+        return surface
+
+    def _draw_profiler_overlay(self):
+        """Perf numbers at the bottom of the side panel"""
+        lines = self._overlay_lines
+        line_height = 16
+        ui_x = ARENA_WIDTH + 5
+        top = WINDOW_HEIGHT - len(lines) * line_height - 10
+        pygame.draw.rect(self.screen, BLACK, (ARENA_WIDTH + 3, top - 5, WINDOW_WIDTH - ARENA_WIDTH - 3, WINDOW_HEIGHT - top + 5))
+        pygame.draw.rect(self.screen, GRAY, (ARENA_WIDTH + 3, top - 5, WINDOW_WIDTH - ARENA_WIDTH - 3, WINDOW_HEIGHT - top + 5), 1)
+        for i, line in enumerate(lines):
+            text = self.render_cache.text(self.overlay_font, line, ORANGE)
+            self.screen.blit(text, (ui_x, top + i * line_height))
+
+    def _bake_background(self) -> pygame.Surface:
+        """Window background: black panel, arena floor, grid and border"""
+        surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        surface.fill(BLACK)
+
+        if self.camera is not None:
+            return surface  # the floor scrolls, see _draw_scrolled_floor
+
+        # Draw arena background
+        width, height = self.arena.width, self.arena.height
+        arena_rect = pygame.Rect(0, 0, width, height)
+        pygame.draw.rect(surface, DARK_BLUE, arena_rect)
+
+        # Draw grid
+        for i in range(0, width, 50):
+            pygame.draw.line(surface, GRAY, (i, 0), (i, height), 1)
+        for i in range(0, height, 50):
+            pygame.draw.line(surface, GRAY, (0, i), (width, i), 1)
+
+        # Draw arena border
+        pygame.draw.rect(surface, WHITE, arena_rect, 3)
+        return surface
+
+    def _ui_state(self, teams: List[tuple]) -> tuple:
+        """Everything the side panel shows; the panel repaints when this changes"""
+        arena = self.arena
+        overlay = tuple(self._overlay_lines) if self.show_profiler and arena.profiler is not None else None
+        bots = None if teams else [(bot.name, bot.bot_type, bot.color, bot.health, bot.max_health)
+                                   for bot in arena.bots]
+        messages = [message for message, _ in list(arena.messages)[-5:]]
+        return (arena.speed_label, teams, bots, messages, overlay)
+
+    def _draw_ui(self) -> bool:
+        """Repaint the side panel if its contents changed; returns whether it did"""
+        arena = self.arena
+        # Refresh the perf numbers twice a second so the panel is not repainted every frame
+        if self.show_profiler and arena.profiler is not None and (
+                self.render_cache.frame % 30 == 0 or not self._overlay_lines):
+            self._overlay_lines = arena.profiler.overlay_lines()
+
+        teams = arena._team_summary()
+        state = self._ui_state(teams)
+        if state == self._panel_state and not self._full_redraw:
+            return False
+        self._panel_state = state
+
+        panel = self.panel_rect
+        background = self.render_cache.surface("background", self._bake_background)
+        self.screen.blit(background, panel, panel)
+        self.screen.set_clip(panel)
+
+        ui_x = ARENA_WIDTH + 20
+        text_for = self.render_cache.text
+
+        # Title
+        title = text_for(self.font, "🤖 AI Bot Arena", WHITE)
+        self.screen.blit(title, (ui_x, 20))
+
+        # Controls
+        y_offset = 70
+        controls = [
+            "SPACE - Start/Pause",
+            "R - Reset Arena",
+            "A - Add Random Bot",
+            "1-4 - Speed 1x/4x/16x/max",
+            "P - Perf Overlay",
+            f"Speed: {arena.speed_label}",
+            "ESC - Quit"
+        ]
+        if self.camera is not None:
+            controls.insert(-1, "Arrows - Scroll View")
+
+        for control in controls:
+            text = text_for(self.small_font, control, WHITE)
+            self.screen.blit(text, (ui_x, y_offset))
+            y_offset += 25
+
+        # Bot stats
+        y_offset += 20
+        stats_title = text_for(self.font, "Bot Stats:", WHITE)
+        self.screen.blit(stats_title, (ui_x, y_offset))
+        y_offset += 40
+
+        if teams:
+            for label, color, alive, total in teams:
+                text = text_for(self.small_font, f"{label}: {alive}/{total} alive", color)
+                self.screen.blit(text, (ui_x, y_offset))
+                y_offset += 25
+        else:
+            for bot in arena.bots:
+                # Bot name and type
+                bot_text = f"{bot.name} ({bot.bot_type.value})"
+                text = text_for(self.small_font, bot_text, bot.color)
+                self.screen.blit(text, (ui_x, y_offset))
+                y_offset += 20
+
+                # Health bar
+                health_text = f"Health: {bot.health}/{bot.max_health}"
+                text = text_for(self.small_font, health_text, WHITE)
+                self.screen.blit(text, (ui_x, y_offset))
+
+                # Visual health bar
+                bar_width = 100
+                bar_height = 10
+                health_percent = bot.health / bot.max_health
+
+                bar_rect = pygame.Rect(ui_x + 120, y_offset + 5, bar_width, bar_height)
+                pygame.draw.rect(self.screen, RED, bar_rect)
+
+                health_rect = pygame.Rect(ui_x + 120, y_offset + 5,
+                                          bar_width * health_percent, bar_height)
+                pygame.draw.rect(self.screen, GREEN, health_rect)
+
+                y_offset += 35
+
+        # Messages
+        if arena.messages:
+            y_offset += 20
+            msg_title = text_for(self.font, "Battle Log:", WHITE)
+            self.screen.blit(msg_title, (ui_x, y_offset))
+            y_offset += 30
+
+            # Show last 5 messages
+            for message, _ in list(arena.messages)[-5:]:
+                text = text_for(self.small_font, message[:30], WHITE)
+                self.screen.blit(text, (ui_x, y_offset))
+                y_offset += 20
+
+        if self.show_profiler and arena.profiler is not None:
+            self._draw_profiler_overlay()
+        self.screen.set_clip(None)
+        return True
+
+    def _draw_banner(self) -> Optional[pygame.Rect]:
+        """Winner or draw announcement over the arena; returns the area drawn"""
+        arena = self.arena
+        text_for = self.render_cache.text
+        if arena.winner:
+            winner_text = f"🏆 {arena.winner_label} WINS! 🏆"
+            text = text_for(self.font, winner_text, YELLOW)
+            text_rect = text.get_rect(center=(ARENA_WIDTH//2, ARENA_HEIGHT//2))
+
+            # Background
+            bg_rect = text_rect.inflate(40, 20)
+            pygame.draw.rect(self.screen, BLACK, bg_rect)
+            pygame.draw.rect(self.screen, YELLOW, bg_rect, 3)
+
+            self.screen.blit(text, text_rect)
+            return bg_rect
+        elif not arena.game_active and not any(bot.health > 0 for bot in arena.bots):
+            draw_text = "💥 DRAW! 💥"
+            text = text_for(self.font, draw_text, RED)
+            text_rect = text.get_rect(center=(ARENA_WIDTH//2, ARENA_HEIGHT//2))
+
+            # Background
+            bg_rect = text_rect.inflate(40, 20)
+            pygame.draw.rect(self.screen, BLACK, bg_rect)
+            pygame.draw.rect(self.screen, RED, bg_rect, 3)
+
+            self.screen.blit(text, text_rect)
+            return bg_rect
+        return None
+
+    def handle_events(self):
+        """Handle user input"""
+        arena = self.arena
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                arena.running = False
+
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._full_redraw = True
+
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    arena.apply_input(InputEvent.TOGGLE_PAUSE)
+
+                elif event.key == pygame.K_r:
+                    arena.apply_input(InputEvent.RESET)
+
+                elif event.key == pygame.K_a:
+                    arena.apply_input(InputEvent.ADD_BOT)
+
+                elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
+                    arena.speed_index = event.key - pygame.K_1
+
+                elif event.key == pygame.K_p:
+                    self.show_profiler = not self.show_profiler
+                    if arena.profiler is None:
+                        arena.profiler = TickProfiler()
+
+                elif event.key == pygame.K_ESCAPE:
+                    arena.running = False
+
+        # Arrow keys scroll large worlds while held
+        if self.camera is not None:
+            keys = pygame.key.get_pressed()
+            self.camera.pan((keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * CAMERA_PAN_STEP,
+                            (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * CAMERA_PAN_STEP)
+
+    def tick(self, fps: int):
+        """Wait out the rest of the frame at ``fps`` (0 = don't wait)"""
+        self.clock.tick(fps)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="arena.py", description="AI Bot Arena")
+    parser.add_argument("--seed", type=int, default=None, help="arena RNG seed")
+    parser.add_argument("--record", metavar="PATH", help="save a replay of the session on exit")
+    parser.add_argument("--log", metavar="PATH", help="append the battle log to this file as JSON lines")
+    parser.add_argument("--log-level", choices=[level.name.lower() for level in LogLevel], default="hit",
+                        help="lowest level logged in full; below it one event in ten is kept")
+    args = parser.parse_args(argv)
+    if args.record and args.seed is not None:
+        from replay import SEED_LIMIT
+        if not 0 <= args.seed < SEED_LIMIT:
+            parser.error("--seed must be from 0 to 2**64 - 1 to record a replay")
+
+    try:
+        event_log = EventLog(path=args.log, echo=True, level=LogLevel[args.log_level.upper()], sample_every=10)
+        game = GameArena(seed=args.seed, event_log=event_log)
+        recording = None
+        if args.record:
+            import replay
+            recording = replay.Replay.attach(game)
+        game.run()
+        if recording is not None:
+            recording.finish(game)
+            recording.save(args.record)
+            print(f"Replay saved to {args.record}")
+    except Exception as e:
+        print(f"Error running the game: {e}")
+
+if __name__ == "__main__":
+    main()